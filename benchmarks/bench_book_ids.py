@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark book primary key formats
+
+Inserts the same synthetic books into scratch tables keyed four ways, char(36)
+or binary(16) crossed with random (v4) or time ordered (v7) uuids, and reports
+insert throughput plus the clustered and secondary index sizes InnoDB ends up
+with. Needs a MySQL server, the MYSQL_* variables or --url pick it:
+
+    python benchmarks/bench_book_ids.py --rows 200000 --url mysql://root:pw@localhost/books
+"""
+
+import argparse
+import os
+import sys
+import time
+from uuid import uuid4
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import uuid7
+from repository import connect_db, connect_url
+
+
+CREATE_QUERY = '''create table {table} (
+    id {id_type},
+    title varchar(255),
+    author varchar(255),
+    description varchar(4095),
+    checked_out bool,
+    isbn_number bigint,
+    primary key (id),
+    unique (isbn_number)
+)'''
+INSERT_QUERY = 'insert into {table} (id,title,author,description,isbn_number,checked_out) values (%s,%s,%s,%s,%s,%s)'
+SIZE_QUERY = (
+    'select data_length, index_length from information_schema.tables '
+    'where table_schema=database() and table_name=%s'
+)
+
+LAYOUTS = [
+    ('char36_v4', 'char(36)', lambda: str(uuid4())),
+    ('char36_v7', 'char(36)', lambda: str(uuid7())),
+    ('binary16_v4', 'binary(16)', lambda: uuid4().bytes),
+    ('binary16_v7', 'binary(16)', lambda: uuid7().bytes),
+]
+BATCH = 1000
+
+
+def bench(db, name: str, id_type: str, make_id, rows: int) -> dict:
+    table = f'bench_books_{name}'
+    cursor = db.cursor()
+    cursor.execute(f'drop table if exists {table}')
+    cursor.execute(CREATE_QUERY.format(table=table, id_type=id_type))
+    query = INSERT_QUERY.format(table=table)
+
+    start = time.perf_counter()
+    for offset in range(0, rows, BATCH):
+        batch = [
+            (make_id(), f'Title {i}', f'Author {i % 997}', 'x' * 200, 9_780_000_000_000 + i, False)
+            for i in range(offset, min(offset + BATCH, rows))
+        ]
+        cursor.executemany(query, batch)
+        db.commit()
+    elapsed = time.perf_counter() - start
+
+    # the size columns are estimates until the statistics are refreshed
+    cursor.execute(f'analyze table {table}')
+    cursor.fetchall()
+    cursor.execute(SIZE_QUERY, (table,))
+    data_length, index_length = cursor.fetchone()
+    cursor.execute(f'drop table {table}')
+    db.commit()
+    return {
+        'rows_per_sec': rows / elapsed,
+        'data_mb': data_length / 2**20,
+        'index_mb': index_length / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--url', help='mysql url, defaults to the MYSQL_* variables')
+    args = parser.parse_args()
+
+    db = connect_url(args.url) if args.url else connect_db()
+    if db is None:
+        raise SystemExit('MySQL is not reachable, see the module docstring')
+
+    print(f"{'layout':<14} {'rows/s':>10} {'clustered MB':>13} {'secondary MB':>13}")
+    for name, id_type, make_id in LAYOUTS:
+        result = bench(db, name, id_type, make_id, args.rows)
+        print(f"{name:<14} {result['rows_per_sec']:>10.0f} {result['data_mb']:>13.1f} {result['index_mb']:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark
+
+Starts the server in a fresh interpreter several times and records the time
+from process spawn until the server is ready, plus the per-phase startup
+report. Exits non-zero when the median exceeds --max-ms so CI can track it:
+
+    python benchmarks/bench_cold_start.py --runs 5 --max-ms 1500 --output bench_output.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter, binds an ephemeral port and exits once ready
+CHILD = '''
+import sys
+from lifecycle import StartupTimer
+import main
+
+timer = StartupTimer()
+server, _, workers, shutdown = main.start_server(timer, 0)
+timer.write_report(sys.argv[1])
+print("ready", flush=True)
+shutdown.run()
+'''
+
+
+def run_once() -> tuple[float, dict]:
+    """Returns the wall clock time until ready in ms and the startup report"""
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = os.path.join(tmp, 'startup_report.json')
+        start = time.perf_counter()
+        child = subprocess.Popen(
+            [sys.executable, '-c', CHILD, report_path],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        for line in child.stdout:
+            if line.strip() == 'ready':
+                break
+        ready_ms = (time.perf_counter() - start) * 1000
+        child.wait()
+        if child.returncode != 0:
+            raise SystemExit(f'server failed to start (exit code {child.returncode})')
+        with open(report_path) as f:
+            return ready_ms, json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-ms', type=float, default=None, help='fail when the median exceeds this')
+    parser.add_argument('--output', default=None, help='write the results as json to this file')
+    args = parser.parse_args()
+
+    samples = []
+    phases: dict[str, list[float]] = {}
+    for _ in range(args.runs):
+        ready_ms, report = run_once()
+        samples.append(ready_ms)
+        for phase in report['phases']:
+            phases.setdefault(phase['phase'], []).append(phase['duration_ms'])
+
+    result = {
+        'runs': args.runs,
+        'median_ms': statistics.median(samples),
+        'max_ms': max(samples),
+        'phases_median_ms': {name: statistics.median(values) for name, values in phases.items()},
+    }
+    print(f"cold start median {result['median_ms']:.1f}ms, max {result['max_ms']:.1f}ms over {args.runs} runs")
+    for name, value in result['phases_median_ms'].items():
+        print(f'  {name:<12} {value:>8.1f}ms')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    if args.max_ms is not None and result['median_ms'] > args.max_ms:
+        print(f"median cold start {result['median_ms']:.1f}ms exceeds budget of {args.max_ms:.1f}ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for list response mapping
+
+Compares rows per second of the per-object path (row -> model -> proto ->
+append) against the batch path that fills the repeated field straight from
+db rows / mongo documents. No database is needed, rows are synthetic.
+"""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Book, Patron
+from mapper import bookModelToProto, bookRowsToProto, patronModelToProto, patronDocumentsToProto
+from protogen import ListBooksResponse, ListPatronsResponse
+
+
+ROWS = 1000
+REPEAT = 50
+
+
+def book_rows() -> list[tuple]:
+    return [
+        (f'00000000-0000-4000-8000-{i:012d}', f'Title {i}', f'Author {i % 97}', 'x' * 200, 9780000000000 + i, i % 3 == 0)
+        for i in range(ROWS)
+    ]
+
+
+def patron_documents() -> list[dict]:
+    now = datetime.now()
+    return [
+        {
+            '_id': ObjectId(),
+            'first_name': f'First{i}',
+            'last_name': f'Last{i}',
+            'email': f'patron{i}@bench.local',
+            'phone': '555-0100',
+            'address': f'{i} Library Lane',
+            'membership_type': ('student', 'faculty', 'community', 'premium')[i % 4],
+            'membership_start_date': now,
+            'membership_end_date': now + timedelta(days=365),
+            'books_checked_out': [f'book-{i}', f'book-{i + 1}'],
+            'total_books_borrowed': i % 50,
+            'active': True,
+            'created_at': now,
+            'updated_at': now,
+        }
+        for i in range(ROWS)
+    ]
+
+
+def per_object_books(rows: list[tuple]) -> ListBooksResponse:
+    response = ListBooksResponse()
+    for book in [Book(*row) for row in rows]:
+        response.books.append(bookModelToProto(book))
+    return response
+
+
+def batch_books(rows: list[tuple]) -> ListBooksResponse:
+    response = ListBooksResponse()
+    bookRowsToProto(rows, response.books)
+    return response
+
+
+def per_object_patrons(documents: list[dict]) -> ListPatronsResponse:
+    response = ListPatronsResponse()
+    for patron in [Patron.from_dict(doc) for doc in documents]:
+        response.patrons.append(patronModelToProto(patron))
+    return response
+
+
+def batch_patrons(documents: list[dict]) -> ListPatronsResponse:
+    response = ListPatronsResponse()
+    patronDocumentsToProto(documents, response.patrons)
+    return response
+
+
+def rows_per_second(func, data) -> float:
+    func(data)  # warm up
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(data)
+    return ROWS * REPEAT / (time.perf_counter() - start)
+
+
+def main():
+    rows = book_rows()
+    documents = patron_documents()
+    assert per_object_books(rows) == batch_books(rows)
+    assert per_object_patrons(documents) == batch_patrons(documents)
+
+    for name, per_object, batch, data in (
+        ('books', per_object_books, batch_books, rows),
+        ('patrons', per_object_patrons, batch_patrons, documents),
+    ):
+        slow = rows_per_second(per_object, data)
+        fast = rows_per_second(batch, data)
+        print(f'{name:<8} per-object {slow:>12,.0f} rows/s   batch {fast:>12,.0f} rows/s   ({fast / slow:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Before/after measurement of patron date encoding on large ListPatrons pages
+
+before: ISO 8601 strings only (the pre-Timestamp wire format)
+compat: Timestamps plus the deprecated strings, what old clients get during migration
+after:  Timestamps only
+
+For each encoding reports server mapping + serialize time, wire size,
+client parse time and the cost of turning the four dates back into datetimes.
+"""
+
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_mapper import patron_documents
+from mapper import patronDocumentsToProto, timestampToDatetime
+from mapper.patron import DATE_FIELDS, MEMBERSHIP_TYPE_TO_PROTO
+from protogen import ListPatronsResponse
+
+
+REPEAT = 20
+
+
+def encode_before(documents: list[dict]) -> bytes:
+    # the string-only mapping the server did before the Timestamp fields existed
+    response = ListPatronsResponse()
+    add = response.patrons.add
+    for doc in documents:
+        end = doc.get('membership_end_date')
+        add(
+            id=str(doc['_id']),
+            first_name=doc['first_name'],
+            last_name=doc['last_name'],
+            email=doc['email'],
+            phone=doc.get('phone'),
+            address=doc.get('address'),
+            membership_type=MEMBERSHIP_TYPE_TO_PROTO[doc['membership_type']],
+            membership_start_date=doc['membership_start_date'].isoformat(),
+            membership_end_date=end.isoformat() if end else '',
+            books_checked_out=doc.get('books_checked_out', ()),
+            total_books_borrowed=doc.get('total_books_borrowed', 0),
+            active=doc.get('active', True),
+            created_at=doc['created_at'].isoformat(),
+            updated_at=doc['updated_at'].isoformat()
+        )
+    return response.SerializeToString()
+
+
+def encode_compat(documents: list[dict]) -> bytes:
+    response = ListPatronsResponse()
+    patronDocumentsToProto(documents, response.patrons, legacy_dates=True)
+    return response.SerializeToString()
+
+
+def encode_after(documents: list[dict]) -> bytes:
+    response = ListPatronsResponse()
+    patronDocumentsToProto(documents, response.patrons, legacy_dates=False)
+    return response.SerializeToString()
+
+
+def parse(payload: bytes) -> ListPatronsResponse:
+    return ListPatronsResponse.FromString(payload)
+
+
+def dates_from_strings(response: ListPatronsResponse) -> list[datetime]:
+    return [
+        datetime.fromisoformat(value)
+        for patron in response.patrons
+        for _, legacy_field in DATE_FIELDS
+        if (value := getattr(patron, legacy_field))
+    ]
+
+
+def dates_from_timestamps(response: ListPatronsResponse) -> list[datetime]:
+    return [
+        timestampToDatetime(patron, timestamp_field, legacy_field)
+        for patron in response.patrons
+        for timestamp_field, legacy_field in DATE_FIELDS
+        if patron.HasField(timestamp_field)
+    ]
+
+
+def timed(func, arg) -> tuple[float, object]:
+    result = func(arg)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(arg)
+    return (time.perf_counter() - start) / REPEAT * 1000, result
+
+
+def main():
+    documents = patron_documents()
+    print(f'{len(documents)} patrons per page, mean of {REPEAT} runs')
+    print(f"{'encoding':<8} {'encode ms':>10} {'bytes':>9} {'parse ms':>9} {'dates ms':>9}")
+    for name, encode, dates in (
+        ('before', encode_before, dates_from_strings),
+        ('compat', encode_compat, dates_from_timestamps),
+        ('after', encode_after, dates_from_timestamps),
+    ):
+        encode_ms, payload = timed(encode, documents)
+        parse_ms, response = timed(parse, payload)
+        dates_ms, _ = timed(dates, response)
+        print(f'{name:<8} {encode_ms:>10.2f} {len(payload):>9,} {parse_ms:>9.2f} {dates_ms:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
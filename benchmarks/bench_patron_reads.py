@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark patron read routing, pool sizing and wire compression
+
+Runs the secondary-routed patron queries (list, search, membership type)
+against a local replica set under a matrix of client settings.
+
+A single-node replica set is enough as a stand-in:
+
+    docker run -d -p 27017:27017 mongo:7.0 --replSet rs0
+    docker exec <container> mongosh --eval "rs.initiate()"
+    MONGODB_URI="mongodb://localhost:27017/?replicaSet=rs0" python benchmarks/bench_patron_reads.py
+"""
+
+import sys
+import os
+import time
+import statistics
+from concurrent import futures
+from datetime import datetime, timedelta
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository.mongodb_database as mongodb_database
+from models.patron import Patron
+from repository.mongodb_database import MongoDBConnection
+from repository.patron_repository import PatronRepository
+
+
+DATABASE_NAME = "library_bench"
+PATRON_COUNT = 5000
+THREADS = 16
+ITERATIONS = 200
+
+SETTINGS = [
+    {"read_preference": "primary", "max_pool_size": 10, "compressors": []},
+    {"read_preference": "primary", "max_pool_size": 100, "compressors": []},
+    {"read_preference": "secondaryPreferred", "max_pool_size": 100, "compressors": []},
+    {"read_preference": "secondaryPreferred", "max_pool_size": 100, "compressors": ["zlib"]},
+    {"read_preference": "secondaryPreferred", "max_pool_size": 100, "compressors": ["zstd", "snappy", "zlib"]},
+]
+
+MEMBERSHIP_TYPES = ["student", "faculty", "community", "premium"]
+
+
+def seed(connection: MongoDBConnection):
+    """Insert PATRON_COUNT synthetic patrons into a fresh collection"""
+    collection = connection.get_collection("patrons")
+    collection.drop()
+    connection.create_indexes()
+    now = datetime.now()
+    documents = []
+    for i in range(PATRON_COUNT):
+        patron = Patron(
+            id=None,
+            first_name=f"First{i % 97}",
+            last_name=f"Last{i % 331}",
+            email=f"patron{i}@bench.local",
+            phone=None,
+            address=None,
+            membership_type=MEMBERSHIP_TYPES[i % len(MEMBERSHIP_TYPES)],
+            membership_start_date=now,
+            membership_end_date=now + timedelta(days=365),
+            books_checked_out=[],
+            total_books_borrowed=i % 50,
+            active=True,
+            created_at=now,
+            updated_at=now
+        )
+        documents.append(patron.to_dict())
+    collection.insert_many(documents)
+
+
+def run_queries(repo: PatronRepository, i: int) -> float:
+    """Run one mix of routed reads and return the elapsed seconds"""
+    start = time.perf_counter()
+    repo.list_patrons(limit=100, offset=(i * 100) % PATRON_COUNT)
+    repo.search_patrons_by_name(f"Last{i % 331}")
+    repo.get_patrons_by_membership_type(MEMBERSHIP_TYPES[i % len(MEMBERSHIP_TYPES)])
+    return time.perf_counter() - start
+
+
+def bench(settings: dict) -> dict:
+    """Measure latency and throughput of the query mix for one client configuration"""
+    connection = MongoDBConnection(database_name=DATABASE_NAME, **settings)
+    if not connection.connect():
+        raise SystemExit("MongoDB is not reachable, see the module docstring")
+
+    # PatronRepository resolves the global connection, point it at this one
+    mongodb_database._mongodb_connection = connection
+    repo = PatronRepository()
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        latencies = list(executor.map(lambda i: run_queries(repo, i), range(ITERATIONS)))
+    elapsed = time.perf_counter() - start
+
+    connection.disconnect()
+    latencies.sort()
+    return {
+        "ops_per_sec": ITERATIONS / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    seed_connection = MongoDBConnection(database_name=DATABASE_NAME)
+    if not seed_connection.connect():
+        raise SystemExit("MongoDB is not reachable, see the module docstring")
+    seed(seed_connection)
+    seed_connection.disconnect()
+
+    print(f"{'read preference':<20} {'pool':>5} {'compressors':<18} {'ops/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for settings in SETTINGS:
+        result = bench(settings)
+        print(
+            f"{settings['read_preference']:<20} {settings['max_pool_size']:>5} "
+            f"{','.join(settings['compressors']) or '-':<18} "
+            f"{result['ops_per_sec']:>8.1f} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
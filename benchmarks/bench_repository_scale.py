@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Benchmark repository operations as the data grows
+
+Loads synthetic books (benchmarks/synthetic.py) into a scratch bench_books
+table and synthetic patrons into a library_bench database, one scale after
+the other, and times every BookRepository and PatronRepository operation the
+api uses at each scale. Operations whose latency grows with the row count
+are flagged at the end; that is a missing index or a scan on the request path.
+
+Books go to MySQL from the MYSQL_* variables or --books-url, the SQLite
+stand-in works too. Patrons need a MongoDB, MONGODB_URI picks it, and are
+skipped when none is reachable:
+
+    python benchmarks/bench_repository_scale.py --scales 10000,100000,1000000
+    python benchmarks/bench_repository_scale.py --books-url sqlite:///bench.db --skip-patrons
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository.mongodb_database as mongodb_database
+from repository import BookRepository, connect_db, connect_url
+from repository.mongodb_database import MongoDBConnection
+from repository.patron_repository import PatronRepository
+from synthetic import SyntheticLibrary, batched
+
+
+BOOKS_TABLE = 'bench_books'
+CREATE_QUERY = f'''create table {BOOKS_TABLE} (
+    id char(36),
+    title varchar(255),
+    author varchar(255),
+    description varchar(4095),
+    checked_out bool,
+    isbn_number bigint,
+    primary key (id),
+    unique (isbn_number)
+)'''
+INSERT_QUERY = (
+    f'insert into {BOOKS_TABLE} (id,title,author,description,isbn_number,checked_out) values (%s,%s,%s,%s,%s,%s)'
+)
+DATABASE_NAME = 'library_bench'
+BATCH = 5000
+# slope of log(latency) over log(rows) above which an operation counts as growing with the data
+GROWTH_SLOPE = 0.3
+
+
+def time_operation(operation: Callable[[int], object], iterations: int, max_seconds: float) -> dict:
+    """Runs operation(i) up to iterations times or max_seconds, whichever ends first"""
+    latencies = []
+    deadline = time.perf_counter() + max_seconds
+    for i in range(iterations):
+        start = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - start)
+        if start > deadline:
+            break
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[max(math.ceil(len(latencies) * 0.99) - 1, 0)] * 1000,
+    }
+
+
+def book_operations(repo: BookRepository, data: SyntheticLibrary, rows: int, seed: int) -> dict[str, Callable]:
+    rng = random.Random(seed)
+    # uniform picks for point reads, popularity skewed picks for checkouts like real traffic
+    pick = lambda: rng.randrange(rows)
+    popular = lambda: data.popular_books.sample(rng) % rows
+
+    def checkout(i: int) -> None:
+        id = data.book_id(popular())
+        repo.set_checked_out_many([id], True)
+        repo.set_checked_out_many([id], False)
+
+    return {
+        'book get_by_id': lambda i: repo.get_book_by_id(data.book_id(pick())),
+        'book get_by_isbn': lambda i: repo.get_book_by_isbn(data.isbn(pick())),
+        'book get_by_isbn miss': lambda i: repo.get_book_by_isbn(data.isbn(rows + pick())),
+        'book list 100': lambda i: repo.list_book_rows(100),
+        'book scan page 100': lambda i: repo.scan_book_rows(data.book_id(pick()), 100),
+        'book checkout+return': checkout,
+        'book count': lambda i: repo.count_books(),
+    }
+
+
+def patron_operations(repo: PatronRepository, data: SyntheticLibrary, rows: int, seed: int) -> dict[str, Callable]:
+    rng = random.Random(seed)
+    pick = lambda: rng.randrange(rows)
+
+    def checkout(i: int) -> None:
+        patron_id = data.patron_id(pick())
+        book_id = data.book_id(pick())
+        repo.checkout_book(patron_id, book_id)
+        repo.return_book(patron_id, book_id)
+
+    return {
+        'patron get_by_id': lambda i: repo.get_patron_by_id(data.patron_id(pick())),
+        'patron get_by_email': lambda i: repo.get_patron_by_email(data.email(pick())),
+        'patron list 100': lambda i: repo.list_patron_documents(100),
+        'patron list 100 deep': lambda i: repo.list_patron_documents(100, offset=rows // 2),
+        'patron scan page 100': lambda i: repo.scan_patron_documents(data.patron_id(pick()), 100),
+        'patron search name': lambda i: repo.search_patrons_by_name(data.last_name(rng)),
+        'patron by membership': lambda i: repo.get_patrons_by_membership_type('premium'),
+        'patron checkout+return': checkout,
+        'patron count': lambda i: repo.count_patrons(),
+    }
+
+
+def connect_books(url: str | None):
+    db = connect_url(url) if url else connect_db()
+    if db is None:
+        raise SystemExit('MySQL is not reachable, see the module docstring')
+    cursor = db.cursor()
+    cursor.execute(f'drop table if exists {BOOKS_TABLE}')
+    cursor.execute(CREATE_QUERY)
+    db.commit()
+    return db
+
+
+def connect_patrons() -> MongoDBConnection | None:
+    connection = MongoDBConnection(database_name=DATABASE_NAME)
+    if not connection.connect():
+        print('MongoDB is not reachable, patrons are skipped')
+        return None
+    connection.get_collection('patrons').drop()
+    connection.create_indexes()
+    # PatronRepository resolves the global connection, point it at this one
+    mongodb_database._mongodb_connection = connection
+    return connection
+
+
+def print_curves(results: dict[str, dict[int, dict]], scales: list[int]) -> None:
+    print(f"\n{'operation':<24}" + ''.join(f'{scale:>12,}' for scale in scales) + f"{'slope':>8}")
+    for name, by_scale in results.items():
+        cells = ''.join(
+            f"{by_scale[scale]['p50_ms']:>12.3f}" if scale in by_scale else f"{'-':>12}" for scale in scales
+        )
+        slope = growth_slope(by_scale)
+        flag = '  grows with rows' if slope is not None and slope > GROWTH_SLOPE else ''
+        print(f'{name:<24}{cells}{slope if slope is not None else 0:>8.2f}{flag}')
+    print('\np50 latency in ms per scale; slope 0 is flat, 1 is linear in the row count')
+
+
+def growth_slope(by_scale: dict[int, dict]) -> float | None:
+    scales = sorted(by_scale)
+    if len(scales) < 2:
+        return None
+    first, last = by_scale[scales[0]]['p50_ms'], by_scale[scales[-1]]['p50_ms']
+    return math.log(max(last, 1e-6) / max(first, 1e-6)) / math.log(scales[-1] / scales[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='10000,100000,1000000', help='comma separated row counts, ascending')
+    parser.add_argument('--books-url', help='mysql or sqlite url, defaults to the MYSQL_* variables')
+    parser.add_argument('--skip-books', action='store_true')
+    parser.add_argument('--skip-patrons', action='store_true')
+    parser.add_argument('--iterations', type=int, default=200, help='calls per operation and scale')
+    parser.add_argument('--max-seconds', type=float, default=5.0, help='time budget per operation and scale')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', default='logs/bench_repository_scale.json')
+    args = parser.parse_args()
+
+    scales = sorted(int(scale) for scale in args.scales.split(','))
+    data = SyntheticLibrary(args.seed)
+    books_db = None if args.skip_books else connect_books(args.books_url)
+    patrons = None if args.skip_patrons else connect_patrons()
+    book_repo = BookRepository(books_db, table=BOOKS_TABLE) if books_db else None
+    patron_repo = PatronRepository() if patrons else None
+    book_rows, patron_rows = data.books(), data.patrons(book_count=scales[-1])
+
+    results: dict[str, dict[int, dict]] = {}
+    loaded = 0
+    for scale in scales:
+        start = time.perf_counter()
+        if books_db:
+            cursor = books_db.cursor()
+            for batch in batched(book_rows, scale - loaded, BATCH):
+                cursor.executemany(INSERT_QUERY, batch)
+                books_db.commit()
+        if patrons:
+            collection = patrons.get_collection('patrons')
+            for batch in batched(patron_rows, scale - loaded, BATCH):
+                collection.insert_many(batch, ordered=False)
+        print(f'loaded {scale:,} rows in {time.perf_counter() - start:.1f}s')
+        loaded = scale
+
+        operations = {}
+        if book_repo:
+            operations.update(book_operations(book_repo, data, scale, args.seed))
+        if patron_repo:
+            operations.update(patron_operations(patron_repo, data, scale, args.seed))
+        for name, operation in operations.items():
+            results.setdefault(name, {})[scale] = time_operation(operation, args.iterations, args.max_seconds)
+
+    print_curves(results, scales)
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump({'seed': args.seed, 'scales': scales, 'operations': results}, f, indent=2)
+    print(f'results written to {args.out}')
+
+    if books_db:
+        books_db.cursor().execute(f'drop table {BOOKS_TABLE}')
+        books_db.commit()
+    if patrons:
+        patrons.get_collection('patrons').drop()
+        patrons.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+Deterministic synthetic books and patrons for the scale benchmarks
+
+The same seed always yields the same rows in the same order, so runs at
+different scales or on different machines load identical data and a
+larger scale is the smaller one plus more rows. The skew is what a real
+catalogue shows: a few surnames, authors and title words are very common,
+most are rare; students dominate the membership; borrowing counts have a
+long tail. Ids, ISBNs and emails are derived from the row number, so any
+row can be addressed without keeping the generated data around.
+"""
+
+import bisect
+import hashlib
+import itertools
+import random
+from datetime import datetime, timedelta
+from typing import Iterator
+from uuid import UUID
+
+from bson import ObjectId
+
+
+FIRST_NAMES = [
+    'James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+    'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Charles', 'Karen',
+    'Wei', 'Mohammed', 'Ana', 'Sofia', 'Hiroshi', 'Priya', 'Olga', 'Mateo', 'Amara', 'Lars',
+    'Fatima', 'Juan', 'Yuki', 'Chloe', 'Kwame', 'Ingrid', 'Ravi', 'Elena', 'Tariq', 'Noor',
+]
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin',
+    'Lee', 'Perez', 'Thompson', 'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez', 'Lewis', 'Robinson',
+    'Walker', 'Young', 'Allen', 'King', 'Wright', 'Scott', 'Torres', 'Nguyen', 'Hill', 'Flores',
+    'Green', 'Adams', 'Nelson', 'Baker', 'Hall', 'Rivera', 'Campbell', 'Mitchell', 'Carter', 'Roberts',
+    'Kowalski', 'Okafor', 'Tanaka', 'Ivanova', 'Haddad', 'Lindqvist', 'Mensah', 'Papadopoulos', 'Novak', 'Sato',
+]
+TITLE_WORDS = [
+    'the', 'of', 'and', 'a', 'in', 'history', 'night', 'house', 'world', 'war', 'love', 'secret', 'life',
+    'girl', 'king', 'city', 'shadow', 'garden', 'river', 'last', 'time', 'stone', 'fire', 'winter', 'light',
+    'silent', 'empire', 'island', 'letters', 'road', 'dark', 'song', 'queen', 'memory', 'sea', 'glass',
+    'machine', 'mountain', 'daughter', 'midnight', 'forgotten', 'journey', 'storm', 'bones', 'library',
+]
+# share of patrons per membership type
+MEMBERSHIP_TYPES = {'student': 55, 'community': 25, 'faculty': 15, 'premium': 5}
+AUTHOR_POOL = 5000
+CHECKED_OUT_RATE = 0.12
+
+# fixed instead of now() so the dates are part of what the seed reproduces
+EPOCH = datetime(2020, 1, 1)
+
+
+class ZipfSampler:
+    """Picks 0..n-1 with probability proportional to 1 / (rank + 1) ** s"""
+
+    def __init__(self, n: int, s: float = 1.1) -> None:
+        self._cumulative = list(itertools.accumulate(1 / (rank + 1) ** s for rank in range(n)))
+
+    def sample(self, rng: random.Random) -> int:
+        return bisect.bisect(self._cumulative, rng.random() * self._cumulative[-1])
+
+
+class SyntheticLibrary:
+    """
+    Books and patrons generated from one seed
+
+    books() and patrons() are independent streams; reading the first n rows
+    of a stream always gives the same n rows.
+    """
+
+    def __init__(self, seed: int = 42) -> None:
+        self.seed = seed
+        self._first_names = ZipfSampler(len(FIRST_NAMES), 0.8)
+        self._last_names = ZipfSampler(len(LAST_NAMES), 0.7)
+        self._title_words = ZipfSampler(len(TITLE_WORDS))
+        self._authors = ZipfSampler(AUTHOR_POOL)
+        # popular books, the ones patrons are holding
+        self.popular_books = ZipfSampler(100_000, 1.2)
+
+    def book_id(self, i: int) -> str:
+        return str(UUID(bytes=self._digest('book', i, 16), version=4))
+
+    def isbn(self, i: int) -> int:
+        # 978 prefix, a 9 digit body spread over the range and the ISBN-13 check digit
+        body = 978_000_000_000 + (i * 7919) % 1_000_000_000
+        digits = [int(d) for d in str(body)]
+        check = (10 - sum(d * (3 if n % 2 else 1) for n, d in enumerate(digits)) % 10) % 10
+        return body * 10 + check
+
+    def patron_id(self, i: int) -> str:
+        return str(ObjectId(self._digest('patron', i, 12)))
+
+    def email(self, i: int) -> str:
+        return f'patron{i}@synthetic.example'
+
+    def last_name(self, rng: random.Random) -> str:
+        return LAST_NAMES[self._last_names.sample(rng)]
+
+    def books(self, start: int = 0) -> Iterator[tuple]:
+        """Rows in Book field order: id, title, author, description, isbn_number, checked_out"""
+        rng = random.Random(f'{self.seed}:books')
+        for i in itertools.count():
+            words = [TITLE_WORDS[self._title_words.sample(rng)] for _ in range(rng.randint(1, 5))]
+            author = self._authors.sample(rng)
+            row = (
+                self.book_id(i),
+                ' '.join(words).capitalize(),
+                f'{FIRST_NAMES[author % len(FIRST_NAMES)]} {LAST_NAMES[author // len(FIRST_NAMES) % len(LAST_NAMES)]}',
+                ' '.join(rng.choices(TITLE_WORDS, k=rng.randint(10, 80))),
+                self.isbn(i),
+                rng.random() < CHECKED_OUT_RATE,
+            )
+            if i >= start:
+                yield row
+
+    def patrons(self, start: int = 0, book_count: int | None = None) -> Iterator[dict]:
+        """
+        Patron documents as PatronRepository stores them
+
+        Checked out book ids point at the most popular of the first
+        book_count books, none are set when it is not given.
+        """
+        rng = random.Random(f'{self.seed}:patrons')
+        types = list(MEMBERSHIP_TYPES)
+        weights = list(MEMBERSHIP_TYPES.values())
+        for i in itertools.count():
+            membership_type = rng.choices(types, weights)[0]
+            start_date = EPOCH + timedelta(days=rng.randint(0, 1800), seconds=rng.randint(0, 86399))
+            # students renew yearly, faculty rarely have an end date at all
+            if membership_type == 'faculty' and rng.random() < 0.7:
+                end_date = None
+            else:
+                end_date = start_date + timedelta(days=365 * rng.randint(1, 3))
+            borrowed = min(int(rng.paretovariate(1.16)) - 1, 5000)
+            holding = min(borrowed, int(rng.expovariate(0.8))) if book_count else 0
+            document = {
+                '_id': ObjectId(self._digest('patron', i, 12)),
+                'first_name': FIRST_NAMES[self._first_names.sample(rng)],
+                'last_name': self.last_name(rng),
+                'email': self.email(i),
+                'phone': f'555-{rng.randint(0, 9999):04d}' if rng.random() < 0.6 else None,
+                'address': f'{rng.randint(1, 9999)} {rng.choice(LAST_NAMES)} St' if rng.random() < 0.4 else None,
+                'membership_type': membership_type,
+                'membership_start_date': start_date,
+                'membership_end_date': end_date,
+                'books_checked_out': [
+                    self.book_id(self.popular_books.sample(rng) % book_count) for _ in range(holding)
+                ],
+                'total_books_borrowed': borrowed,
+                'active': rng.random() < 0.9,
+                'created_at': start_date,
+                'updated_at': start_date + timedelta(days=rng.randint(0, 365)),
+            }
+            if i >= start:
+                yield document
+
+    def _digest(self, kind: str, i: int, size: int) -> bytes:
+        return hashlib.blake2b(f'{self.seed}:{kind}:{i}'.encode(), digest_size=size).digest()
+
+
+def batched(rows: Iterator, count: int, size: int) -> Iterator[list]:
+    """The next count rows of a stream in lists of at most size"""
+    while count > 0:
+        batch = list(itertools.islice(rows, min(size, count)))
+        if not batch:
+            return
+        count -= len(batch)
+        yield batch
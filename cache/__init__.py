@@ -0,0 +1,5 @@
+from .singleflight import SingleFlight
+from .idempotency import IdempotencyStore, Claim
+from .isbn_filter import BloomFilter, IsbnFilter
+
+__all__ = ['singleflight', 'idempotency', 'isbn_filter']
@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Hashable
+
+
+class Claim(Enum):
+    EXECUTE = 1      # first time the key is seen, run the call and complete() or abandon() it
+    REPLAY = 2       # finished before, the entry holds the response
+    CONFLICT = 3     # key already used for a different request
+    IN_PROGRESS = 4  # another call with the key is still running after the wait
+
+
+class IdempotencyEntry:
+    __slots__ = ('fingerprint', 'response', 'expires', 'finished', 'abandoned')
+
+    def __init__(self, fingerprint: bytes, expires: float) -> None:
+        self.fingerprint = fingerprint
+        self.response = None
+        self.expires = expires
+        self.finished = threading.Event()
+        self.abandoned = False
+
+
+class IdempotencyStore:
+    """
+    Results of completed calls by idempotency key, bounded in size and age
+
+    Entries expire ttl_seconds after the call started and the oldest are
+    dropped above max_entries. A second call with a key still in flight waits
+    up to wait_seconds for the first one instead of running twice. Keys are
+    kept with a fingerprint of the request so reusing one for a different
+    request is refused rather than answered with an unrelated response.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 3600.0, wait_seconds: float = 10.0) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._wait_seconds = wait_seconds
+        self._entries: OrderedDict[Hashable, IdempotencyEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.executed = 0
+        self.replayed = 0
+        self.conflicts = 0
+
+    def claim(self, key: Hashable, fingerprint: bytes) -> tuple[Claim, IdempotencyEntry | None]:
+        deadline = time.monotonic() + self._wait_seconds
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                self._expire(now)
+                entry = self._entries.get(key)
+                if entry is None:
+                    # room is only made for a new key, looking one up evicts nothing
+                    while len(self._entries) >= self._max_entries:
+                        self._entries.popitem(last=False)
+                    entry = self._entries[key] = IdempotencyEntry(fingerprint, now + self._ttl_seconds)
+                    self.executed += 1
+                    return Claim.EXECUTE, entry
+                if entry.fingerprint != fingerprint:
+                    self.conflicts += 1
+                    return Claim.CONFLICT, None
+                if entry.finished.is_set() and not entry.abandoned:
+                    self.replayed += 1
+                    return Claim.REPLAY, entry
+            # in flight elsewhere, or abandoned and about to be removed: wait and look again
+            if not entry.finished.wait(max(deadline - now, 0)):
+                return Claim.IN_PROGRESS, None
+
+    def complete(self, key: Hashable, entry: IdempotencyEntry, response) -> None:
+        entry.response = response
+        entry.finished.set()
+
+    def abandon(self, key: Hashable, entry: IdempotencyEntry) -> None:
+        """Forgets a call that failed, so a retry runs it again"""
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        entry.abandoned = True
+        entry.finished.set()
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self._entries), 'executed': self.executed, 'replayed': self.replayed,
+            'conflicts': self.conflicts
+        }
+
+    def _expire(self, now: float) -> None:
+        # every entry lives equally long, so insertion order is expiry order
+        while self._entries and next(iter(self._entries.values())).expires <= now:
+            self._entries.popitem(last=False)
@@ -0,0 +1,167 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+import zlib
+
+from repository import IBookRepository
+
+
+DEFAULT_FILTER_PATH = 'logs/isbn_filter.bin'
+
+FILE_MAGIC = b'ISBF'
+# magic, version, bits, hashes, capacity, added, checksum count, checksum sum
+FILE_HEADER = struct.Struct('>4sHQIQQQq')
+# 2: the checksum is of the isbns the filter holds, 1 stamped the table's at save time
+FILE_VERSION = 2
+
+
+class BloomFilter:
+    """
+    Bloom filter over integer keys
+
+    A miss means the key was never added, a hit only means it may have been.
+    Sized for capacity keys at error_rate false positives, beyond that the
+    rate climbs but misses stay exact.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01, bits: int | None = None, hashes: int | None = None):
+        self.capacity = max(capacity, 1)
+        self.bits = bits or max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = hashes or max(1, round(self.bits / self.capacity * math.log(2)))
+        self.added = 0
+        self._array = bytearray((self.bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def add(self, key: int) -> None:
+        positions = self._positions(key)
+        with self._lock:
+            for position in positions:
+                self._array[position >> 3] |= 1 << (position & 7)
+            self.added += 1
+
+    def __contains__(self, key: int) -> bool:
+        array = self._array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def _positions(self, key: int) -> list[int]:
+        # double hashing, k positions from two 64 bit halves of one digest
+        digest = hashlib.blake2b(key.to_bytes(8, 'big', signed=True), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+
+class IsbnFilter:
+    """
+    Known ISBNs of the books table, answers "definitely not a book of ours" without MySQL
+
+    Built from a keyset scan of the isbn index at startup, or loaded from the
+    file a previous process saved. Creates add their ISBN before the insert,
+    so a committed book is never missed. Deletes leave their bits set; a
+    deleted ISBN just costs the usual lookup until the filter is next rebuilt.
+
+    Next to the bits the filter keeps the count and sum of the ISBNs it was
+    given, the checksum it is saved with. A saved filter is only loaded while
+    the table's count(*) and sum(isbn_number) still match it, a book another
+    process inserted meanwhile means a rebuild rather than a filter missing it.
+    """
+
+    def __init__(self, bloom: BloomFilter, count: int = 0, total: int = 0) -> None:
+        self._bloom = bloom
+        self._count = count
+        self._total = total
+        # add() checks and sets under it, save() copies bits and checksum under it
+        self._lock = threading.Lock()
+        self.removed = 0
+        self.skipped_lookups = 0
+
+    @classmethod
+    def build(cls, repo: IBookRepository, error_rate: float = 0.01, chunk_size: int = 10000) -> 'IsbnFilter':
+        count, _ = repo.isbn_checksum()
+        # room to grow before the false positive rate suffers
+        bloom = BloomFilter(max(count * 2, 100_000), error_rate)
+        count = total = 0
+        after_isbn = -1
+        while True:
+            isbns = repo.scan_isbns(after_isbn, chunk_size)
+            if not isbns:
+                break
+            for isbn in isbns:
+                bloom.add(isbn)
+            count += len(isbns)
+            total += sum(isbns)
+            after_isbn = isbns[-1]
+        return cls(bloom, count, total)
+
+    @classmethod
+    def load(cls, path: str, repo: IBookRepository) -> 'IsbnFilter | None':
+        """The saved filter, or None when there is none or the table no longer holds what it did"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            header = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            body = f.read()
+        magic, version, bits, hashes, capacity, added, count, total = header
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            return None
+        if repo.isbn_checksum() != (count, total):
+            return None
+        bloom = BloomFilter(capacity, bits=bits, hashes=hashes)
+        bloom._array = bytearray(zlib.decompress(body))
+        bloom.added = added
+        return cls(bloom, count, total)
+
+    @classmethod
+    def load_or_build(cls, path: str | None, repo: IBookRepository) -> 'IsbnFilter':
+        loaded = cls.load(path, repo) if path else None
+        return loaded or cls.build(repo)
+
+    def save(self, path: str) -> None:
+        bloom = self._bloom
+        with self._lock:
+            body = zlib.compress(bytes(bloom._array), 1)
+            header = FILE_HEADER.pack(
+                FILE_MAGIC, FILE_VERSION, bloom.bits, bloom.hashes, bloom.capacity, bloom.added,
+                self._count, self._total
+            )
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(header)
+            f.write(body)
+        os.replace(path + '.tmp', path)
+
+    def checksum(self) -> tuple[int, int]:
+        """Count and sum of the isbns added and not removed, what isbn_checksum() gives for the same set"""
+        with self._lock:
+            return self._count, self._total
+
+    def might_contain(self, isbn: int) -> bool:
+        if isbn in self._bloom:
+            return True
+        self.skipped_lookups += 1
+        return False
+
+    def add(self, isbn: int) -> None:
+        # updates and failed inserts re-add isbns it holds, only new ones change the checksum.
+        # a false positive leaves a new isbn uncounted, that only costs a rebuild on the next load
+        with self._lock:
+            if isbn in self._bloom:
+                return
+            self._bloom.add(isbn)
+            self._count += 1
+            self._total += isbn
+
+    def remove(self, isbn: int) -> None:
+        # bloom bits can not be cleared, the checksum follows the table and the count shows the staleness
+        with self._lock:
+            self._count -= 1
+            self._total -= isbn
+            self.removed += 1
+
+    def stats(self) -> dict:
+        return {
+            'capacity': self._bloom.capacity, 'added': self._bloom.added, 'removed': self.removed,
+            'skipped_lookups': self.skipped_lookups
+        }
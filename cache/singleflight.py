@@ -0,0 +1,82 @@
+import threading
+from typing import Callable, Hashable, TypeVar
+
+
+T = TypeVar('T')
+
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one backend call
+
+    The first caller for a key runs fn on its own thread, callers arriving
+    while it runs wait for its result instead of calling fn again. An
+    exception raised by fn is raised in every waiter. Waiters give up with
+    TimeoutError after timeout seconds, the call itself keeps running for the
+    caller that started it. Results are shared between callers, treat them as
+    read only.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._timeout = timeout
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.executed = 0
+        self.collapsed = 0
+        self.timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.executed += 1
+            else:
+                flight.waiters += 1
+                self.collapsed += 1
+        if not leader:
+            return self._wait(flight)
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                # a forget() may already have replaced the entry with a newer flight
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def forget(self, key: Hashable) -> None:
+        """Later calls for key start a new backend call instead of joining the one in flight"""
+        with self._lock:
+            self._flights.pop(key, None)
+
+    def stats(self) -> dict:
+        return {'calls': self.calls, 'executed': self.executed, 'collapsed': self.collapsed, 'timeouts': self.timeouts}
+
+    def _wait(self, flight: _Flight):
+        if not flight.done.wait(self._timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise TimeoutError(f'coalesced call did not finish within {self._timeout}s')
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
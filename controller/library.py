@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from types import MethodType
+from typing import TYPE_CHECKING
 
-from models import Book, IDType
-from repository import BookRepository
+from cache import SingleFlight
+from models import Book, BatchOutcome, IDType, LibraryStats, Patron
+from models.patron import utc_now
+from repository import IBookRepository
+from tracing import traced
+
+if TYPE_CHECKING:
+    from cache.isbn_filter import IsbnFilter
+    from repository.outbox_repository import OutboxRepository
+    from repository.patron_repository import PatronRepository
+    from stats import LibraryCounters
 
 
 class ILibrary(ABC):
@@ -16,10 +27,18 @@ class ILibrary(ABC):
     def get_book(self, id: str | int, id_type: IDType = IDType.UUID) -> Book | None:
         pass
 
+    @abstractmethod
+    def existing_isbns(self, isbns: list[int]) -> list[int]:
+        pass
+
     @abstractmethod
     def list_books(self, limit: int) -> list[Book]:
         pass
 
+    @abstractmethod
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        pass
+
     @abstractmethod
     def checkout_book(self, id: str | int, id_type: IDType = IDType.UUID) -> str:
         pass
@@ -28,6 +47,26 @@ class ILibrary(ABC):
     def return_book(self, id: str | int, id_type: IDType = IDType.UUID) -> str:
         pass
 
+    @abstractmethod
+    def checkout_book_for_patron(self, id: str | int, patron_id: str, id_type: IDType = IDType.UUID) -> str:
+        pass
+
+    @abstractmethod
+    def return_book_for_patron(self, id: str | int, patron_id: str, id_type: IDType = IDType.UUID) -> str:
+        pass
+
+    @abstractmethod
+    def checkout_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        pass
+
+    @abstractmethod
+    def return_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        pass
+
+    @abstractmethod
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        pass
+
     @abstractmethod
     def update_book(self, book: Book) -> str:
         pass
@@ -36,49 +75,260 @@ class ILibrary(ABC):
     def delete_book(self, id: str | int, id_type: IDType = IDType.UUID) -> bool:
         pass
 
+    @abstractmethod
+    def patrons_available(self) -> bool:
+        pass
+
+    @abstractmethod
+    def create_patron(self, patron: Patron) -> str:
+        pass
+
+    @abstractmethod
+    def get_patron(self, id: str = '', email: str = '') -> Patron | None:
+        pass
+
+    @abstractmethod
+    def update_patron_membership(self, patron_id: str, membership_type: str, end_date: datetime | None) -> bool:
+        pass
+
+    @abstractmethod
+    def list_patron_documents(self, limit: int, offset: int = 0, active_only: bool = True) -> list[dict]:
+        pass
+
+    @abstractmethod
+    def get_library_stats(self) -> LibraryStats | None:
+        pass
+
 
 class Library(ILibrary):
     """Library application implementation"""
 
-    def __init__(self, book_repository: BookRepository):
+    def __init__(
+        self,
+        book_repository: IBookRepository,
+        patron_repository: 'PatronRepository | None' = None,
+        outbox_repository: 'OutboxRepository | None' = None,
+        counters: 'LibraryCounters | None' = None,
+        singleflight: SingleFlight | None = None,
+        isbn_filter: 'IsbnFilter | None' = None
+    ):
         self._book_repository = book_repository
+        self._patron_repository = patron_repository
+        self._outbox_repository = outbox_repository
+        self._counters = counters
+        # concurrent reads of the same book or patron share one backend call
+        self._singleflight = singleflight
+        # isbns it has never seen are answered without a query
+        self._isbn_filter = isbn_filter
 
+    @traced('Library.add_book')
     def add_book(self, book: Book) -> str:
-        return self._book_repository.create_book(book)
+        self._add_isbn(book.isbn_number)
+        inserted_id = self._book_repository.create_book(book)
+        if inserted_id and self._counters:
+            self._counters.books_added(1, int(bool(book.checked_out)))
+        return inserted_id
 
+    @traced('Library.get_book')
     def get_book(self, id: str | int, id_type: IDType = IDType.UUID) -> Book | None:
         get_func = self._resolve_repository_get_method(id_type)
-        if get_func:
+        if not get_func or self._unknown_isbn(id, id_type):
+            return None
+        if self._singleflight is None:
             return get_func(id)
-        return None
+        return self._singleflight.do(('book', id_type, id), lambda: get_func(id))
+
+    @traced('Library.existing_isbns')
+    def existing_isbns(self, isbns: list[int]) -> list[int]:
+        """The isbns that already have a book, imports check a batch before inserting it"""
+        # with the filter only its rare false positives and real duplicates reach the database
+        return [isbn for isbn in isbns if self.get_book(isbn, IDType.ISBN) is not None]
 
+    @traced('Library.list_books')
     def list_books(self, limit: int) -> list[Book]:
-        return super().list_books(limit)
+        return self._book_repository.list_books(limit)
 
+    @traced('Library.list_book_rows')
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        return self._book_repository.list_book_rows(limit)
+
+    @traced('Library.checkout_book')
     def checkout_book(self, id: str | int, id_type: IDType = IDType.UUID) -> str:
-        get_func = self._resolve_repository_get_method(id_type)
-        if get_func:
-            book = get_func(id)
-            book.checked_out = True
-            return self.update_book(book)
-        return ''
+        return self._set_checked_out(id, id_type, True)
 
+    @traced('Library.return_book')
     def return_book(self, id: str | int, id_type: IDType = IDType.UUID) -> str:
-        get_func = self._resolve_repository_get_method(id_type)
-        if get_func:
-            book = get_func(id)
-            book.checked_out = False
-            return self.update_book(book)
+        return self._set_checked_out(id, id_type, False)
+
+    @traced('Library.checkout_book_for_patron')
+    def checkout_book_for_patron(self, id: str | int, patron_id: str, id_type: IDType = IDType.UUID) -> str:
+        # mysql and the outbox commit together, the patron document catches up asynchronously
+        self._require_outbox()
+        book_id = self._resolve_book_id(id, id_type)
+        if book_id and self._outbox_repository.checkout_book(book_id, patron_id):
+            self._forget_books([book_id], IDType.UUID)
+            self._count_checked_out(1)
+            return book_id
+        return ''
+
+    @traced('Library.return_book_for_patron')
+    def return_book_for_patron(self, id: str | int, patron_id: str, id_type: IDType = IDType.UUID) -> str:
+        self._require_outbox()
+        book_id = self._resolve_book_id(id, id_type)
+        if book_id and self._outbox_repository.return_book(book_id, patron_id):
+            self._forget_books([book_id], IDType.UUID)
+            self._count_checked_out(-1)
+            return book_id
         return ''
 
+    @traced('Library.checkout_books')
+    def checkout_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        outcomes = self._book_repository.set_checked_out_many(ids, True, id_type)
+        self._forget_books(ids, id_type)
+        self._count_checked_out(_count_ok(outcomes))
+        return outcomes
+
+    @traced('Library.return_books')
+    def return_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        outcomes = self._book_repository.set_checked_out_many(ids, False, id_type)
+        self._forget_books(ids, id_type)
+        self._count_checked_out(-_count_ok(outcomes))
+        return outcomes
+
+    @traced('Library.delete_books')
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        outcomes = self._book_repository.delete_books(ids, id_type)
+        self._forget_books(ids, id_type)
+        if id_type == IDType.ISBN:
+            self._remove_isbns([id for id, outcome in outcomes.items() if outcome == BatchOutcome.OK])
+        if self._counters:
+            # whether the deleted books were checked out is not known here,
+            # the checked out total is corrected at the next reconciliation
+            self._counters.books_removed(_count_ok(outcomes))
+        return outcomes
+
+    @traced('Library.update_book')
     def update_book(self, book: Book) -> str:
-        return self._book_repository.update_book(book)
+        if not self._counters:
+            return self._update_book(book, bool(book.checked_out))
+        # the previous state is only read when there are counters to keep right
+        before = self._book_repository.get_book_by_id(book.id)
+        return self._update_book(book, bool(before.checked_out) if before else bool(book.checked_out))
 
+    @traced('Library.delete_book')
     def delete_book(self, id: str | int, id_type: IDType = IDType.UUID) -> bool:
         delete_func = self._resolve_repository_delete_method(id_type)
-        if delete_func:
-            return delete_func(id)
-        return False
+        if not delete_func:
+            return False
+        before = self.get_book(id, id_type) if self._counters or self._isbn_filter else None
+        deleted = delete_func(id)
+        self._forget_books([id], id_type)
+        if deleted and before:
+            self._remove_isbns([before.isbn_number])
+            if self._counters:
+                self._counters.books_removed(1, int(bool(before.checked_out)))
+        return deleted
+
+    def patrons_available(self) -> bool:
+        """False without MongoDB, at startup or while it is unreachable, the patron calls can not be served"""
+        return self._patron_repository is not None and self._patron_repository.available()
+
+    @traced('Library.create_patron')
+    def create_patron(self, patron: Patron) -> str:
+        # dates the client left out default to now, membership_end_date stays open ended
+        now = utc_now()
+        patron.membership_start_date = patron.membership_start_date or now
+        patron.created_at = patron.created_at or now
+        patron.updated_at = now
+        # proto3 can not tell an unset active from false, it follows the membership dates as update_membership does
+        patron.active = patron.membership_end_date is None or patron.membership_end_date > now
+        return self._patron_repository.create_patron(patron)
+
+    @traced('Library.get_patron')
+    def get_patron(self, id: str = '', email: str = '') -> Patron | None:
+        if id and self._singleflight is not None:
+            return self._singleflight.do(('patron', id), lambda: self._patron_repository.get_patron_by_id(id))
+        if id:
+            return self._patron_repository.get_patron_by_id(id)
+        if email:
+            return self._patron_repository.get_patron_by_email(email)
+        return None
+
+    @traced('Library.update_patron_membership')
+    def update_patron_membership(self, patron_id: str, membership_type: str, end_date: datetime | None) -> bool:
+        updated = self._patron_repository.update_membership(patron_id, membership_type, end_date)
+        if self._singleflight is not None:
+            self._singleflight.forget(('patron', patron_id))
+        return updated
+
+    @traced('Library.list_patron_documents')
+    def list_patron_documents(self, limit: int, offset: int = 0, active_only: bool = True) -> list[dict]:
+        return self._patron_repository.list_patron_documents(limit, offset, active_only)
+
+    @traced('Library.get_library_stats')
+    def get_library_stats(self) -> LibraryStats | None:
+        return self._counters.snapshot() if self._counters else None
+
+    def _update_book(self, book: Book, was_checked_out: bool) -> str:
+        self._add_isbn(book.isbn_number)
+        updated_id = self._book_repository.update_book(book)
+        self._forget_books([book.id], IDType.UUID)
+        self._forget_books([book.isbn_number], IDType.ISBN)
+        if updated_id:
+            self._count_checked_out(int(bool(book.checked_out)) - int(was_checked_out))
+        return updated_id
+
+    def _set_checked_out(self, id: str | int, id_type: IDType, checked_out: bool) -> str:
+        # a conditional update on the primary, writing back a row read from a replica could undo newer writes
+        if self._unknown_isbn(id, id_type):
+            return ''
+        outcome = self._book_repository.set_checked_out_many([id], checked_out, id_type).get(id)
+        self._forget_books([id], id_type)
+        if outcome is None or outcome == BatchOutcome.NOT_FOUND:
+            return ''
+        if outcome == BatchOutcome.OK:
+            self._count_checked_out(1 if checked_out else -1)
+        # a book already in the requested state still counts as done
+        book_id = self._resolve_book_id(id, id_type)
+        if book_id and id_type == IDType.ISBN:
+            self._forget_books([book_id], IDType.UUID)
+        return book_id
+
+    def _forget_books(self, ids: list[str | int], id_type: IDType) -> None:
+        # reads starting after a write must not join a flight that began before it
+        if self._singleflight is not None:
+            for id in ids:
+                self._singleflight.forget(('book', id_type, id))
+
+    def _add_isbn(self, isbn: int) -> None:
+        # before the write, a book is in the filter by the time anyone can read it
+        if self._isbn_filter is not None:
+            self._isbn_filter.add(isbn)
+
+    def _remove_isbns(self, isbns: list[int]) -> None:
+        if self._isbn_filter is not None:
+            for isbn in isbns:
+                self._isbn_filter.remove(isbn)
+
+    def _unknown_isbn(self, id: str | int, id_type: IDType) -> bool:
+        return id_type == IDType.ISBN and self._isbn_filter is not None and not self._isbn_filter.might_contain(id)
+
+    def _count_checked_out(self, delta: int) -> None:
+        if self._counters and delta:
+            self._counters.books_checked_out(delta)
+
+    def _require_outbox(self) -> None:
+        if self._outbox_repository is None:
+            raise RuntimeError(
+                'patron checkouts need the outbox, which is not available with sharded book storage '
+                'or when its connection could not be opened'
+            )
+
+    def _resolve_book_id(self, id: str | int, id_type: IDType) -> str:
+        if id_type == IDType.UUID:
+            return id
+        book = self.get_book(id, id_type)
+        return book.id if book else ''
 
     def _resolve_repository_get_method(self, id_type: IDType) -> MethodType | None:
         match id_type:
@@ -94,3 +344,6 @@ class Library(ILibrary):
             case IDType.ISBN:
                 return self._book_repository.delete_book_by_isbn
 
+
+def _count_ok(outcomes: dict[str | int, BatchOutcome]) -> int:
+    return sum(outcome == BatchOutcome.OK for outcome in outcomes.values())
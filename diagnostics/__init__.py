@@ -0,0 +1,7 @@
+from .executor import InstrumentedThreadPoolExecutor
+from .memory import top_allocations
+from .profiler import SamplingProfiler, format_collapsed, write_collapsed
+from .server import DiagnosticsServer
+from .threads import dump_threads
+
+__all__ = ['executor', 'memory', 'profiler', 'server', 'threads']
@@ -0,0 +1,50 @@
+import threading
+import time
+from concurrent import futures
+
+
+class InstrumentedThreadPoolExecutor(futures.ThreadPoolExecutor):
+    """ThreadPoolExecutor tracking queued and running work, for the grpc server"""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = '') -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self._active = 0
+        self._completed = 0
+        self._max_queue_wait = 0.0
+
+    def submit(self, fn, /, *args, **kwargs):
+        queued_at = time.monotonic()
+
+        def run():
+            waited = time.monotonic() - queued_at
+            with self._stats_lock:
+                self._active += 1
+                self._max_queue_wait = max(self._max_queue_wait, waited)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        return super().submit(run)
+
+    def in_flight(self) -> int:
+        """Calls running or waiting for a thread"""
+        with self._stats_lock:
+            return self._active + self._work_queue.qsize()
+
+    def stats(self) -> dict:
+        """Current load, max_queue_wait_ms resets on every call"""
+        with self._stats_lock:
+            max_queue_wait = self._max_queue_wait
+            self._max_queue_wait = 0.0
+            return {
+                'max_workers': self._max_workers,
+                'threads': len(self._threads),
+                'active': self._active,
+                'queued': self._work_queue.qsize(),
+                'completed': self._completed,
+                'max_queue_wait_ms': max_queue_wait * 1000,
+            }
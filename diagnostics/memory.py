@@ -0,0 +1,30 @@
+import tracemalloc
+
+
+def top_allocations(limit: int = 20, start: bool = False, stop: bool = False) -> dict:
+    """
+    Top allocation sites by size from tracemalloc
+
+    Tracing is off by default since it slows every allocation, start turns it
+    on and the first snapshot worth reading comes from a later call.
+    """
+    if start and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    top = []
+    traced = peak = 0
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        traced, peak = tracemalloc.get_traced_memory()
+        for stat in snapshot.statistics('lineno')[:limit]:
+            frame = stat.traceback[0]
+            top.append({'location': f'{frame.filename}:{frame.lineno}', 'size_bytes': stat.size, 'count': stat.count})
+
+    if stop and tracing:
+        tracemalloc.stop()
+        tracing = False
+    return {'tracing': tracing, 'traced_bytes': traced, 'peak_bytes': peak, 'top': top}
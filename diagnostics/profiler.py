@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+
+DEFAULT_PROFILE_DIR = 'logs/profiles'
+
+
+def _collapse(frame: FrameType | None) -> list[str]:
+    """Frames of a stack, outermost first, as module:function"""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class SamplingProfiler:
+    """
+    Wall clock sampling profiler over every python thread
+
+    Samples sys._current_frames() at a fixed interval, so the profiled code runs
+    unmodified and the overhead is bounded by the sampling rate. Only one
+    profile runs at a time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def profile(self, duration: float, interval: float = 0.005) -> tuple[Counter, int]:
+        """Samples for duration seconds, returns the stack counts and number of samples"""
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError('a profile is already running')
+        try:
+            own_ident = threading.get_ident()
+            names = {}
+            stacks: Counter = Counter()
+            samples = 0
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                # refresh names lazily, threads come and go while sampling
+                frames = sys._current_frames()
+                if frames.keys() - names.keys():
+                    names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in frames.items():
+                    if ident == own_ident:
+                        continue
+                    stack = _collapse(frame)
+                    stacks[';'.join([names.get(ident, str(ident)), *stack])] += 1
+                samples += 1
+                time.sleep(interval)
+            return stacks, samples
+        finally:
+            self._lock.release()
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Brendan Gregg's collapsed stack format, one line per distinct stack"""
+    return '\n'.join(f'{stack} {count}' for stack, count in stacks.most_common())
+
+
+def write_collapsed(collapsed: str, directory: str | None = None) -> str:
+    directory = directory or os.getenv('PROFILE_DIR', DEFAULT_PROFILE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'cpu-{time.strftime("%Y%m%d-%H%M%S")}.folded')
+    with open(path, 'w') as f:
+        f.write(collapsed)
+    return path
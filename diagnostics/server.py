@@ -0,0 +1,25 @@
+from concurrent import futures
+
+import grpc
+
+
+class DiagnosticsServer:
+    """
+    Separate grpc server for the diagnostics service on the debug port
+
+    It has its own executor so thread dumps and profiles still work while
+    every worker of the main server is busy or stuck.
+    """
+
+    def __init__(self, servicer, port: int, max_workers: int = 2) -> None:
+        from protogen import add_DiagnosticsServicer_to_server
+
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='diagnostics'))
+        add_DiagnosticsServicer_to_server(servicer, self._server)
+        self.port = self._server.add_insecure_port(f'[::]:{port}')
+
+    def start(self) -> None:
+        self._server.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._server.stop(timeout).wait()
@@ -0,0 +1,19 @@
+import sys
+import threading
+import traceback
+
+
+def dump_threads() -> list[dict]:
+    """Name, ident, daemon flag and current stack (outermost first) of every python thread"""
+    frames = sys._current_frames()
+    dump = []
+    for thread in threading.enumerate():
+        frame = frames.get(thread.ident)
+        stack = traceback.format_stack(frame) if frame else []
+        dump.append({
+            'name': thread.name,
+            'ident': thread.ident or 0,
+            'daemon': thread.daemon,
+            'frames': [line.rstrip() for line in stack],
+        })
+    return dump
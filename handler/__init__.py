@@ -1,4 +1,6 @@
 from .library_grpc_handler import LibraryGRPCHandler
+from .diagnostics_grpc_handler import DiagnosticsGRPCHandler
+from .health_grpc_handler import HealthGRPCHandler
 
-__all__ = ['library_grpc_handler']
+__all__ = ['library_grpc_handler', 'diagnostics_grpc_handler', 'health_grpc_handler']
 
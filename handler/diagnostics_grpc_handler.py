@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING
+
+from grpc import ServicerContext, StatusCode
+
+from protogen import (
+    DiagnosticsServicer, CpuProfileRequest, CpuProfileResponse, ThreadDumpRequest, ThreadDumpResponse,
+    AllocationsRequest, AllocationsResponse, ExecutorStatsRequest, ExecutorStatsResponse, CoalescingStatsRequest,
+    CoalescingStatsResponse, OutboxStatsRequest, OutboxStatsResponse
+)
+from cache import SingleFlight
+from diagnostics import (
+    InstrumentedThreadPoolExecutor, SamplingProfiler, dump_threads, format_collapsed, top_allocations,
+    write_collapsed
+)
+
+if TYPE_CHECKING:
+    from worker import OutboxWorker
+
+
+DEFAULT_PROFILE_SECONDS = 10
+MAX_PROFILE_SECONDS = 120
+DEFAULT_PROFILE_INTERVAL_MS = 5
+DEFAULT_ALLOCATION_LIMIT = 20
+
+
+class DiagnosticsGRPCHandler(DiagnosticsServicer):
+    """DiagnosticsServicer gRPC server implementation"""
+
+    def __init__(
+        self,
+        executor: InstrumentedThreadPoolExecutor,
+        singleflight: SingleFlight | None = None,
+        outbox_worker: 'OutboxWorker | None' = None
+    ) -> None:
+        self._executor = executor
+        self._singleflight = singleflight
+        self._outbox_worker = outbox_worker
+        self._profiler = SamplingProfiler()
+
+    def ProfileCpu(
+        self,
+        request: CpuProfileRequest,
+        context: ServicerContext
+    ) -> CpuProfileResponse:
+        duration = min(request.duration_seconds or DEFAULT_PROFILE_SECONDS, MAX_PROFILE_SECONDS)
+        interval = (request.interval_ms or DEFAULT_PROFILE_INTERVAL_MS) / 1000
+        try:
+            stacks, samples = self._profiler.profile(duration, interval)
+        except RuntimeError as e:
+            context.abort(StatusCode.FAILED_PRECONDITION, str(e))
+        collapsed = format_collapsed(stacks)
+        file_path = write_collapsed(collapsed) if request.write_file else ''
+        return CpuProfileResponse(collapsed_stacks=collapsed, samples=samples, file_path=file_path)
+
+    def DumpThreads(
+        self,
+        request: ThreadDumpRequest,
+        context: ServicerContext
+    ) -> ThreadDumpResponse:
+        return ThreadDumpResponse(threads=dump_threads())
+
+    def TopAllocations(
+        self,
+        request: AllocationsRequest,
+        context: ServicerContext
+    ) -> AllocationsResponse:
+        return AllocationsResponse(**top_allocations(
+            request.limit or DEFAULT_ALLOCATION_LIMIT, start=request.start, stop=request.stop
+        ))
+
+    def GetExecutorStats(
+        self,
+        request: ExecutorStatsRequest,
+        context: ServicerContext
+    ) -> ExecutorStatsResponse:
+        return ExecutorStatsResponse(**self._executor.stats())
+
+    def GetCoalescingStats(
+        self,
+        request: CoalescingStatsRequest,
+        context: ServicerContext
+    ) -> CoalescingStatsResponse:
+        if self._singleflight is None:
+            return CoalescingStatsResponse()
+        return CoalescingStatsResponse(**self._singleflight.stats())
+
+    def GetOutboxStats(
+        self,
+        request: OutboxStatsRequest,
+        context: ServicerContext
+    ) -> OutboxStatsResponse:
+        if self._outbox_worker is None:
+            return OutboxStatsResponse()
+        return OutboxStatsResponse(**self._outbox_worker.stats())
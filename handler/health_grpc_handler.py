@@ -0,0 +1,73 @@
+import threading
+from typing import Iterator
+
+from grpc import ServicerContext, StatusCode
+
+from protogen import HealthServicer, HealthCheckRequest, HealthCheckResponse
+
+
+SERVICE_NAMES = ('', 'Library')
+# how often a Watch stream checks whether its client went away while nothing changes
+WATCH_POLL_SECONDS = 1.0
+
+
+class HealthGRPCHandler(HealthServicer):
+    """
+    grpc.health.v1 implementation for the main server
+
+    Every service starts NOT_SERVING. start() flips them to SERVING once the
+    server and its workers are up, stop() flips them back when shutdown
+    begins, while the server still answers, so probes and load balancers see
+    the change before the port stops accepting calls. Watch streams end once
+    they have sent NOT_SERVING after stop(), an open one would otherwise hold
+    the drain for the whole grace period and count as a dropped call.
+    """
+
+    def __init__(self, services: tuple[str, ...] = SERVICE_NAMES) -> None:
+        self._statuses = {service: HealthCheckResponse.NOT_SERVING for service in services}
+        self._changed = threading.Condition()
+        self._stopped = False
+
+    def start(self) -> None:
+        self._stopped = False
+        self.set_all(HealthCheckResponse.SERVING)
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._changed:
+            self._stopped = True
+            self.set_all(HealthCheckResponse.NOT_SERVING)
+
+    def set_all(self, status: int) -> None:
+        with self._changed:
+            for service in self._statuses:
+                self._statuses[service] = status
+            self._changed.notify_all()
+
+    def Check(
+        self,
+        request: HealthCheckRequest,
+        context: ServicerContext
+    ) -> HealthCheckResponse:
+        status = self._statuses.get(request.service)
+        if status is None:
+            context.abort(StatusCode.NOT_FOUND, f'unknown service {request.service!r}')
+        return HealthCheckResponse(status=status)
+
+    def Watch(
+        self,
+        request: HealthCheckRequest,
+        context: ServicerContext
+    ) -> Iterator[HealthCheckResponse]:
+        last = None
+        while context.is_active():
+            with self._changed:
+                status = self._statuses.get(request.service, HealthCheckResponse.SERVICE_UNKNOWN)
+                stopped = self._stopped
+                if status == last and not stopped:
+                    self._changed.wait(WATCH_POLL_SECONDS)
+                    continue
+            if status != last:
+                last = status
+                yield HealthCheckResponse(status=status)
+            if stopped and status == HealthCheckResponse.NOT_SERVING:
+                return
@@ -1,9 +1,39 @@
-from uuid import uuid4
+import os
+from typing import Callable, Iterator
 from grpc import ServicerContext, StatusCode
 
-from protogen import LibraryServicer, UpsertBookRequest, UpsertBookResponse, Error, ErrorCode
-from mapper import book, bookProtoToModel, bookModelToProto
+from protogen import (
+    LibraryServicer, UpsertBookRequest, UpsertBookResponse, GetBookRequest, ListBooksRequest, ListBooksResponse,
+    BatchBookRequest, BatchBookResponse, GetBookResponse,
+    UpsertPatronRequest, UpsertPatronResponse, GetPatronRequest, GetPatronResponse, ListPatronsRequest,
+    ListPatronsResponse, PatronMembershipRequest, PatronMembershipResponse,
+    GetLibraryStatsRequest, GetLibraryStatsResponse, SessionRequest, SessionResponse, Error, ErrorCode
+)
+from mapper import (
+    book, bookProtoToModel, bookModelToProto, bookRowsToProto, bookRequestToId, batchOutcomesToProto, patronModelToProto,
+    patronProtoToModel, patronDocumentsToProto, timestampToDatetime, libraryStatsToProto
+)
+from mapper.patron import MEMBERSHIP_TYPE_FROM_PROTO
 from controller import Library
+from models import IDType, uuid7
+from .session import SessionDispatcher
+
+
+DEFAULT_LIST_LIMIT = 100
+MAX_BATCH_SIZE = 1000
+
+# Patron dates are sent as Timestamps, the deprecated ISO 8601 strings are only filled
+# for old clients. Servers default to filling them until PATRON_LEGACY_DATE_STRINGS=0,
+# a call can override with x-patron-date-format: iso8601 | timestamp
+LEGACY_DATE_STRINGS = os.getenv('PATRON_LEGACY_DATE_STRINGS', '1') == '1'
+DATE_FORMAT_METADATA_KEY = 'x-patron-date-format'
+
+
+def wants_legacy_dates(context: ServicerContext) -> bool:
+    for key, value in context.invocation_metadata() or ():
+        if key == DATE_FORMAT_METADATA_KEY:
+            return value == 'iso8601'
+    return LEGACY_DATE_STRINGS
 
 
 class LibraryGRPCHandler(LibraryServicer):
@@ -11,6 +41,17 @@ class LibraryGRPCHandler(LibraryServicer):
 
     def __init__(self, controller: Library) -> None:
         self._library_controller = controller
+        # every open stream holds a server executor thread, SESSION_MAX_STREAMS keeps some for unary calls
+        self._session = SessionDispatcher(
+            self,
+            max_in_flight=int(os.getenv('SESSION_MAX_IN_FLIGHT', '32')),
+            workers=int(os.getenv('SESSION_WORKERS', '16')),
+            max_sessions=int(os.getenv('SESSION_MAX_STREAMS', '4'))
+        )
+
+    def configure_session(self, rate_limit=None, idempotency=None) -> None:
+        """Hands the server's interceptors to Session, whose operations never pass through them"""
+        self._session.configure(rate_limit, idempotency)
 
     def CreateBook(
         self,
@@ -22,7 +63,7 @@ class LibraryGRPCHandler(LibraryServicer):
             context.set_code(StatusCode.INVALID_ARGUMENT)
             return UpsertBookResponse(err=err)
         if not request.book.uuid:
-            request.book.uuid = str(uuid4())
+            request.book.uuid = str(uuid7())
         inserted_id = self._library_controller.add_book(bookProtoToModel(request.book))
         if not inserted_id:
             err = Error('Failed to add book', ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
@@ -34,7 +75,7 @@ class LibraryGRPCHandler(LibraryServicer):
         self,
         request: UpsertBookRequest,
         context: ServicerContext
-    ):
+    ) -> UpsertBookResponse:
         if not request.book:
             err = Error('Invalid request', ErrorCode.ERR_CODE_BAD_REQUEST)
             context.set_code(StatusCode.INVALID_ARGUMENT)
@@ -44,21 +85,213 @@ class LibraryGRPCHandler(LibraryServicer):
             err = Error('Failed to update book', ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
             context.set_code(StatusCode.INTERNAL)
             return UpsertBookResponse(err=err)
-        return UpsertBookResponse(inserted_id)
+        return UpsertBookResponse(uuid=inserted_id)
+
+    def CheckoutBook(
+        self,
+        request: GetBookRequest,
+        context: ServicerContext
+    ) -> UpsertBookResponse:
+        id, id_type = bookRequestToId(request)
+        if request.patron_id:
+            book_id = self._library_controller.checkout_book_for_patron(id, request.patron_id, id_type)
+        else:
+            book_id = self._library_controller.checkout_book(id, id_type)
+        if not book_id:
+            err = Error(message='Book could not be checked out', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.FAILED_PRECONDITION)
+            return UpsertBookResponse(err=err)
+        return UpsertBookResponse(uuid=book_id)
+
+    def ReturnBook(
+        self,
+        request: GetBookRequest,
+        context: ServicerContext
+    ) -> UpsertBookResponse:
+        id, id_type = bookRequestToId(request)
+        if request.patron_id:
+            book_id = self._library_controller.return_book_for_patron(id, request.patron_id, id_type)
+        else:
+            book_id = self._library_controller.return_book(id, id_type)
+        if not book_id:
+            err = Error(message='Book could not be returned', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.FAILED_PRECONDITION)
+            return UpsertBookResponse(err=err)
+        return UpsertBookResponse(uuid=book_id)
+
+    def CheckoutBooks(
+        self,
+        request: BatchBookRequest,
+        context: ServicerContext
+    ) -> BatchBookResponse:
+        return self._run_batch(request, context, self._library_controller.checkout_books)
+
+    def ReturnBooks(
+        self,
+        request: BatchBookRequest,
+        context: ServicerContext
+    ) -> BatchBookResponse:
+        return self._run_batch(request, context, self._library_controller.return_books)
+
+    def DeleteBooks(
+        self,
+        request: BatchBookRequest,
+        context: ServicerContext
+    ) -> BatchBookResponse:
+        return self._run_batch(request, context, self._library_controller.delete_books)
+
+    def _run_batch(
+        self,
+        request: BatchBookRequest,
+        context: ServicerContext,
+        operation: Callable[[list, IDType], dict]
+    ) -> BatchBookResponse:
+        if len(request.uuids) + len(request.isbn_numbers) > MAX_BATCH_SIZE:
+            err = Error(message=f'Batch exceeds {MAX_BATCH_SIZE} books', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            return BatchBookResponse(err=err)
+        response = BatchBookResponse()
+        for ids, id_type in ((request.uuids, IDType.UUID), (request.isbn_numbers, IDType.ISBN)):
+            if ids:
+                batchOutcomesToProto(ids, operation(list(ids), id_type), id_type, response.results)
+        return response
+
+    def GetBook(
+        self,
+        request: GetBookRequest,
+        context: ServicerContext
+    ) -> GetBookResponse:
+        id, id_type = bookRequestToId(request)
+        try:
+            book = self._library_controller.get_book(id, id_type)
+        except TimeoutError:
+            # waited on another caller's lookup of the same book for too long
+            err = Error(message='Book lookup timed out', code=ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
+            context.set_code(StatusCode.UNAVAILABLE)
+            return GetBookResponse(err=err)
+        if not book:
+            err = Error(message='Book not found', code=ErrorCode.ERR_CODE_NOT_FOUND)
+            context.set_code(StatusCode.NOT_FOUND)
+            return GetBookResponse(err=err)
+        return GetBookResponse(book=bookModelToProto(book))
+
+    def ListBooks(
+        self,
+        request: ListBooksRequest,
+        context: ServicerContext
+    ) -> ListBooksResponse:
+        rows = self._library_controller.list_book_rows(request.limit or DEFAULT_LIST_LIMIT)
+        response = ListBooksResponse()
+        bookRowsToProto(rows, response.books)
+        return response
+
+    def DeleteBook(
+        self,
+        request: GetBookRequest,
+        context: ServicerContext
+    ) -> UpsertBookResponse:
+        id, id_type = bookRequestToId(request)
+        if not self._library_controller.delete_book(id, id_type):
+            err = Error(message='Book not found', code=ErrorCode.ERR_CODE_NOT_FOUND)
+            context.set_code(StatusCode.NOT_FOUND)
+            return UpsertBookResponse(err=err)
+        return UpsertBookResponse(uuid=request.uuid)
 
-    def CheckoutBook(self, request, context):
-        return super().CheckoutBook(request, context)
+    def CreatePatron(
+        self,
+        request: UpsertPatronRequest,
+        context: ServicerContext
+    ) -> UpsertPatronResponse:
+        if not self._library_controller.patrons_available():
+            return UpsertPatronResponse(err=self._patrons_unavailable(context))
+        if not request.HasField('patron') or not request.patron.email:
+            err = Error(message='Invalid request', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            return UpsertPatronResponse(err=err)
+        try:
+            patron_id = self._library_controller.create_patron(patronProtoToModel(request.patron))
+        except ValueError as e:
+            # the repository's duplicate email error
+            err = Error(message=str(e), code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.ALREADY_EXISTS)
+            return UpsertPatronResponse(err=err)
+        return UpsertPatronResponse(id=patron_id)
 
-    def ReturnBook(self, request, context):
-        return super().ReturnBook(request, context)
+    def GetPatron(
+        self,
+        request: GetPatronRequest,
+        context: ServicerContext
+    ) -> GetPatronResponse:
+        if not self._library_controller.patrons_available():
+            return GetPatronResponse(err=self._patrons_unavailable(context))
+        patron = self._library_controller.get_patron(request.id, request.email)
+        if not patron:
+            err = Error(message='Patron not found', code=ErrorCode.ERR_CODE_NOT_FOUND)
+            context.set_code(StatusCode.NOT_FOUND)
+            return GetPatronResponse(err=err)
+        return GetPatronResponse(patron=patronModelToProto(patron, wants_legacy_dates(context)))
 
-    def GetBook(self, request, context):
-        return super().GetBook(request, context)
+    def ListPatrons(
+        self,
+        request: ListPatronsRequest,
+        context: ServicerContext
+    ) -> ListPatronsResponse:
+        if not self._library_controller.patrons_available():
+            return ListPatronsResponse(err=self._patrons_unavailable(context))
+        documents = self._library_controller.list_patron_documents(
+            request.limit or DEFAULT_LIST_LIMIT, request.offset, request.active_only
+        )
+        response = ListPatronsResponse()
+        patronDocumentsToProto(documents, response.patrons, wants_legacy_dates(context))
+        return response
 
-    def ListBooks(self, request, context):
-        return super().ListBooks(request, context)
+    def UpdatePatronMembership(
+        self,
+        request: PatronMembershipRequest,
+        context: ServicerContext
+    ) -> PatronMembershipResponse:
+        if not self._library_controller.patrons_available():
+            return PatronMembershipResponse(err=self._patrons_unavailable(context))
+        membership_type = MEMBERSHIP_TYPE_FROM_PROTO.get(request.membership_type)
+        if not request.patron_id or membership_type is None:
+            err = Error(message='Invalid request', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            return PatronMembershipResponse(err=err)
+        try:
+            # no end date makes the membership open ended
+            end_date = timestampToDatetime(request, 'end_time', 'end_date')
+            updated = self._library_controller.update_patron_membership(request.patron_id, membership_type, end_date)
+        except ValueError as e:
+            # a malformed patron id or end_date
+            err = Error(message=str(e), code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            return PatronMembershipResponse(err=err)
+        if not updated:
+            err = Error(message='Patron not found', code=ErrorCode.ERR_CODE_NOT_FOUND)
+            context.set_code(StatusCode.NOT_FOUND)
+            return PatronMembershipResponse(err=err)
+        return PatronMembershipResponse(success=True)
 
-    def DeleteBook(self, request, context):
-        return super().DeleteBook(request, context)
+    def _patrons_unavailable(self, context: ServicerContext) -> Error:
+        # the server came up without MongoDB, book calls still work
+        context.set_code(StatusCode.UNAVAILABLE)
+        return Error(message='Patron storage is not available', code=ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
 
+    def GetLibraryStats(
+        self,
+        request: GetLibraryStatsRequest,
+        context: ServicerContext
+    ) -> GetLibraryStatsResponse:
+        stats = self._library_controller.get_library_stats()
+        if stats is None:
+            err = Error(message='Library stats are not enabled', code=ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
+            context.set_code(StatusCode.UNAVAILABLE)
+            return GetLibraryStatsResponse(err=err)
+        return libraryStatsToProto(stats)
 
+    def Session(
+        self,
+        request_iterator: Iterator[SessionRequest],
+        context: ServicerContext
+    ) -> Iterator[SessionResponse]:
+        return self._session.run(request_iterator, context)
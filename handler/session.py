@@ -0,0 +1,187 @@
+import contextvars
+import queue
+import threading
+from concurrent import futures
+from typing import Iterator
+
+from grpc import ServicerContext, StatusCode
+
+from protogen import SessionRequest, SessionResponse, Error, ErrorCode
+from interceptor.rate_limit import client_id
+
+
+# how often a stream waiting for a free slot checks whether its client went away
+SLOT_POLL_SECONDS = 1.0
+# operations run the unary handlers of the Library service, the interceptors know them by these names
+SERVICE_PREFIX = '/Library/'
+
+_READER_DONE = object()
+
+
+class OperationAborted(Exception):
+    def __init__(self, code: StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class OperationContext:
+    """
+    ServicerContext for one operation of a Session stream
+
+    Status codes the unary handler sets are kept for that operation's
+    response instead of ending the stream, everything else is the stream's.
+    """
+
+    def __init__(self, context: ServicerContext) -> None:
+        self._context = context
+        self._code = None
+        self._details = ''
+
+    def set_code(self, code: StatusCode) -> None:
+        self._code = code
+
+    def set_details(self, details: str) -> None:
+        self._details = details
+
+    def code(self) -> StatusCode | None:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def abort(self, code: StatusCode, details: str):
+        raise OperationAborted(code, details)
+
+    def set_trailing_metadata(self, trailing_metadata) -> None:
+        # the stream's trailers are sent once at its end, an operation has none of its own
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+class SessionDispatcher:
+    """
+    Runs the operations of Session streams on the unary handlers
+
+    A reader thread per stream pulls requests and hands each one to a shared
+    pool, responses are sent as operations finish. No more than max_in_flight
+    operations of a stream are running or waiting to be sent; beyond that
+    the reader stops pulling, and grpc's flow control holds the client back.
+
+    A stream holds one of the server's executor threads for as long as it is
+    open, at most max_sessions are served at once so unary calls keep the
+    rest; a stream beyond that is refused with RESOURCE_EXHAUSTED.
+
+    Operations bypass the server interceptors, so what those do per method
+    is done here per operation once configure() has handed them over: each
+    operation is charged to its own method's rate limit, the reader waiting
+    for the buckets like a throttled stream, and creates carrying an
+    idempotency_key are deduplicated in the same store as unary calls.
+    """
+
+    def __init__(self, handler, max_in_flight: int = 32, workers: int = 16, max_sessions: int = 4) -> None:
+        self._handler = handler
+        self._max_in_flight = max_in_flight
+        self._executor = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='session')
+        self._sessions = threading.BoundedSemaphore(max_sessions)
+        self._rate_limit = None
+        self._idempotency = None
+
+    def configure(self, rate_limit=None, idempotency=None) -> None:
+        """The server's RateLimitInterceptor and IdempotencyInterceptor, either may be None"""
+        self._rate_limit = rate_limit
+        self._idempotency = idempotency
+
+    def run(self, request_iterator: Iterator[SessionRequest], context: ServicerContext) -> Iterator[SessionResponse]:
+        if not self._sessions.acquire(blocking=False):
+            context.abort(StatusCode.RESOURCE_EXHAUSTED, 'too many open sessions, retry later or use unary calls')
+        # released once the call is over however it ends, a cancelled stream is never iterated to its end
+        if not context.add_callback(self._sessions.release):
+            self._sessions.release()
+            return
+        responses: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(self._max_in_flight)
+        # request scoped context variables, e.g. the read-your-writes session, follow the operations
+        call_context = contextvars.copy_context()
+        client = client_id(context.invocation_metadata(), context.peer())
+
+        def read() -> None:
+            try:
+                for request in request_iterator:
+                    while not slots.acquire(timeout=SLOT_POLL_SECONDS):
+                        if not context.is_active():
+                            return
+                    operation = request.WhichOneof('operation')
+                    if self._rate_limit is not None and operation is not None:
+                        if not self._rate_limit.wait(client, _method_name(operation), context):
+                            return
+                    # counted as outstanding before it can possibly answer
+                    responses.put(None)
+                    self._executor.submit(call_context.copy().run, self._execute, request, context, responses)
+            except Exception as e:
+                # the client cancelled or the stream broke, operations already running still answer
+                if context.is_active():
+                    print('session stream failed', e)
+            finally:
+                responses.put(_READER_DONE)
+
+        threading.Thread(target=read, name='session-reader', daemon=True).start()
+        outstanding = 0
+        reading = True
+        while reading or outstanding:
+            item = responses.get()
+            if item is None:
+                outstanding += 1
+            elif item is _READER_DONE:
+                reading = False
+            else:
+                outstanding -= 1
+                slots.release()
+                yield item
+
+    def _execute(self, request: SessionRequest, context: ServicerContext, responses: queue.Queue) -> None:
+        responses.put(self.execute(request, context))
+
+    def execute(self, request: SessionRequest, context: ServicerContext) -> SessionResponse:
+        """Runs one operation on its unary handler, failures become an error response"""
+        operation = request.WhichOneof('operation')
+        if operation is None:
+            return SessionResponse(
+                request_id=request.request_id,
+                status=StatusCode.INVALID_ARGUMENT.value[0],
+                err=Error(message='No operation set', code=ErrorCode.ERR_CODE_BAD_REQUEST)
+            )
+        name = _method_name(operation)
+        method = getattr(self._handler, name)
+        operation_context = OperationContext(context)
+        try:
+            if request.idempotency_key and self._idempotency and self._idempotency.covers(SERVICE_PREFIX + name):
+                result = self._idempotency.run(
+                    SERVICE_PREFIX + name, request.idempotency_key, getattr(request, operation), operation_context,
+                    method
+                )
+            else:
+                result = method(getattr(request, operation), operation_context)
+        except OperationAborted as e:
+            return _error_response(request.request_id, e.code, e.details)
+        except Exception as e:
+            # unimplemented handlers set their code before raising
+            code = operation_context.code() or StatusCode.INTERNAL
+            return _error_response(request.request_id, code, operation_context.details() or str(e))
+        code = operation_context.code() or StatusCode.OK
+        return SessionResponse(request_id=request.request_id, status=code.value[0], **{operation: result})
+
+
+def _method_name(operation: str) -> str:
+    # create_book -> CreateBook, the oneof names follow the rpc names
+    return ''.join(part.capitalize() for part in operation.split('_'))
+
+
+def _error_response(request_id: int, code: StatusCode, details: str) -> SessionResponse:
+    if code == StatusCode.INVALID_ARGUMENT:
+        err = Error(message=details, code=ErrorCode.ERR_CODE_BAD_REQUEST)
+    else:
+        err = Error(message=details, code=ErrorCode.ERR_CODE_INTERNAL_MALFUNCTION)
+    return SessionResponse(request_id=request_id, status=code.value[0], err=err)
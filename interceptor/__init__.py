@@ -0,0 +1,6 @@
+from .session import SessionInterceptor, current_session
+from .tracing import TracingInterceptor
+from .rate_limit import RateLimitInterceptor, RateLimiter, RateLimit
+from .idempotency import IdempotencyInterceptor
+
+__all__ = ['base', 'session', 'tracing', 'rate_limit', 'idempotency']
@@ -0,0 +1,48 @@
+from typing import Callable
+
+import grpc
+
+
+def wrap_rpc_method_handler(
+    handler: grpc.RpcMethodHandler | None,
+    wrapper: Callable[[Callable], Callable]
+) -> grpc.RpcMethodHandler | None:
+    """
+    Returns handler with its behavior replaced by wrapper(behavior)
+
+    The wrapped behavior runs on the worker thread serving the call, so it can
+    set context variables and see the ServicerContext (peer, metadata).
+    """
+    if handler is None:
+        return None
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(
+            wrapper(handler.unary_unary),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(
+            wrapper(handler.unary_stream),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+    if handler.stream_unary:
+        return grpc.stream_unary_rpc_method_handler(
+            wrapper(handler.stream_unary),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+    return grpc.stream_stream_rpc_method_handler(
+        wrapper(handler.stream_stream),
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer
+    )
+
+
+def metadata_value(metadata, key: str) -> str | None:
+    """First value of key in invocation metadata, None when absent"""
+    for item_key, value in metadata or ():
+        if item_key == key:
+            return value
+    return None
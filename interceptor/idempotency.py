@@ -0,0 +1,86 @@
+import hashlib
+import os
+from functools import wraps
+
+import grpc
+
+from cache import IdempotencyStore, Claim
+from .base import metadata_value
+
+
+IDEMPOTENCY_METADATA_KEY = 'idempotency-key'
+REPLAYED_METADATA_KEY = 'idempotent-replayed'
+
+# Only creates mint new ids, every other write is already safe to repeat or keyed by the client
+IDEMPOTENT_METHODS = ('/Library/CreateBook', '/Library/CreatePatron')
+
+
+class IdempotencyInterceptor(grpc.ServerInterceptor):
+    """
+    Answers retried creates carrying an idempotency-key header from the store
+
+    The first call with a key runs normally and, when it succeeds, its
+    response is kept. Later calls with the same key and request get that
+    response back, marked with idempotent-replayed trailing metadata, without
+    reaching the handler. A failed call is forgotten so the retry runs again.
+    Calls without the header are not affected.
+    """
+
+    def __init__(self, store: IdempotencyStore, methods: tuple[str, ...] = IDEMPOTENT_METHODS) -> None:
+        self.store = store
+        self._methods = frozenset(methods)
+
+    @classmethod
+    def from_env(cls) -> 'IdempotencyInterceptor':
+        return cls(IdempotencyStore(
+            max_entries=int(os.getenv('IDEMPOTENCY_MAX_ENTRIES', '100000')),
+            ttl_seconds=float(os.getenv('IDEMPOTENCY_TTL_SECONDS', '3600'))
+        ))
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or method not in self._methods or not handler.unary_unary:
+            return handler
+        key = metadata_value(handler_call_details.invocation_metadata, IDEMPOTENCY_METADATA_KEY)
+        if not key:
+            return handler
+
+        behavior = handler.unary_unary
+
+        @wraps(behavior)
+        def deduplicated(request, context):
+            return self.run(method, key, request, context, behavior)
+
+        return grpc.unary_unary_rpc_method_handler(
+            deduplicated,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer
+        )
+
+    def covers(self, method: str) -> bool:
+        return method in self._methods
+
+    def run(self, method: str, key: str, request, context, behavior):
+        """Runs behavior(request, context) once per key, also used for the operations of Session streams"""
+        # same key, same bytes: a retry. Same key, other bytes: a client bug worth surfacing
+        fingerprint = hashlib.blake2b(request.SerializeToString(deterministic=True), digest_size=16).digest()
+        claim, entry = self.store.claim((method, key), fingerprint)
+        if claim is Claim.CONFLICT:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, 'idempotency key was used for a different request')
+        if claim is Claim.IN_PROGRESS:
+            context.abort(grpc.StatusCode.ABORTED, 'a call with this idempotency key is still running')
+        if claim is Claim.REPLAY:
+            context.set_trailing_metadata(((REPLAYED_METADATA_KEY, 'true'),))
+            return entry.response
+
+        try:
+            response = behavior(request, context)
+        except BaseException:
+            self.store.abandon((method, key), entry)
+            raise
+        if context.code() in (None, grpc.StatusCode.OK):
+            self.store.complete((method, key), entry, response)
+        else:
+            self.store.abandon((method, key), entry)
+        return response
@@ -0,0 +1,255 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+
+import grpc
+
+from .base import wrap_rpc_method_handler, metadata_value
+
+
+CLIENT_ID_METADATA_KEY = 'x-client-id'
+RETRY_AFTER_METADATA_KEY = 'retry-after-ms'
+
+# Tokens a call takes from the client's bucket, by method name. Unlisted methods cost 1
+DEFAULT_COSTS = {
+    'ListBooks': 5,
+    'ListPatrons': 5,
+    'SearchPatrons': 3,
+    'CheckoutBooks': 5,
+    'ReturnBooks': 5,
+    'DeleteBooks': 5,
+}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float   # tokens added per second
+    burst: float  # bucket capacity, the most a client can spend at once
+
+
+class TokenBucket:
+    """Not thread safe on its own, RateLimiter serializes access"""
+
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, limit: RateLimit, now: float) -> None:
+        self.tokens = limit.burst
+        self.updated = now
+
+    def take(self, limit: RateLimit, cost: float, now: float) -> float:
+        """Takes cost tokens, returns 0 on success or the seconds until enough have refilled"""
+        self.tokens = min(limit.burst, self.tokens + (now - self.updated) * limit.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / limit.rate
+
+
+class _Client:
+    __slots__ = ('seen', 'buckets')
+
+    def __init__(self, now: float) -> None:
+        self.seen = now
+        self.buckets: dict[str | None, TokenBucket] = {}
+
+
+class RateLimiter:
+    """
+    Token buckets per client, plus per client and method for methods with their own limit
+
+    Clients are kept in least recently used order. An idle bucket refills to
+    full, so dropping it loses nothing; clients are evicted once idle longer
+    than any bucket takes to refill, and the least recently used go first
+    above max_clients.
+    """
+
+    def __init__(
+        self,
+        client_limit: RateLimit,
+        method_limits: dict[str, RateLimit] | None = None,
+        costs: dict[str, float] | None = None,
+        max_clients: int = 10000
+    ) -> None:
+        self._client_limit = client_limit
+        self._method_limits = method_limits or {}
+        self._costs = DEFAULT_COSTS if costs is None else costs
+        self._max_clients = max_clients
+        self._idle_seconds = max(limit.burst / limit.rate for limit in (client_limit, *self._method_limits.values()))
+        self._clients: OrderedDict[str, _Client] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.allowed = 0
+        self.rejected = 0
+
+    def acquire(self, client_id: str, method: str) -> tuple[float, str]:
+        """Charges one call, returns (0, '') when allowed or (seconds to wait, limit scope) when not"""
+        # a cost above the burst could never be paid
+        cost = min(self._costs.get(method, 1), self._client_limit.burst)
+        method_limit = self._method_limits.get(method)
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            client = self._clients.get(client_id)
+            if client is None:
+                client = self._clients[client_id] = _Client(now)
+            else:
+                self._clients.move_to_end(client_id)
+                client.seen = now
+
+            if method_limit is not None:
+                method_bucket = client.buckets.get(method)
+                if method_bucket is None:
+                    method_bucket = client.buckets[method] = TokenBucket(method_limit, now)
+                # the method's own limit counts calls, the client bucket carries the cost
+                wait = method_bucket.take(method_limit, 1, now)
+                if wait:
+                    self.rejected += 1
+                    return wait, 'method'
+            client_bucket = client.buckets.get(None)
+            if client_bucket is None:
+                client_bucket = client.buckets[None] = TokenBucket(self._client_limit, now)
+            wait = client_bucket.take(self._client_limit, cost, now)
+            if wait:
+                if method_limit is not None:
+                    # the call never ran, give back what the method bucket charged
+                    method_bucket.tokens += 1
+                self.rejected += 1
+                return wait, 'client'
+            self.allowed += 1
+            return 0.0, ''
+
+    def stats(self) -> dict:
+        return {'clients': len(self._clients), 'allowed': self.allowed, 'rejected': self.rejected}
+
+    def _evict(self, now: float) -> None:
+        while len(self._clients) >= self._max_clients:
+            self._clients.popitem(last=False)
+        # oldest first, everything after the first recent client is more recent still
+        while self._clients and now - next(iter(self._clients.values())).seen > self._idle_seconds:
+            self._clients.popitem(last=False)
+
+
+class RateLimitInterceptor(grpc.ServerInterceptor):
+    """
+    Rejects calls over the caller's token bucket with RESOURCE_EXHAUSTED
+
+    The caller is the x-client-id metadata value, falling back to the peer
+    host. Rejections carry retry-after-ms trailing metadata with how long the
+    bucket needs to refill, and take no time on the worker thread beyond that.
+    Messages of a client stream are charged one by one, over the limit the
+    stream is slowed down rather than failed. Streams in per_operation carry
+    calls to other methods; only opening them is charged here, their
+    dispatcher charges each operation to its own method with wait().
+    """
+
+    def __init__(self, limiter: RateLimiter, per_operation: tuple[str, ...] = ('Session',)) -> None:
+        self.limiter = limiter
+        self._per_operation = frozenset(per_operation)
+
+    @classmethod
+    def from_env(cls) -> 'RateLimitInterceptor | None':
+        """
+        Builds the interceptor from RATE_LIMIT_* variables, None when RATE_LIMIT_RATE=0
+
+            RATE_LIMIT_RATE=100 RATE_LIMIT_BURST=200       tokens per second and capacity per client
+            RATE_LIMIT_METHODS=ListPatrons=2:10            per method calls per second and burst
+            RATE_LIMIT_COSTS=ListPatrons=5,SearchPatrons=3 replaces DEFAULT_COSTS
+        """
+        rate = float(os.getenv('RATE_LIMIT_RATE', '100'))
+        if rate <= 0:
+            return None
+        client_limit = RateLimit(rate, float(os.getenv('RATE_LIMIT_BURST', str(rate * 2))))
+        method_limits = {
+            method: _parse_method_limit(method, value)
+            for method, value in _parse_pairs(os.getenv('RATE_LIMIT_METHODS', ''))
+        }
+        costs = os.getenv('RATE_LIMIT_COSTS')
+        costs = {method: float(value) for method, value in _parse_pairs(costs)} if costs is not None else None
+        limiter = RateLimiter(
+            client_limit,
+            method_limits,
+            costs,
+            max_clients=int(os.getenv('RATE_LIMIT_MAX_CLIENTS', '10000'))
+        )
+        return cls(limiter)
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit('/', 1)[-1]
+        metadata = handler_call_details.invocation_metadata
+
+        streaming = (handler.stream_unary or handler.stream_stream) and method not in self._per_operation
+
+        def wrapper(behavior):
+            @wraps(behavior)
+            def limited(request, context):
+                client = client_id(metadata, context.peer())
+                wait, scope = self.limiter.acquire(client, method)
+                if wait:
+                    context.set_trailing_metadata(((RETRY_AFTER_METADATA_KEY, str(math.ceil(wait * 1000))),))
+                    context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f'rate limit exceeded ({scope})')
+                if streaming:
+                    request = self._throttle(request, client, method)
+                return behavior(request, context)
+            return limited
+
+        return wrap_rpc_method_handler(handler, wrapper)
+
+    def wait(self, client: str, method: str, context=None) -> bool:
+        """Charges one call, sleeping until the buckets allow it; False when context ended meanwhile"""
+        wait, _ = self.limiter.acquire(client, method)
+        while wait:
+            if context is not None and not context.is_active():
+                return False
+            # not reading is what slows the client down, grpc flow control does the rest
+            time.sleep(wait)
+            wait, _ = self.limiter.acquire(client, method)
+        return True
+
+    def _throttle(self, requests, client: str, method: str):
+        """Charges every streamed message like a call, holding the next one back until the bucket refills"""
+        for request in requests:
+            self.wait(client, method)
+            yield request
+
+
+def client_id(metadata, peer: str) -> str:
+    """The caller buckets are kept for, x-client-id or else the peer host"""
+    return metadata_value(metadata, CLIENT_ID_METADATA_KEY) or _peer_host(peer)
+
+
+def _peer_host(peer: str) -> str:
+    # ipv4:10.0.0.1:53712 / ipv6:[::1]:53712, every connection from a host shares its buckets
+    host = peer.rsplit(':', 1)[0]
+    return host if host.count(':') else peer
+
+
+def _parse_method_limit(method: str, value: str) -> RateLimit:
+    parts = value.split(':')
+    try:
+        limit = RateLimit(*(float(part) for part in parts)) if len(parts) == 2 else None
+    except ValueError:
+        limit = None
+    # a rate of 0 would never refill, there is no sensible reading of it
+    if limit is None or limit.rate <= 0 or limit.burst <= 0:
+        raise ValueError(
+            f'RATE_LIMIT_METHODS: {method}={value} must be calls per second and burst, both above 0, e.g. {method}=2:10'
+        )
+    return limit
+
+
+def _parse_pairs(value: str) -> list[tuple[str, str]]:
+    pairs = []
+    for item in value.split(','):
+        if '=' in item:
+            key, _, item_value = item.partition('=')
+            pairs.append((key.strip(), item_value.strip()))
+    return pairs
@@ -0,0 +1,42 @@
+from contextvars import ContextVar
+from functools import wraps
+
+import grpc
+
+from .base import wrap_rpc_method_handler, metadata_value
+
+
+SESSION_METADATA_KEY = 'x-session-id'
+
+# Identity of the client session making the current call, used for read-your-writes routing
+current_session: ContextVar[str | None] = ContextVar('current_session', default=None)
+
+
+class SessionInterceptor(grpc.ServerInterceptor):
+    """Sets current_session from x-session-id metadata, falling back to the peer address"""
+
+    def intercept_service(self, continuation, handler_call_details):
+        session = metadata_value(handler_call_details.invocation_metadata, SESSION_METADATA_KEY)
+        handler = continuation(handler_call_details)
+        streaming = handler is not None and (handler.unary_stream or handler.stream_stream)
+
+        def wrapper(behavior):
+            @wraps(behavior)
+            def with_session(request, context):
+                token = current_session.set(session or context.peer())
+                try:
+                    return behavior(request, context)
+                finally:
+                    current_session.reset(token)
+
+            @wraps(behavior)
+            def with_session_stream(request, context):
+                # a response stream runs its body while grpc iterates it, after behavior returned
+                token = current_session.set(session or context.peer())
+                try:
+                    yield from behavior(request, context)
+                finally:
+                    current_session.reset(token)
+            return with_session_stream if streaming else with_session
+
+        return wrap_rpc_method_handler(handler, wrapper)
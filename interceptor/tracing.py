@@ -0,0 +1,46 @@
+from functools import wraps
+
+import grpc
+
+from tracing import TRACEPARENT_METADATA_KEY, get_tracer, activate, deactivate
+from .base import wrap_rpc_method_handler, metadata_value
+
+
+class TracingInterceptor(grpc.ServerInterceptor):
+    """
+    Starts the root span of each unary call, continuing an incoming traceparent
+
+    With tracing off the handler is returned untouched, so calls pay nothing.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        tracer = get_tracer()
+        if not tracer.enabled or handler is None or not handler.unary_unary:
+            return handler
+
+        method = handler_call_details.method
+        traceparent = metadata_value(handler_call_details.invocation_metadata, TRACEPARENT_METADATA_KEY)
+
+        def wrapper(behavior):
+            @wraps(behavior)
+            def with_span(request, context):
+                span = tracer.start_root_span(method, traceparent, {'rpc.method': method})
+                if span is None:
+                    return behavior(request, context)
+                token = activate(span)
+                try:
+                    response = behavior(request, context)
+                    code = context.code()
+                    if code not in (None, grpc.StatusCode.OK):
+                        span.set_error(code.name)
+                    return response
+                except Exception as e:
+                    span.set_error(str(e))
+                    raise
+                finally:
+                    deactivate(token)
+                    span.end()
+            return with_span
+
+        return wrap_rpc_method_handler(handler, wrapper)
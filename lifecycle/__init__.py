@@ -0,0 +1,4 @@
+from .startup import StartupTimer, warm_up
+from .shutdown import GracefulShutdown
+
+__all__ = ['startup', 'shutdown']
@@ -0,0 +1,152 @@
+import json
+import os
+import signal
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import grpc
+
+
+DEFAULT_REPORT_PATH = 'logs/shutdown_report.json'
+
+
+class GracefulShutdown:
+    """
+    Drains the server and closes everything start_server opened, once
+
+    Health goes NOT_SERVING first, and after delay_seconds, time for load
+    balancers to notice, the server stops accepting calls and gives the ones
+    in flight up to grace_seconds to finish. Calls still running then are
+    cancelled and reported as dropped. Workers are stopped in reverse start
+    order, flushing what they buffer, and the database connections are
+    closed last.
+    """
+
+    def __init__(
+        self,
+        server: 'grpc.Server',
+        workers: list,
+        health=None,
+        executor=None,
+        connections: list | None = None,
+        grace_seconds: float = 20.0,
+        delay_seconds: float = 0.0,
+        worker_timeout: float = 5.0
+    ) -> None:
+        self._server = server
+        self._workers = workers
+        self._health = health
+        self._executor = executor
+        self._connections = connections or []
+        self._grace_seconds = grace_seconds
+        self._delay_seconds = delay_seconds
+        self._worker_timeout = worker_timeout
+        self._started = threading.Lock()
+        self._finished = threading.Event()
+        self._report: dict[str, Any] = {}
+
+    @classmethod
+    def from_env(cls, server: 'grpc.Server', workers: list, **kwargs) -> 'GracefulShutdown':
+        """SHUTDOWN_GRACE_SECONDS (default 20) and SHUTDOWN_DELAY_SECONDS (default 0)"""
+        return cls(
+            server,
+            workers,
+            grace_seconds=float(os.getenv('SHUTDOWN_GRACE_SECONDS', '20')),
+            delay_seconds=float(os.getenv('SHUTDOWN_DELAY_SECONDS', '0')),
+            **kwargs
+        )
+
+    def install_signal_handlers(self) -> None:
+        """SIGTERM and SIGINT start the drain, a second one stops the server without waiting"""
+        def handle(signum, frame):
+            if self._started.locked():
+                self._server.stop(0)
+                return
+            print(f'received {signal.Signals(signum).name}, draining for up to {self._grace_seconds:g}s')
+            threading.Thread(target=self.run, name='shutdown', daemon=True).start()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
+
+    def run(self) -> dict[str, Any]:
+        """Shuts down, or waits for the shutdown already under way; returns the report"""
+        if not self._started.acquire(blocking=False):
+            self._finished.wait()
+            return self._report
+        try:
+            self._report = self._shutdown()
+        finally:
+            self._finished.set()
+        return self._report
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def report(self) -> dict[str, Any]:
+        return self._report
+
+    def write_report(self, path: str | None = None) -> str:
+        """Writes the report as json to path, SHUTDOWN_REPORT_PATH or the default location"""
+        path = path or os.getenv('SHUTDOWN_REPORT_PATH', DEFAULT_REPORT_PATH)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self._report, f, indent=2)
+        return path
+
+    def _shutdown(self) -> dict[str, Any]:
+        start = time.perf_counter()
+        if self._health is not None:
+            self._health.stop()
+        if self._delay_seconds:
+            time.sleep(self._delay_seconds)
+
+        in_flight = self._in_flight()
+        drain_start = time.perf_counter()
+        stopped = self._server.stop(self._grace_seconds)
+        dropped = 0
+        if not stopped.wait(self._grace_seconds):
+            # grpc cancels these now, their handlers may still run on but the clients are gone
+            dropped = self._in_flight()
+            stopped.wait()
+        drain_ms = (time.perf_counter() - drain_start) * 1000
+
+        # reverse start order, the span exporter started first and flushes the others' spans
+        workers = {}
+        for worker in reversed(self._workers):
+            worker_start = time.perf_counter()
+            try:
+                worker.stop(self._worker_timeout)
+                ok = True
+            except Exception as e:
+                print(f'stopping {type(worker).__name__} failed', e)
+                ok = False
+            workers[type(worker).__name__] = {
+                'duration_ms': round((time.perf_counter() - worker_start) * 1000, 3), 'ok': ok
+            }
+
+        closed = 0
+        for db in self._connections:
+            try:
+                db.close()
+                closed += 1
+            except Exception as e:
+                print('closing a database connection failed', e)
+        from repository.mongodb_database import disconnect_mongodb
+        disconnect_mongodb()
+
+        return {
+            'total_ms': round((time.perf_counter() - start) * 1000, 3),
+            'drain_ms': round(drain_ms, 3),
+            'grace_seconds': self._grace_seconds,
+            'in_flight_calls': in_flight,
+            'dropped_calls': dropped,
+            'workers': workers,
+            'connections_closed': closed,
+        }
+
+    def _in_flight(self) -> int:
+        return self._executor.in_flight() if self._executor is not None else 0
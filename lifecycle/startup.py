@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+import time
+from concurrent import futures
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+DEFAULT_REPORT_PATH = 'logs/startup_report.json'
+
+
+class StartupTimer:
+    """Records how long each startup phase took, relative to when the timer was created"""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._phases: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the wrapped block, phases may run concurrently on several threads"""
+        start = time.perf_counter()
+        ok = True
+        try:
+            yield
+        except Exception:
+            ok = False
+            raise
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._phases.append({
+                    'phase': name,
+                    'start_ms': round((start - self._origin) * 1000, 3),
+                    'duration_ms': round((end - start) * 1000, 3),
+                    'ok': ok,
+                })
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            phases = sorted(self._phases, key=lambda p: p['start_ms'])
+        return {'total_ms': round(self.elapsed_ms(), 3), 'phases': phases}
+
+    def write_report(self, path: str | None = None) -> str:
+        """Writes the report as json to path, STARTUP_REPORT_PATH or the default location"""
+        path = path or os.getenv('STARTUP_REPORT_PATH', DEFAULT_REPORT_PATH)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+
+def warm_up(timer: StartupTimer, tasks: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """
+    Runs the warm up tasks in parallel, each timed as its own phase
+
+    A failing task is reported and its result is None so the remaining
+    subsystems can still come up.
+    """
+    def run(name: str, task: Callable[[], Any]) -> Any:
+        with timer.phase(name):
+            return task()
+
+    results = {}
+    with futures.ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+        pending = {name: executor.submit(run, name, task) for name, task in tasks.items()}
+        for name, future in pending.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f'warm up of {name} failed', e)
+                results[name] = None
+    return results
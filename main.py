@@ -1,23 +1,39 @@
-import grpc
+import os
 from concurrent import futures
+from typing import TYPE_CHECKING
 
-from repository import BookRepository, connect_db
-from controller import Library
-from handler import LibraryGRPCHandler
-from protogen import LibraryServicer, add_LibraryServicer_to_server
+from lifecycle import StartupTimer, GracefulShutdown, warm_up
+
+if TYPE_CHECKING:
+    import grpc
+    from protogen import LibraryServicer
 
 
 DEFAULT_PORT = 50051
 DEBUG_PORT = 50052
 
 
-def build_grpc_server(servicer: LibraryServicer) -> grpc.Server:
+def build_grpc_server(servicer: 'LibraryServicer', executor: futures.ThreadPoolExecutor | None = None) -> 'grpc.Server':
     """Builds the grpc server with the specified library servicer"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    import grpc
+    from protogen import add_LibraryServicer_to_server
+    from interceptor import SessionInterceptor, TracingInterceptor, RateLimitInterceptor, IdempotencyInterceptor
+
+    # the rate limiter goes first so rejected calls skip tracing and session setup
+    rate_limit = RateLimitInterceptor.from_env()
+    idempotency = IdempotencyInterceptor.from_env()
+    interceptors = [TracingInterceptor(), SessionInterceptor(), idempotency]
+    server = grpc.server(
+        executor or futures.ThreadPoolExecutor(max_workers=10),
+        interceptors=[rate_limit, *interceptors] if rate_limit else interceptors
+    )
+    if hasattr(servicer, 'configure_session'):
+        # Session operations skip the interceptors, it applies their per method rules itself
+        servicer.configure_session(rate_limit, idempotency)
     add_LibraryServicer_to_server(servicer, server)
     return server
 
-def register_ports(server: grpc.Server, *args) -> tuple[int]:
+def register_ports(server: 'grpc.Server', *args) -> tuple[int]:
     """Registers all ports provided by args and returns all ports assigned"""
     ports = []
     for port in args:
@@ -25,21 +41,279 @@ def register_ports(server: grpc.Server, *args) -> tuple[int]:
     return tuple(ports)
 
 
-if __name__ == '__main__':
+def _warm_mysql():
+    from repository import connect_db
+    return connect_db()
+
+def _warm_request_mysql():
+    # request threads commit and roll back independently, each gets a connection of its own
+    from repository import connect_db, connect_per_thread
+    return connect_per_thread(connect_db)
+
+def _warm_book_shards() -> list:
+    from functools import partial
+    from repository import connect_url, connect_per_thread
+    urls = [url.strip() for url in os.getenv('MYSQL_SHARDS', '').split(',') if url.strip()]
+    return [connect_per_thread(partial(connect_url, url)) for url in urls]
+
+def _warm_shard_directory():
+    from functools import partial
+    from repository import connect_url, connect_per_thread
+    url = os.getenv('MYSQL_SHARD_DIRECTORY')
+    return connect_per_thread(partial(connect_url, url)) if url else None
+
+def _require_shards(warmed: dict) -> None:
+    """Refuses to start with a shard missing, its books would fail on first use instead"""
+    shards = warmed.get('book_shards') or []
+    missing = [str(i) for i, db in enumerate(shards) if db is None]
+    if not shards or missing:
+        raise ConnectionError(f"could not connect to book shard(s) {', '.join(missing) or 'in MYSQL_SHARDS'}")
+    if os.getenv('MYSQL_SHARD_DIRECTORY') and warmed.get('shard_directory') is None:
+        raise ConnectionError('could not connect to the isbn directory in MYSQL_SHARD_DIRECTORY')
+
+def _replica_urls() -> list[str]:
+    return [url.strip() for url in os.getenv('MYSQL_REPLICAS', '').split(',') if url.strip()]
+
+def _warm_book_replicas() -> list:
+    # autocommit so no read pins a snapshot, the replicas only ever serve reads
+    # a connection per request thread, a gtid wait and the read it guards run on the same one
+    from functools import partial
+    from repository import connect_url, connect_per_thread
+    return [connect_per_thread(partial(connect_url, url, autocommit=True)) for url in _replica_urls()]
+
+def _warm_book_replica_monitors() -> list:
+    # the lag check thread gets connections of its own, the same replicas in the same order
+    from repository import connect_url
+    return [connect_url(url, autocommit=True) for url in _replica_urls()]
+
+def _warm_mongodb() -> bool:
+    # no ping, the client finds the servers in the background and the patron calls answer UNAVAILABLE until it has
+    from repository.mongodb_database import connect_mongodb
+    return connect_mongodb(wait=False)
+
+def _warm_isbn_filter():
+    # scans on connections of its own and closes them, the request connections warm meanwhile
+    from cache.isbn_filter import IsbnFilter, DEFAULT_FILTER_PATH
+    from repository import BookRepository, ShardedBookRepository, connect_db, connect_shards
+    connections = connect_shards() if os.getenv('MYSQL_SHARDS') else [connect_db()]
     try:
-        # setup api stack
-        db = connect_db()
-        repo = BookRepository(db)
-        controller = Library(repo)
-        handler = LibraryGRPCHandler(controller)
-
-        # create grpc server
-        server = build_grpc_server(handler)
-        ports = register_ports(server, DEFAULT_PORT, DEBUG_PORT)
+        if not connections or None in connections:
+            return None
+        repo = ShardedBookRepository(connections) if os.getenv('MYSQL_SHARDS') else BookRepository(connections[0])
+        return IsbnFilter.load_or_build(os.getenv('ISBN_FILTER_PATH', DEFAULT_FILTER_PATH), repo)
+    finally:
+        for db in connections:
+            if db is not None:
+                db.close()
+
+def _warm_stats_connections() -> list:
+    # the reconciler counts on connections of its own, its commits must not land in a request's transaction
+    from repository import connect_db, connect_shards
+    return connect_shards() if os.getenv('MYSQL_SHARDS') else [connect_db()]
+
+def _warm_handler():
+    # protogen and the grpc stubs are the heaviest imports, load them alongside the db connects
+    from handler import LibraryGRPCHandler
+    return LibraryGRPCHandler
+
+def _trace_connections(warmed: dict) -> dict:
+    """Wraps every warmed MySQL connection so statements are recorded as spans"""
+    from tracing import TracedConnection
+
+    def wrap(db):
+        return TracedConnection(db) if db is not None else None
+
+    traced = dict(warmed)
+    for name in ('mysql', 'mysql_outbox', 'mysql_checkout', 'shard_directory'):
+        if traced.get(name) is not None:
+            traced[name] = wrap(traced[name])
+    for name in ('book_shards', 'book_replicas'):
+        if traced.get(name):
+            traced[name] = [wrap(db) for db in traced[name]]
+    return traced
+
+def _connections(warmed: dict) -> list:
+    """Every MySQL connection opened during warm up, for the shutdown to close"""
+    connections = [warmed.get(name) for name in ('mysql', 'mysql_outbox', 'mysql_checkout', 'shard_directory')]
+    for name in ('book_shards', 'book_replicas', 'book_replica_monitors', 'stats_connections'):
+        connections.extend(warmed.get(name) or [])
+    return [db for db in connections if db is not None]
+
+def _outbox(warmed: dict, shadow_table: str | None = None):
+    """The request side OutboxRepository, None when its connection could not be opened"""
+    from repository.outbox_repository import OutboxRepository
+    db = warmed.get('mysql_checkout')
+    return OutboxRepository(db, shadow_table=shadow_table) if db is not None else None
+
+def _stats_repository(connections: list | None, sharded: bool):
+    """Books as the stats reconciler counts them, None when its connections could not be opened"""
+    from repository import BookRepository, ShardedBookRepository
+    if not connections or None in connections:
+        return None
+    # counts come from books itself, also behind replicas or while ids are being migrated
+    return ShardedBookRepository(connections) if sharded else BookRepository(connections[0])
+
+def start_server(
+    timer: StartupTimer,
+    *ports: int,
+    debug_port: int | None = None
+) -> tuple['grpc.Server', tuple[int], list, GracefulShutdown]:
+    """
+    Brings up the api stack and starts serving
+
+    Heavy imports and db connections are warmed in parallel, the server
+    only starts accepting calls once every subsystem is ready. The debug port,
+    when given, serves the diagnostics service from a separate server. Returns
+    the server, the assigned ports, the background workers that were started
+    and the GracefulShutdown that drains and closes all of it.
+    """
+    with timer.phase('tracing'):
+        # before warm up so the mongo command listener is in place when the client is created
+        from tracing import configure_from_env
+        span_exporter = configure_from_env()
+
+    sharded = bool(os.getenv('MYSQL_SHARDS'))
+    tasks = {
+        'mongodb': _warm_mongodb,
+        'handler': _warm_handler,
+    }
+    if sharded:
+        tasks['book_shards'] = _warm_book_shards
+        tasks['shard_directory'] = _warm_shard_directory
+    else:
+        tasks['mysql'] = _warm_request_mysql
+        # the outbox worker polls on its own connection, request threads keep theirs
+        tasks['mysql_outbox'] = _warm_mysql
+        # checkout transactions are serialized on a connection no other thread commits on
+        tasks['mysql_checkout'] = _warm_mysql
+        tasks['book_replicas'] = _warm_book_replicas
+        tasks['book_replica_monitors'] = _warm_book_replica_monitors
+    tasks['stats_connections'] = _warm_stats_connections
+    if os.getenv('ISBN_FILTER', 'on') != 'off':
+        tasks['isbn_filter'] = _warm_isbn_filter
+    warmed = warm_up(timer, tasks)
+    if span_exporter:
+        warmed = _trace_connections(warmed)
+
+    with timer.phase('build'):
+        from repository import (
+            BookRepository, ShardedBookRepository, ReplicaRouter, ReplicatedBookRepository, MigratingBookRepository
+        )
+        from repository.migrating_book_repository import SHADOW_TABLE
+        from repository.outbox_repository import OutboxRepository
+        from repository.patron_repository import PatronRepository
+        from controller import Library
+        from worker import OutboxWorker, StatsReconciler, IsbnFilterSaver, MembershipExpiryWorker
+        from stats import LibraryCounters
+        from cache import SingleFlight
+        from cache.isbn_filter import DEFAULT_FILTER_PATH
+        from interceptor import current_session
+        from diagnostics import DiagnosticsServer, InstrumentedThreadPoolExecutor
+        from handler import DiagnosticsGRPCHandler, HealthGRPCHandler
+        from protogen import add_HealthServicer_to_server
+
+        workers = [span_exporter] if span_exporter else []
+
+        counters = LibraryCounters()
+        singleflight = SingleFlight(timeout=float(os.getenv('SINGLEFLIGHT_TIMEOUT_SECONDS', '5')))
+        isbn_filter = warmed.get('isbn_filter')
+        patron_repo = PatronRepository(counters) if warmed['mongodb'] else None
+        if sharded:
+            _require_shards(warmed)
+            # the outbox lives next to a single books table, sharded storage runs without it
+            repo = ShardedBookRepository(warmed['book_shards'], warmed['shard_directory'])
+            controller = Library(repo, patron_repo, None, counters, singleflight, isbn_filter)
+        elif warmed['book_replicas']:
+            monitors = warmed['book_replica_monitors'] or [None] * len(warmed['book_replicas'])
+            # a replica whose lag can not be checked would never count as healthy, leave it out
+            connected = [
+                (replica, monitor) for replica, monitor in zip(warmed['book_replicas'], monitors)
+                if replica is not None and monitor is not None
+            ]
+            router = ReplicaRouter(
+                warmed['mysql'],
+                [replica for replica, _ in connected],
+                [monitor for _, monitor in connected],
+                max_lag_seconds=float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5')),
+                consistency=os.getenv('READ_YOUR_WRITES', 'window'),
+                window_seconds=float(os.getenv('READ_YOUR_WRITES_WINDOW_SECONDS', '2'))
+            )
+            workers.append(router)
+            repo = ReplicatedBookRepository(router, current_session.get)
+            outbox = _outbox(warmed)
+            controller = Library(repo, patron_repo, outbox, counters, singleflight, isbn_filter)
+        elif os.getenv('BOOKS_ID_MIGRATION', 'off') != 'off':
+            # char(36) -> binary(16) switch in progress, see scripts/migrate-book-ids.py
+            repo = MigratingBookRepository(warmed['mysql'], os.getenv('BOOKS_ID_MIGRATION'))
+            outbox = _outbox(warmed, shadow_table=SHADOW_TABLE)
+            controller = Library(repo, patron_repo, outbox, counters, singleflight, isbn_filter)
+        else:
+            repo = BookRepository(warmed['mysql'])
+            outbox = _outbox(warmed)
+            controller = Library(repo, patron_repo, outbox, counters, singleflight, isbn_filter)
+        # recounts on its own thread, starting with a first pass that seeds the counters
+        workers.append(StatsReconciler(
+            counters,
+            _stats_repository(warmed['stats_connections'], sharded),
+            patron_repo,
+            interval=float(os.getenv('STATS_RECONCILE_SECONDS', '300'))
+        ))
+        if isbn_filter is not None:
+            workers.append(IsbnFilterSaver(
+                isbn_filter,
+                os.getenv('ISBN_FILTER_PATH', DEFAULT_FILTER_PATH),
+                interval=float(os.getenv('ISBN_FILTER_SAVE_SECONDS', '600'))
+            ))
+        handler = warmed['handler'](controller)
+        executor = InstrumentedThreadPoolExecutor(max_workers=10, thread_name_prefix='grpc-worker')
+        server = build_grpc_server(handler, executor)
+        health = HealthGRPCHandler()
+        add_HealthServicer_to_server(health, server)
+        assigned = register_ports(server, *ports)
+        outbox_worker = None
+        if patron_repo and warmed.get('mysql_outbox'):
+            outbox_worker = OutboxWorker(OutboxRepository(warmed['mysql_outbox']), patron_repo)
+        if debug_port is not None:
+            debug_server = DiagnosticsServer(DiagnosticsGRPCHandler(executor, singleflight, outbox_worker), debug_port)
+            assigned += (debug_server.port,)
+            workers.append(debug_server)
+
+        if patron_repo:
+            workers.append(MembershipExpiryWorker(
+                patron_repo,
+                interval=float(os.getenv('MEMBERSHIP_EXPIRY_SECONDS', '3600')),
+                batch_size=int(os.getenv('MEMBERSHIP_EXPIRY_BATCH', '1000'))
+            ))
+        if outbox_worker is not None:
+            workers.append(outbox_worker)
+        shutdown = GracefulShutdown.from_env(
+            server, workers, health=health, executor=executor, connections=_connections(warmed)
+        )
+
+    with timer.phase('start'):
         server.start()
-        print(f'server listening on ports {ports}')
+        for worker in workers:
+            worker.start()
+        # serving only once every worker is up
+        health.start()
+    return server, assigned, workers, shutdown
+
+
+if __name__ == '__main__':
+    try:
+        timer = StartupTimer()
+        server, ports, workers, shutdown = start_server(timer, DEFAULT_PORT, debug_port=DEBUG_PORT)
+        shutdown.install_signal_handlers()
+        report_path = timer.write_report()
+        print(f'server listening on ports {ports}, ready in {timer.elapsed_ms():.1f}ms (report: {report_path})')
         server.wait_for_termination()
+        # the server stops first, workers and connections are closed after it
+        report = shutdown.run()
+        report_path = shutdown.write_report()
+        print(
+            f"drained in {report['drain_ms']:.1f}ms, {report['dropped_calls']} of "
+            f"{report['in_flight_calls']} in-flight calls dropped (report: {report_path})"
+        )
 
     except Exception as e:
         print('Application failed to start', e)
-
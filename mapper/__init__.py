@@ -1,4 +1,6 @@
-from .book import bookProtoToModel, bookModelToProto
+from .book import bookProtoToModel, bookModelToProto, bookRowsToProto, bookRequestToId, batchOutcomesToProto
+from .patron import patronProtoToModel, patronModelToProto, patronDocumentsToProto, timestampToDatetime
 
-__all__ = ['book']
+from .stats import libraryStatsToProto
 
+__all__ = ['book', 'patron', 'stats']
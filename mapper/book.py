@@ -1,6 +1,18 @@
-from models import Book as mBook
-from protogen import Book as pBook
+from typing import Iterable
 
+from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
+
+from tracing import traced
+from models import Book as mBook, BatchOutcome, IDType
+from protogen import Book as pBook, BatchBookResult, ErrorCode, GetBookRequest
+
+
+BATCH_OUTCOME_ERRORS = {
+    BatchOutcome.NOT_FOUND: {'message': 'Book not found', 'code': ErrorCode.ERR_CODE_NOT_FOUND},
+    BatchOutcome.CONFLICT: {'message': 'Book already in requested state', 'code': ErrorCode.ERR_CODE_BAD_REQUEST},
+}
+
+@traced('mapper.bookProtoToModel')
 def bookProtoToModel(book: pBook) -> mBook:
     return mBook(
         book.uuid,
@@ -12,6 +24,52 @@ def bookProtoToModel(book: pBook) -> mBook:
     )
 
 
+@traced('mapper.bookModelToProto')
 def bookModelToProto(book: mBook) -> pBook:
-    return pBook(*book.get_tuple())
+    return pBook(
+        uuid=book.id,
+        title=book.title,
+        author=book.author,
+        description=book.description,
+        isbn_number=book.isbn_number,
+        checked_out=book.checked_out
+    )
+
+
+@traced('mapper.bookRowsToProto')
+def bookRowsToProto(rows: Iterable[tuple], books: RepeatedCompositeFieldContainer[pBook]) -> None:
+    """Fills a repeated Book field straight from db rows in Book field order, no model per row"""
+    add = books.add
+    for id, title, author, description, isbn_number, checked_out in rows:
+        add(
+            uuid=id,
+            title=title,
+            author=author,
+            description=description,
+            isbn_number=isbn_number,
+            checked_out=checked_out
+        )
+
+
+def bookRequestToId(request: GetBookRequest) -> tuple[str | int, IDType]:
+    if request.WhichOneof('uuid_or_isbn') == 'isbn_number':
+        return request.isbn_number, IDType.ISBN
+    return request.uuid, IDType.UUID
+
 
+@traced('mapper.batchOutcomesToProto')
+def batchOutcomesToProto(
+    ids: Iterable[str | int],
+    outcomes: dict[str | int, BatchOutcome],
+    id_type: IDType,
+    results: RepeatedCompositeFieldContainer[BatchBookResult]
+) -> None:
+    """Appends one result per requested id, in request order"""
+    key = 'isbn_number' if id_type == IDType.ISBN else 'uuid'
+    add = results.add
+    for id in ids:
+        err = BATCH_OUTCOME_ERRORS.get(outcomes.get(id, BatchOutcome.NOT_FOUND))
+        if err:
+            add(**{key: id}, err=err)
+        else:
+            add(**{key: id})
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from tracing import traced
+from models import Patron as mPatron
+from protogen import Patron as pPatron, MembershipType
+
+
+MEMBERSHIP_TYPE_TO_PROTO = {
+    'student': MembershipType.MEMBERSHIP_TYPE_STUDENT,
+    'faculty': MembershipType.MEMBERSHIP_TYPE_FACULTY,
+    'community': MembershipType.MEMBERSHIP_TYPE_COMMUNITY,
+    'premium': MembershipType.MEMBERSHIP_TYPE_PREMIUM,
+}
+MEMBERSHIP_TYPE_FROM_PROTO = {value: key for key, value in MEMBERSHIP_TYPE_TO_PROTO.items()}
+
+# Timestamp field -> deprecated ISO 8601 string field it replaces
+DATE_FIELDS = (
+    ('membership_start_time', 'membership_start_date'),
+    ('membership_end_time', 'membership_end_date'),
+    ('create_time', 'created_at'),
+    ('update_time', 'updated_at'),
+)
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_date(value: str) -> datetime | None:
+    # strings with an offset become naive utc, the form every other patron date is compared in
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _timestamp(value: datetime) -> dict:
+    # naive datetimes from bson are utc. Done by hand, Timestamp.FromDatetime is ~2.5x slower
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - EPOCH
+    return {'seconds': delta.days * 86400 + delta.seconds, 'nanos': delta.microseconds * 1000}
+
+
+def _date_fields(dates: tuple, legacy_dates: bool) -> dict:
+    """Message kwargs for the four patron dates, in DATE_FIELDS order"""
+    fields = {}
+    for (timestamp_field, legacy_field), value in zip(DATE_FIELDS, dates):
+        if value is None:
+            continue
+        fields[timestamp_field] = _timestamp(value)
+        if legacy_dates:
+            fields[legacy_field] = value.isoformat()
+    return fields
+
+
+def timestampToDatetime(patron_or_request, timestamp_field: str, legacy_field: str) -> datetime | None:
+    """Reads a date preferring the Timestamp field, falling back to the legacy ISO 8601 string"""
+    if patron_or_request.HasField(timestamp_field):
+        timestamp: Timestamp = getattr(patron_or_request, timestamp_field)
+        return EPOCH + timedelta(seconds=timestamp.seconds, microseconds=timestamp.nanos // 1000)
+    return _parse_date(getattr(patron_or_request, legacy_field))
+
+
+@traced('mapper.patronProtoToModel')
+def patronProtoToModel(patron: pPatron) -> mPatron:
+    membership_start_date, membership_end_date, created_at, updated_at = (
+        timestampToDatetime(patron, timestamp_field, legacy_field) for timestamp_field, legacy_field in DATE_FIELDS
+    )
+    return mPatron(
+        id=patron.id or None,
+        first_name=patron.first_name,
+        last_name=patron.last_name,
+        email=patron.email,
+        phone=patron.phone or None,
+        address=patron.address or None,
+        membership_type=MEMBERSHIP_TYPE_FROM_PROTO[patron.membership_type],
+        membership_start_date=membership_start_date,
+        membership_end_date=membership_end_date,
+        books_checked_out=list(patron.books_checked_out),
+        total_books_borrowed=patron.total_books_borrowed,
+        active=patron.active,
+        created_at=created_at,
+        updated_at=updated_at
+    )
+
+
+@traced('mapper.patronModelToProto')
+def patronModelToProto(patron: mPatron, legacy_dates: bool = False) -> pPatron:
+    """Maps a patron, legacy_dates also fills the deprecated ISO 8601 string fields for old clients"""
+    return pPatron(
+        id=patron.id,
+        first_name=patron.first_name,
+        last_name=patron.last_name,
+        email=patron.email,
+        phone=patron.phone,
+        address=patron.address,
+        membership_type=MEMBERSHIP_TYPE_TO_PROTO[patron.membership_type],
+        books_checked_out=patron.books_checked_out,
+        total_books_borrowed=patron.total_books_borrowed,
+        active=patron.active,
+        **_date_fields(
+            (patron.membership_start_date, patron.membership_end_date, patron.created_at, patron.updated_at),
+            legacy_dates
+        )
+    )
+
+
+@traced('mapper.patronDocumentsToProto')
+def patronDocumentsToProto(
+    documents: Iterable[dict],
+    patrons: RepeatedCompositeFieldContainer[pPatron],
+    legacy_dates: bool = False
+) -> None:
+    """Fills a repeated Patron field straight from mongo documents, no model per document"""
+    add = patrons.add
+    for doc in documents:
+        get = doc.get
+        add(
+            id=str(doc['_id']),
+            first_name=doc['first_name'],
+            last_name=doc['last_name'],
+            email=doc['email'],
+            phone=get('phone'),
+            address=get('address'),
+            membership_type=MEMBERSHIP_TYPE_TO_PROTO[doc['membership_type']],
+            books_checked_out=get('books_checked_out', ()),
+            total_books_borrowed=get('total_books_borrowed', 0),
+            active=get('active', True),
+            **_date_fields(
+                (doc['membership_start_date'], get('membership_end_date'), doc['created_at'], doc['updated_at']),
+                legacy_dates
+            )
+        )
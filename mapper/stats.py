@@ -0,0 +1,22 @@
+from tracing import traced
+from models import LibraryStats
+from protogen import GetLibraryStatsResponse
+
+from .patron import _timestamp
+
+
+@traced('mapper.libraryStatsToProto')
+def libraryStatsToProto(stats: LibraryStats) -> GetLibraryStatsResponse:
+    # counters can dip below zero between a missed write and the next recount
+    fields = {
+        'total_books': max(stats.total_books, 0),
+        'checked_out_books': max(stats.checked_out_books, 0),
+        'total_patrons': max(stats.total_patrons, 0),
+        'active_patrons': max(stats.active_patrons, 0),
+        'patrons_by_membership_type': {
+            name: count for name, count in stats.patrons_by_membership_type.items() if count > 0
+        },
+    }
+    if stats.reconciled_at is not None:
+        fields['reconcile_time'] = _timestamp(stats.reconciled_at)
+    return GetLibraryStatsResponse(**fields)
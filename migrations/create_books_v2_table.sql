@@ -0,0 +1,10 @@
+create table `books`.`books_v2` (
+    id binary(16),
+    title varchar(255),
+    author varchar(255),
+    description varchar(4095),
+    checked_out bool,
+    isbn_number bigint,
+    primary key (id),
+    unique (isbn_number)
+);
@@ -0,0 +1,5 @@
+create table `books`.`isbn_directory` (
+    isbn_number bigint,
+    shard int,
+    primary key (isbn_number)
+);
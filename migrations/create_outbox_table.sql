@@ -0,0 +1,11 @@
+create table `books`.`patron_outbox` (
+    id bigint auto_increment,
+    event_type varchar(16),
+    patron_id char(24),
+    book_id char(36),
+    attempts int default 0,
+    created_at timestamp(6) default current_timestamp(6),
+    applied_at timestamp(6) null,
+    primary key (id),
+    key pending (applied_at, attempts, id)
+);
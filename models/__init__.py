@@ -1,6 +1,15 @@
 from .book import Book
-from .patron import Patron
-from .enums import IDType
+from .enums import IDType, BatchOutcome
+from .outbox import OutboxEvent, OutboxEventType
+from .ids import uuid7
+from .stats import LibraryStats
 
-__all__ = ['book', 'patron', 'enums']
+__all__ = ['book', 'patron', 'enums', 'outbox', 'ids', 'stats']
 
+
+def __getattr__(name):
+    # Patron pulls in bson, only load it once something asks for it
+    if name == 'Patron':
+        from .patron import Patron
+        return Patron
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
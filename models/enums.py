@@ -4,3 +4,8 @@ class IDType(Enum):
     UUID = 1
     ISBN = 2
 
+
+class BatchOutcome(Enum):
+    OK = 1
+    NOT_FOUND = 2
+    CONFLICT = 3  # book was already in the requested state
@@ -0,0 +1,35 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Time ordered UUID (RFC 9562 version 7)
+
+    48 bits of unix milliseconds, a 12 bit counter and 62 random bits. The counter
+    starts at a random value every millisecond and is incremented for ids made in
+    the same millisecond, so ids from one process are strictly increasing even if
+    the clock steps back.
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            # top bit clear leaves at least 2048 increments before the counter wraps
+            _counter = int.from_bytes(os.urandom(2), 'big') & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+    rand_b = int.from_bytes(os.urandom(8), 'big') & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b)
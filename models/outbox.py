@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+class OutboxEventType(str, Enum):
+    CHECKOUT = 'checkout'
+    RETURN = 'return'
+
+
+@dataclass
+class OutboxEvent:
+    id: int
+    event_type: OutboxEventType
+    patron_id: str
+    book_id: str
+    attempts: int
+    created_at: datetime
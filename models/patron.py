@@ -1,8 +1,14 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from bson import ObjectId
 
+
+def utc_now() -> datetime:
+    """Now as naive UTC, the form patron dates are stored in and Timestamps map to"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 @dataclass
 class Patron:
     id: Optional[str]  # MongoDB ObjectId as string
@@ -74,7 +80,7 @@ class Patron:
             return False
         
         if self.membership_end_date:
-            return datetime.now() <= self.membership_end_date
+            return utc_now() <= self.membership_end_date
         
         return True
 
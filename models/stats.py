@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class LibraryStats:
+    total_books: int
+    checked_out_books: int
+    total_patrons: int
+    active_patrons: int
+    patrons_by_membership_type: dict[str, int] = field(default_factory=dict)
+    reconciled_at: datetime | None = None  # None until the counters were first checked against the stores
@@ -0,0 +1,7 @@
+from .diagnostics_pb2_grpc import *
+from .diagnostics_pb2 import *
+from .health_pb2_grpc import *
+from .health_pb2 import *
+from .library_pb2_grpc import *
+from .library_pb2 import *
+
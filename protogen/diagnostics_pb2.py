@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: diagnostics.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'diagnostics.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x64iagnostics.proto\"V\n\x11\x43puProfileRequest\x12\x18\n\x10\x64uration_seconds\x18\x01 \x01(\r\x12\x13\n\x0binterval_ms\x18\x02 \x01(\r\x12\x12\n\nwrite_file\x18\x03 \x01(\x08\"R\n\x12\x43puProfileResponse\x12\x18\n\x10\x63ollapsed_stacks\x18\x01 \x01(\t\x12\x0f\n\x07samples\x18\x02 \x01(\r\x12\x11\n\tfile_path\x18\x03 \x01(\t\"\x13\n\x11ThreadDumpRequest\"J\n\x0bThreadStack\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05ident\x18\x02 \x01(\x04\x12\x0e\n\x06\x64\x61\x65mon\x18\x03 \x01(\x08\x12\x0e\n\x06\x66rames\x18\x04 \x03(\t\"3\n\x12ThreadDumpResponse\x12\x1d\n\x07threads\x18\x01 \x03(\x0b\x32\x0c.ThreadStack\"@\n\x12\x41llocationsRequest\x12\r\n\x05start\x18\x01 \x01(\x08\x12\x0c\n\x04stop\x18\x02 \x01(\x08\x12\r\n\x05limit\x18\x03 \x01(\r\"A\n\nAllocation\x12\x10\n\x08location\x18\x01 \x01(\t\x12\x12\n\nsize_bytes\x18\x02 \x01(\x04\x12\r\n\x05\x63ount\x18\x03 \x01(\x04\"j\n\x13\x41llocationsResponse\x12\x0f\n\x07tracing\x18\x01 \x01(\x08\x12\x14\n\x0ctraced_bytes\x18\x02 \x01(\x04\x12\x12\n\npeak_bytes\x18\x03 \x01(\x04\x12\x18\n\x03top\x18\x04 \x03(\x0b\x32\x0b.Allocation\"\x16\n\x14\x45xecutorStatsRequest\"\x8b\x01\n\x15\x45xecutorStatsResponse\x12\x13\n\x0bmax_workers\x18\x01 \x01(\r\x12\x0f\n\x07threads\x18\x02 \x01(\r\x12\x0e\n\x06\x61\x63tive\x18\x03 \x01(\r\x12\x0e\n\x06queued\x18\x04 \x01(\r\x12\x11\n\tcompleted\x18\x05 \x01(\x04\x12\x19\n\x11max_queue_wait_ms\x18\x06 \x01(\x01\"\x18\n\x16\x43oalescingStatsRequest\"_\n\x17\x43oalescingStatsResponse\x12\r\n\x05\x63\x61lls\x18\x01 \x01(\x04\x12\x10\n\x08\x65xecuted\x18\x02 \x01(\x04\x12\x11\n\tcollapsed\x18\x03 \x01(\x04\x12\x10\n\x08timeouts\x18\x04 \x01(\x04\"\x14\n\x12OutboxStatsRequest\"K\n\x13OutboxStatsResponse\x12\x0f\n\x07\x61pplied\x18\x01 \x01(\x04\x12\x0e\n\x06\x66\x61iled\x18\x02 \x01(\x04\x12\x13\n\x0blag_seconds\x18\x03 \x01(\x01\x32\x82\x03\n\x0b\x44iagnostics\x12\x35\n\nProfileCpu\x12\x12.CpuProfileRequest\x1a\x13.CpuProfileResponse\x12\x36\n\x0b\x44umpThreads\x12\x12.ThreadDumpRequest\x1a\x13.ThreadDumpResponse\x12;\n\x0eTopAllocations\x12\x13.AllocationsRequest\x1a\x14.AllocationsResponse\x12\x41\n\x10GetExecutorStats\x12\x15.ExecutorStatsRequest\x1a\x16.ExecutorStatsResponse\x12G\n\x12GetCoalescingStats\x12\x17.CoalescingStatsRequest\x1a\x18.CoalescingStatsResponse\x12;\n\x0eGetOutboxStats\x12\x13.OutboxStatsRequest\x1a\x14.OutboxStatsResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'diagnostics_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CPUPROFILEREQUEST']._serialized_start=21
+  _globals['_CPUPROFILEREQUEST']._serialized_end=107
+  _globals['_CPUPROFILERESPONSE']._serialized_start=109
+  _globals['_CPUPROFILERESPONSE']._serialized_end=191
+  _globals['_THREADDUMPREQUEST']._serialized_start=193
+  _globals['_THREADDUMPREQUEST']._serialized_end=212
+  _globals['_THREADSTACK']._serialized_start=214
+  _globals['_THREADSTACK']._serialized_end=288
+  _globals['_THREADDUMPRESPONSE']._serialized_start=290
+  _globals['_THREADDUMPRESPONSE']._serialized_end=341
+  _globals['_ALLOCATIONSREQUEST']._serialized_start=343
+  _globals['_ALLOCATIONSREQUEST']._serialized_end=407
+  _globals['_ALLOCATION']._serialized_start=409
+  _globals['_ALLOCATION']._serialized_end=474
+  _globals['_ALLOCATIONSRESPONSE']._serialized_start=476
+  _globals['_ALLOCATIONSRESPONSE']._serialized_end=582
+  _globals['_EXECUTORSTATSREQUEST']._serialized_start=584
+  _globals['_EXECUTORSTATSREQUEST']._serialized_end=606
+  _globals['_EXECUTORSTATSRESPONSE']._serialized_start=609
+  _globals['_EXECUTORSTATSRESPONSE']._serialized_end=748
+  _globals['_COALESCINGSTATSREQUEST']._serialized_start=750
+  _globals['_COALESCINGSTATSREQUEST']._serialized_end=774
+  _globals['_COALESCINGSTATSRESPONSE']._serialized_start=776
+  _globals['_COALESCINGSTATSRESPONSE']._serialized_end=871
+  _globals['_OUTBOXSTATSREQUEST']._serialized_start=873
+  _globals['_OUTBOXSTATSREQUEST']._serialized_end=893
+  _globals['_OUTBOXSTATSRESPONSE']._serialized_start=895
+  _globals['_OUTBOXSTATSRESPONSE']._serialized_end=970
+  _globals['_DIAGNOSTICS']._serialized_start=973
+  _globals['_DIAGNOSTICS']._serialized_end=1359
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,131 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class CpuProfileRequest(_message.Message):
+    __slots__ = ("duration_seconds", "interval_ms", "write_file")
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_MS_FIELD_NUMBER: _ClassVar[int]
+    WRITE_FILE_FIELD_NUMBER: _ClassVar[int]
+    duration_seconds: int
+    interval_ms: int
+    write_file: bool
+    def __init__(self, duration_seconds: _Optional[int] = ..., interval_ms: _Optional[int] = ..., write_file: _Optional[bool] = ...) -> None: ...
+
+class CpuProfileResponse(_message.Message):
+    __slots__ = ("collapsed_stacks", "samples", "file_path")
+    COLLAPSED_STACKS_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    FILE_PATH_FIELD_NUMBER: _ClassVar[int]
+    collapsed_stacks: str
+    samples: int
+    file_path: str
+    def __init__(self, collapsed_stacks: _Optional[str] = ..., samples: _Optional[int] = ..., file_path: _Optional[str] = ...) -> None: ...
+
+class ThreadDumpRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ThreadStack(_message.Message):
+    __slots__ = ("name", "ident", "daemon", "frames")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DAEMON_FIELD_NUMBER: _ClassVar[int]
+    FRAMES_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    ident: int
+    daemon: bool
+    frames: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, name: _Optional[str] = ..., ident: _Optional[int] = ..., daemon: _Optional[bool] = ..., frames: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ThreadDumpResponse(_message.Message):
+    __slots__ = ("threads",)
+    THREADS_FIELD_NUMBER: _ClassVar[int]
+    threads: _containers.RepeatedCompositeFieldContainer[ThreadStack]
+    def __init__(self, threads: _Optional[_Iterable[_Union[ThreadStack, _Mapping]]] = ...) -> None: ...
+
+class AllocationsRequest(_message.Message):
+    __slots__ = ("start", "stop", "limit")
+    START_FIELD_NUMBER: _ClassVar[int]
+    STOP_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    start: bool
+    stop: bool
+    limit: int
+    def __init__(self, start: _Optional[bool] = ..., stop: _Optional[bool] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class Allocation(_message.Message):
+    __slots__ = ("location", "size_bytes", "count")
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    SIZE_BYTES_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    location: str
+    size_bytes: int
+    count: int
+    def __init__(self, location: _Optional[str] = ..., size_bytes: _Optional[int] = ..., count: _Optional[int] = ...) -> None: ...
+
+class AllocationsResponse(_message.Message):
+    __slots__ = ("tracing", "traced_bytes", "peak_bytes", "top")
+    TRACING_FIELD_NUMBER: _ClassVar[int]
+    TRACED_BYTES_FIELD_NUMBER: _ClassVar[int]
+    PEAK_BYTES_FIELD_NUMBER: _ClassVar[int]
+    TOP_FIELD_NUMBER: _ClassVar[int]
+    tracing: bool
+    traced_bytes: int
+    peak_bytes: int
+    top: _containers.RepeatedCompositeFieldContainer[Allocation]
+    def __init__(self, tracing: _Optional[bool] = ..., traced_bytes: _Optional[int] = ..., peak_bytes: _Optional[int] = ..., top: _Optional[_Iterable[_Union[Allocation, _Mapping]]] = ...) -> None: ...
+
+class ExecutorStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ExecutorStatsResponse(_message.Message):
+    __slots__ = ("max_workers", "threads", "active", "queued", "completed", "max_queue_wait_ms")
+    MAX_WORKERS_FIELD_NUMBER: _ClassVar[int]
+    THREADS_FIELD_NUMBER: _ClassVar[int]
+    ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    QUEUED_FIELD_NUMBER: _ClassVar[int]
+    COMPLETED_FIELD_NUMBER: _ClassVar[int]
+    MAX_QUEUE_WAIT_MS_FIELD_NUMBER: _ClassVar[int]
+    max_workers: int
+    threads: int
+    active: int
+    queued: int
+    completed: int
+    max_queue_wait_ms: float
+    def __init__(self, max_workers: _Optional[int] = ..., threads: _Optional[int] = ..., active: _Optional[int] = ..., queued: _Optional[int] = ..., completed: _Optional[int] = ..., max_queue_wait_ms: _Optional[float] = ...) -> None: ...
+
+class CoalescingStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CoalescingStatsResponse(_message.Message):
+    __slots__ = ("calls", "executed", "collapsed", "timeouts")
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    EXECUTED_FIELD_NUMBER: _ClassVar[int]
+    COLLAPSED_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUTS_FIELD_NUMBER: _ClassVar[int]
+    calls: int
+    executed: int
+    collapsed: int
+    timeouts: int
+    def __init__(self, calls: _Optional[int] = ..., executed: _Optional[int] = ..., collapsed: _Optional[int] = ..., timeouts: _Optional[int] = ...) -> None: ...
+
+class OutboxStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class OutboxStatsResponse(_message.Message):
+    __slots__ = ("applied", "failed", "lag_seconds")
+    APPLIED_FIELD_NUMBER: _ClassVar[int]
+    FAILED_FIELD_NUMBER: _ClassVar[int]
+    LAG_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    applied: int
+    failed: int
+    lag_seconds: float
+    def __init__(self, applied: _Optional[int] = ..., failed: _Optional[int] = ..., lag_seconds: _Optional[float] = ...) -> None: ...
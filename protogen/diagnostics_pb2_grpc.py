@@ -0,0 +1,315 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import diagnostics_pb2 as diagnostics__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in diagnostics_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class DiagnosticsStub:
+    """Served on the debug port only, with its own small executor so it answers when the main one is stuck
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.ProfileCpu = channel.unary_unary(
+                '/Diagnostics/ProfileCpu',
+                request_serializer=diagnostics__pb2.CpuProfileRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.CpuProfileResponse.FromString,
+                _registered_method=True)
+        self.DumpThreads = channel.unary_unary(
+                '/Diagnostics/DumpThreads',
+                request_serializer=diagnostics__pb2.ThreadDumpRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.ThreadDumpResponse.FromString,
+                _registered_method=True)
+        self.TopAllocations = channel.unary_unary(
+                '/Diagnostics/TopAllocations',
+                request_serializer=diagnostics__pb2.AllocationsRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.AllocationsResponse.FromString,
+                _registered_method=True)
+        self.GetExecutorStats = channel.unary_unary(
+                '/Diagnostics/GetExecutorStats',
+                request_serializer=diagnostics__pb2.ExecutorStatsRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.ExecutorStatsResponse.FromString,
+                _registered_method=True)
+        self.GetCoalescingStats = channel.unary_unary(
+                '/Diagnostics/GetCoalescingStats',
+                request_serializer=diagnostics__pb2.CoalescingStatsRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.CoalescingStatsResponse.FromString,
+                _registered_method=True)
+        self.GetOutboxStats = channel.unary_unary(
+                '/Diagnostics/GetOutboxStats',
+                request_serializer=diagnostics__pb2.OutboxStatsRequest.SerializeToString,
+                response_deserializer=diagnostics__pb2.OutboxStatsResponse.FromString,
+                _registered_method=True)
+
+
+class DiagnosticsServicer:
+    """Served on the debug port only, with its own small executor so it answers when the main one is stuck
+    """
+
+    def ProfileCpu(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DumpThreads(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def TopAllocations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetExecutorStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCoalescingStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetOutboxStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_DiagnosticsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'ProfileCpu': grpc.unary_unary_rpc_method_handler(
+                    servicer.ProfileCpu,
+                    request_deserializer=diagnostics__pb2.CpuProfileRequest.FromString,
+                    response_serializer=diagnostics__pb2.CpuProfileResponse.SerializeToString,
+            ),
+            'DumpThreads': grpc.unary_unary_rpc_method_handler(
+                    servicer.DumpThreads,
+                    request_deserializer=diagnostics__pb2.ThreadDumpRequest.FromString,
+                    response_serializer=diagnostics__pb2.ThreadDumpResponse.SerializeToString,
+            ),
+            'TopAllocations': grpc.unary_unary_rpc_method_handler(
+                    servicer.TopAllocations,
+                    request_deserializer=diagnostics__pb2.AllocationsRequest.FromString,
+                    response_serializer=diagnostics__pb2.AllocationsResponse.SerializeToString,
+            ),
+            'GetExecutorStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetExecutorStats,
+                    request_deserializer=diagnostics__pb2.ExecutorStatsRequest.FromString,
+                    response_serializer=diagnostics__pb2.ExecutorStatsResponse.SerializeToString,
+            ),
+            'GetCoalescingStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCoalescingStats,
+                    request_deserializer=diagnostics__pb2.CoalescingStatsRequest.FromString,
+                    response_serializer=diagnostics__pb2.CoalescingStatsResponse.SerializeToString,
+            ),
+            'GetOutboxStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOutboxStats,
+                    request_deserializer=diagnostics__pb2.OutboxStatsRequest.FromString,
+                    response_serializer=diagnostics__pb2.OutboxStatsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'Diagnostics', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('Diagnostics', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Diagnostics:
+    """Served on the debug port only, with its own small executor so it answers when the main one is stuck
+    """
+
+    @staticmethod
+    def ProfileCpu(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/ProfileCpu',
+            diagnostics__pb2.CpuProfileRequest.SerializeToString,
+            diagnostics__pb2.CpuProfileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DumpThreads(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/DumpThreads',
+            diagnostics__pb2.ThreadDumpRequest.SerializeToString,
+            diagnostics__pb2.ThreadDumpResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def TopAllocations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/TopAllocations',
+            diagnostics__pb2.AllocationsRequest.SerializeToString,
+            diagnostics__pb2.AllocationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetExecutorStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/GetExecutorStats',
+            diagnostics__pb2.ExecutorStatsRequest.SerializeToString,
+            diagnostics__pb2.ExecutorStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCoalescingStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/GetCoalescingStats',
+            diagnostics__pb2.CoalescingStatsRequest.SerializeToString,
+            diagnostics__pb2.CoalescingStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetOutboxStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Diagnostics/GetOutboxStats',
+            diagnostics__pb2.OutboxStatsRequest.SerializeToString,
+            diagnostics__pb2.OutboxStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
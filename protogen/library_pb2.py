@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: library.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'library.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rlibrary.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"&\n\x05\x45rror\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\r\"r\n\x04\x42ook\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x13\n\x0bisbn_number\x18\x05 \x01(\x04\x12\x13\n\x0b\x63hecked_out\x18\x06 \x01(\x08\"\xa7\x04\n\x06Patron\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\r\n\x05\x65mail\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x06 \x01(\t\x12(\n\x0fmembership_type\x18\x07 \x01(\x0e\x32\x0f.MembershipType\x12!\n\x15membership_start_date\x18\x08 \x01(\tB\x02\x18\x01\x12\x1f\n\x13membership_end_date\x18\t \x01(\tB\x02\x18\x01\x12\x19\n\x11\x62ooks_checked_out\x18\n \x03(\t\x12\x1c\n\x14total_books_borrowed\x18\x0b \x01(\r\x12\x0e\n\x06\x61\x63tive\x18\x0c \x01(\x08\x12\x16\n\ncreated_at\x18\r \x01(\tB\x02\x18\x01\x12\x16\n\nupdated_at\x18\x0e \x01(\tB\x02\x18\x01\x12\x39\n\x15membership_start_time\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x37\n\x13membership_end_time\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0b\x63reate_time\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12/\n\x0bupdate_time\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"(\n\x11UpsertBookRequest\x12\x13\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x05.Book\"J\n\x12UpsertBookResponse\x12\x0e\n\x04uuid\x18\x01 \x01(\tH\x00\x12\x15\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.ErrorH\x00\x42\r\n\x0buuid_or_err\".\n\x13UpsertPatronRequest\x12\x17\n\x06patron\x18\x01 \x01(\x0b\x32\x07.Patron\"H\n\x14UpsertPatronResponse\x12\x0c\n\x02id\x18\x01 \x01(\tH\x00\x12\x15\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.ErrorH\x00\x42\x0b\n\tid_or_err\"!\n\x10ListBooksRequest\x12\r\n\x05limit\x18\x01 \x01(\r\">\n\x11ListBooksResponse\x12\x14\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x05.Book\x12\x13\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.Error\"H\n\x12ListPatronsRequest\x12\r\n\x05limit\x18\x01 \x01(\r\x12\x0e\n\x06offset\x18\x02 \x01(\r\x12\x13\n\x0b\x61\x63tive_only\x18\x03 \x01(\x08\"D\n\x13ListPatronsResponse\x12\x18\n\x07patrons\x18\x01 \x03(\x0b\x32\x07.Patron\x12\x13\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.Error\"t\n\x0eGetBookRequest\x12\x0e\n\x04uuid\x18\x01 \x01(\tH\x00\x12\x15\n\x0bisbn_number\x18\x02 \x01(\x04H\x00\x12\x18\n\x07id_type\x18\x03 \x01(\x0e\x32\x07.IDType\x12\x11\n\tpatron_id\x18\x04 \x01(\tB\x0e\n\x0cuuid_or_isbn\"7\n\x10\x42\x61tchBookRequest\x12\r\n\x05uuids\x18\x01 \x03(\t\x12\x14\n\x0cisbn_numbers\x18\x02 \x03(\x04\"]\n\x0f\x42\x61tchBookResult\x12\x0e\n\x04uuid\x18\x01 \x01(\tH\x00\x12\x15\n\x0bisbn_number\x18\x02 \x01(\x04H\x00\x12\x13\n\x03\x65rr\x18\x03 \x01(\x0b\x32\x06.ErrorB\x0e\n\x0cuuid_or_isbn\"K\n\x11\x42\x61tchBookResponse\x12!\n\x07results\x18\x01 \x03(\x0b\x32\x10.BatchBookResult\x12\x13\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.Error\"N\n\x0fGetBookResponse\x12\x15\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x05.BookH\x00\x12\x15\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.ErrorH\x00\x42\r\n\x0b\x62ook_or_err\"@\n\x10GetPatronRequest\x12\x0c\n\x02id\x18\x01 \x01(\tH\x00\x12\x0f\n\x05\x65mail\x18\x02 \x01(\tH\x00\x42\r\n\x0bid_or_email\"V\n\x11GetPatronResponse\x12\x19\n\x06patron\x18\x01 \x01(\x0b\x32\x07.PatronH\x00\x12\x15\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.ErrorH\x00\x42\x0f\n\rpatron_or_err\"3\n\x14SearchPatronsRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\r\"F\n\x15SearchPatronsResponse\x12\x18\n\x07patrons\x18\x01 \x03(\x0b\x32\x07.Patron\x12\x13\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.Error\"\x9a\x01\n\x17PatronMembershipRequest\x12\x11\n\tpatron_id\x18\x01 \x01(\t\x12(\n\x0fmembership_type\x18\x02 \x01(\x0e\x32\x0f.MembershipType\x12\x14\n\x08\x65nd_date\x18\x03 \x01(\tB\x02\x18\x01\x12,\n\x08\x65nd_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"V\n\x18PatronMembershipResponse\x12\x11\n\x07success\x18\x01 \x01(\x08H\x00\x12\x15\n\x03\x65rr\x18\x02 \x01(\x0b\x32\x06.ErrorH\x00\x42\x10\n\x0esuccess_or_err\"\x18\n\x16GetLibraryStatsRequest\"\xdc\x02\n\x17GetLibraryStatsResponse\x12\x13\n\x0btotal_books\x18\x01 \x01(\x04\x12\x19\n\x11\x63hecked_out_books\x18\x02 \x01(\x04\x12\x15\n\rtotal_patrons\x18\x03 \x01(\x04\x12\x16\n\x0e\x61\x63tive_patrons\x18\x04 \x01(\x04\x12Y\n\x1apatrons_by_membership_type\x18\x05 \x03(\x0b\x32\x35.GetLibraryStatsResponse.PatronsByMembershipTypeEntry\x12\x32\n\x0ereconcile_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x13\n\x03\x65rr\x18\x07 \x01(\x0b\x32\x06.Error\x1a>\n\x1cPatronsByMembershipTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xf0\x06\n\x0eSessionRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\x04\x12)\n\x0b\x63reate_book\x18\x02 \x01(\x0b\x32\x12.UpsertBookRequestH\x00\x12)\n\x0bupdate_book\x18\x03 \x01(\x0b\x32\x12.UpsertBookRequestH\x00\x12#\n\x08get_book\x18\x04 \x01(\x0b\x32\x0f.GetBookRequestH\x00\x12&\n\x0b\x64\x65lete_book\x18\x05 \x01(\x0b\x32\x0f.GetBookRequestH\x00\x12(\n\rcheckout_book\x18\x06 \x01(\x0b\x32\x0f.GetBookRequestH\x00\x12&\n\x0breturn_book\x18\x07 \x01(\x0b\x32\x0f.GetBookRequestH\x00\x12+\n\x0e\x63heckout_books\x18\x08 \x01(\x0b\x32\x11.BatchBookRequestH\x00\x12)\n\x0creturn_books\x18\t \x01(\x0b\x32\x11.BatchBookRequestH\x00\x12)\n\x0c\x64\x65lete_books\x18\n \x01(\x0b\x32\x11.BatchBookRequestH\x00\x12\'\n\nlist_books\x18\x0b \x01(\x0b\x32\x11.ListBooksRequestH\x00\x12-\n\rcreate_patron\x18\x0c \x01(\x0b\x32\x14.UpsertPatronRequestH\x00\x12-\n\rupdate_patron\x18\r \x01(\x0b\x32\x14.UpsertPatronRequestH\x00\x12\'\n\nget_patron\x18\x0e \x01(\x0b\x32\x11.GetPatronRequestH\x00\x12*\n\rdelete_patron\x18\x0f \x01(\x0b\x32\x11.GetPatronRequestH\x00\x12+\n\x0clist_patrons\x18\x10 \x01(\x0b\x32\x13.ListPatronsRequestH\x00\x12/\n\x0esearch_patrons\x18\x11 \x01(\x0b\x32\x15.SearchPatronsRequestH\x00\x12<\n\x18update_patron_membership\x18\x12 \x01(\x0b\x32\x18.PatronMembershipRequestH\x00\x12\x34\n\x11get_library_stats\x18\x13 \x01(\x0b\x32\x17.GetLibraryStatsRequestH\x00\x12\x17\n\x0fidempotency_key\x18\x14 \x01(\tB\x0b\n\toperation\"\x9a\x07\n\x0fSessionResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\x04\x12\x0e\n\x06status\x18\x02 \x01(\r\x12*\n\x0b\x63reate_book\x18\x03 \x01(\x0b\x32\x13.UpsertBookResponseH\x00\x12*\n\x0bupdate_book\x18\x04 \x01(\x0b\x32\x13.UpsertBookResponseH\x00\x12$\n\x08get_book\x18\x05 \x01(\x0b\x32\x10.GetBookResponseH\x00\x12*\n\x0b\x64\x65lete_book\x18\x06 \x01(\x0b\x32\x13.UpsertBookResponseH\x00\x12,\n\rcheckout_book\x18\x07 \x01(\x0b\x32\x13.UpsertBookResponseH\x00\x12*\n\x0breturn_book\x18\x08 \x01(\x0b\x32\x13.UpsertBookResponseH\x00\x12,\n\x0e\x63heckout_books\x18\t \x01(\x0b\x32\x12.BatchBookResponseH\x00\x12*\n\x0creturn_books\x18\n \x01(\x0b\x32\x12.BatchBookResponseH\x00\x12*\n\x0c\x64\x65lete_books\x18\x0b \x01(\x0b\x32\x12.BatchBookResponseH\x00\x12(\n\nlist_books\x18\x0c \x01(\x0b\x32\x12.ListBooksResponseH\x00\x12.\n\rcreate_patron\x18\r \x01(\x0b\x32\x15.UpsertPatronResponseH\x00\x12.\n\rupdate_patron\x18\x0e \x01(\x0b\x32\x15.UpsertPatronResponseH\x00\x12(\n\nget_patron\x18\x0f \x01(\x0b\x32\x12.GetPatronResponseH\x00\x12.\n\rdelete_patron\x18\x10 \x01(\x0b\x32\x15.UpsertPatronResponseH\x00\x12,\n\x0clist_patrons\x18\x11 \x01(\x0b\x32\x14.ListPatronsResponseH\x00\x12\x30\n\x0esearch_patrons\x18\x12 \x01(\x0b\x32\x16.SearchPatronsResponseH\x00\x12=\n\x18update_patron_membership\x18\x13 \x01(\x0b\x32\x19.PatronMembershipResponseH\x00\x12\x35\n\x11get_library_stats\x18\x14 \x01(\x0b\x32\x18.GetLibraryStatsResponseH\x00\x12\x15\n\x03\x65rr\x18\x15 \x01(\x0b\x32\x06.ErrorH\x00\x42\x08\n\x06result**\n\x06IDType\x12\x0f\n\x0bIDTYPE_UUID\x10\x00\x12\x0f\n\x0bIDTYPE_ISBN\x10\x01*`\n\tErrorCode\x12\x18\n\x14\x45RR_CODE_BAD_REQUEST\x10\x00\x12\x16\n\x12\x45RR_CODE_NOT_FOUND\x10\x01\x12!\n\x1d\x45RR_CODE_INTERNAL_MALFUNCTION\x10\x02*\x86\x01\n\x0eMembershipType\x12\x1b\n\x17MEMBERSHIP_TYPE_STUDENT\x10\x00\x12\x1b\n\x17MEMBERSHIP_TYPE_FACULTY\x10\x01\x12\x1d\n\x19MEMBERSHIP_TYPE_COMMUNITY\x10\x02\x12\x1b\n\x17MEMBERSHIP_TYPE_PREMIUM\x10\x03\x32\xc4\x08\n\x07Library\x12\x35\n\nCreateBook\x12\x12.UpsertBookRequest\x1a\x13.UpsertBookResponse\x12\x35\n\nUpdateBook\x12\x12.UpsertBookRequest\x1a\x13.UpsertBookResponse\x12\x32\n\tListBooks\x12\x11.ListBooksRequest\x1a\x12.ListBooksResponse\x12,\n\x07GetBook\x12\x0f.GetBookRequest\x1a\x10.GetBookResponse\x12\x32\n\nDeleteBook\x12\x0f.GetBookRequest\x1a\x13.UpsertBookResponse\x12\x34\n\x0c\x43heckoutBook\x12\x0f.GetBookRequest\x1a\x13.UpsertBookResponse\x12\x32\n\nReturnBook\x12\x0f.GetBookRequest\x1a\x13.UpsertBookResponse\x12\x36\n\rCheckoutBooks\x12\x11.BatchBookRequest\x1a\x12.BatchBookResponse\x12\x34\n\x0bReturnBooks\x12\x11.BatchBookRequest\x1a\x12.BatchBookResponse\x12\x34\n\x0b\x44\x65leteBooks\x12\x11.BatchBookRequest\x1a\x12.BatchBookResponse\x12;\n\x0c\x43reatePatron\x12\x14.UpsertPatronRequest\x1a\x15.UpsertPatronResponse\x12;\n\x0cUpdatePatron\x12\x14.UpsertPatronRequest\x1a\x15.UpsertPatronResponse\x12\x38\n\x0bListPatrons\x12\x13.ListPatronsRequest\x1a\x14.ListPatronsResponse\x12\x32\n\tGetPatron\x12\x11.GetPatronRequest\x1a\x12.GetPatronResponse\x12\x38\n\x0c\x44\x65letePatron\x12\x11.GetPatronRequest\x1a\x15.UpsertPatronResponse\x12>\n\rSearchPatrons\x12\x15.SearchPatronsRequest\x1a\x16.SearchPatronsResponse\x12M\n\x16UpdatePatronMembership\x12\x18.PatronMembershipRequest\x1a\x19.PatronMembershipResponse\x12\x44\n\x0fGetLibraryStats\x12\x17.GetLibraryStatsRequest\x1a\x18.GetLibraryStatsResponse\x12\x30\n\x07Session\x12\x0f.SessionRequest\x1a\x10.SessionResponse(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'library_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_PATRON'].fields_by_name['membership_start_date']._loaded_options = None
+  _globals['_PATRON'].fields_by_name['membership_start_date']._serialized_options = b'\030\001'
+  _globals['_PATRON'].fields_by_name['membership_end_date']._loaded_options = None
+  _globals['_PATRON'].fields_by_name['membership_end_date']._serialized_options = b'\030\001'
+  _globals['_PATRON'].fields_by_name['created_at']._loaded_options = None
+  _globals['_PATRON'].fields_by_name['created_at']._serialized_options = b'\030\001'
+  _globals['_PATRON'].fields_by_name['updated_at']._loaded_options = None
+  _globals['_PATRON'].fields_by_name['updated_at']._serialized_options = b'\030\001'
+  _globals['_PATRONMEMBERSHIPREQUEST'].fields_by_name['end_date']._loaded_options = None
+  _globals['_PATRONMEMBERSHIPREQUEST'].fields_by_name['end_date']._serialized_options = b'\030\001'
+  _globals['_GETLIBRARYSTATSRESPONSE_PATRONSBYMEMBERSHIPTYPEENTRY']._loaded_options = None
+  _globals['_GETLIBRARYSTATSRESPONSE_PATRONSBYMEMBERSHIPTYPEENTRY']._serialized_options = b'8\001'
+  _globals['_IDTYPE']._serialized_start=4379
+  _globals['_IDTYPE']._serialized_end=4421
+  _globals['_ERRORCODE']._serialized_start=4423
+  _globals['_ERRORCODE']._serialized_end=4519
+  _globals['_MEMBERSHIPTYPE']._serialized_start=4522
+  _globals['_MEMBERSHIPTYPE']._serialized_end=4656
+  _globals['_ERROR']._serialized_start=50
+  _globals['_ERROR']._serialized_end=88
+  _globals['_BOOK']._serialized_start=90
+  _globals['_BOOK']._serialized_end=204
+  _globals['_PATRON']._serialized_start=207
+  _globals['_PATRON']._serialized_end=758
+  _globals['_UPSERTBOOKREQUEST']._serialized_start=760
+  _globals['_UPSERTBOOKREQUEST']._serialized_end=800
+  _globals['_UPSERTBOOKRESPONSE']._serialized_start=802
+  _globals['_UPSERTBOOKRESPONSE']._serialized_end=876
+  _globals['_UPSERTPATRONREQUEST']._serialized_start=878
+  _globals['_UPSERTPATRONREQUEST']._serialized_end=924
+  _globals['_UPSERTPATRONRESPONSE']._serialized_start=926
+  _globals['_UPSERTPATRONRESPONSE']._serialized_end=998
+  _globals['_LISTBOOKSREQUEST']._serialized_start=1000
+  _globals['_LISTBOOKSREQUEST']._serialized_end=1033
+  _globals['_LISTBOOKSRESPONSE']._serialized_start=1035
+  _globals['_LISTBOOKSRESPONSE']._serialized_end=1097
+  _globals['_LISTPATRONSREQUEST']._serialized_start=1099
+  _globals['_LISTPATRONSREQUEST']._serialized_end=1171
+  _globals['_LISTPATRONSRESPONSE']._serialized_start=1173
+  _globals['_LISTPATRONSRESPONSE']._serialized_end=1241
+  _globals['_GETBOOKREQUEST']._serialized_start=1243
+  _globals['_GETBOOKREQUEST']._serialized_end=1359
+  _globals['_BATCHBOOKREQUEST']._serialized_start=1361
+  _globals['_BATCHBOOKREQUEST']._serialized_end=1416
+  _globals['_BATCHBOOKRESULT']._serialized_start=1418
+  _globals['_BATCHBOOKRESULT']._serialized_end=1511
+  _globals['_BATCHBOOKRESPONSE']._serialized_start=1513
+  _globals['_BATCHBOOKRESPONSE']._serialized_end=1588
+  _globals['_GETBOOKRESPONSE']._serialized_start=1590
+  _globals['_GETBOOKRESPONSE']._serialized_end=1668
+  _globals['_GETPATRONREQUEST']._serialized_start=1670
+  _globals['_GETPATRONREQUEST']._serialized_end=1734
+  _globals['_GETPATRONRESPONSE']._serialized_start=1736
+  _globals['_GETPATRONRESPONSE']._serialized_end=1822
+  _globals['_SEARCHPATRONSREQUEST']._serialized_start=1824
+  _globals['_SEARCHPATRONSREQUEST']._serialized_end=1875
+  _globals['_SEARCHPATRONSRESPONSE']._serialized_start=1877
+  _globals['_SEARCHPATRONSRESPONSE']._serialized_end=1947
+  _globals['_PATRONMEMBERSHIPREQUEST']._serialized_start=1950
+  _globals['_PATRONMEMBERSHIPREQUEST']._serialized_end=2104
+  _globals['_PATRONMEMBERSHIPRESPONSE']._serialized_start=2106
+  _globals['_PATRONMEMBERSHIPRESPONSE']._serialized_end=2192
+  _globals['_GETLIBRARYSTATSREQUEST']._serialized_start=2194
+  _globals['_GETLIBRARYSTATSREQUEST']._serialized_end=2218
+  _globals['_GETLIBRARYSTATSRESPONSE']._serialized_start=2221
+  _globals['_GETLIBRARYSTATSRESPONSE']._serialized_end=2569
+  _globals['_GETLIBRARYSTATSRESPONSE_PATRONSBYMEMBERSHIPTYPEENTRY']._serialized_start=2507
+  _globals['_GETLIBRARYSTATSRESPONSE_PATRONSBYMEMBERSHIPTYPEENTRY']._serialized_end=2569
+  _globals['_SESSIONREQUEST']._serialized_start=2572
+  _globals['_SESSIONREQUEST']._serialized_end=3452
+  _globals['_SESSIONRESPONSE']._serialized_start=3455
+  _globals['_SESSIONRESPONSE']._serialized_end=4377
+  _globals['_LIBRARY']._serialized_start=4659
+  _globals['_LIBRARY']._serialized_end=5751
+# @@protoc_insertion_point(module_scope)
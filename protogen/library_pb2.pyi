@@ -0,0 +1,379 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class IDType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    IDTYPE_UUID: _ClassVar[IDType]
+    IDTYPE_ISBN: _ClassVar[IDType]
+
+class ErrorCode(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ERR_CODE_BAD_REQUEST: _ClassVar[ErrorCode]
+    ERR_CODE_NOT_FOUND: _ClassVar[ErrorCode]
+    ERR_CODE_INTERNAL_MALFUNCTION: _ClassVar[ErrorCode]
+
+class MembershipType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    MEMBERSHIP_TYPE_STUDENT: _ClassVar[MembershipType]
+    MEMBERSHIP_TYPE_FACULTY: _ClassVar[MembershipType]
+    MEMBERSHIP_TYPE_COMMUNITY: _ClassVar[MembershipType]
+    MEMBERSHIP_TYPE_PREMIUM: _ClassVar[MembershipType]
+IDTYPE_UUID: IDType
+IDTYPE_ISBN: IDType
+ERR_CODE_BAD_REQUEST: ErrorCode
+ERR_CODE_NOT_FOUND: ErrorCode
+ERR_CODE_INTERNAL_MALFUNCTION: ErrorCode
+MEMBERSHIP_TYPE_STUDENT: MembershipType
+MEMBERSHIP_TYPE_FACULTY: MembershipType
+MEMBERSHIP_TYPE_COMMUNITY: MembershipType
+MEMBERSHIP_TYPE_PREMIUM: MembershipType
+
+class Error(_message.Message):
+    __slots__ = ("message", "code")
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    message: str
+    code: int
+    def __init__(self, message: _Optional[str] = ..., code: _Optional[int] = ...) -> None: ...
+
+class Book(_message.Message):
+    __slots__ = ("uuid", "title", "author", "description", "isbn_number", "checked_out")
+    UUID_FIELD_NUMBER: _ClassVar[int]
+    TITLE_FIELD_NUMBER: _ClassVar[int]
+    AUTHOR_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    ISBN_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    CHECKED_OUT_FIELD_NUMBER: _ClassVar[int]
+    uuid: str
+    title: str
+    author: str
+    description: str
+    isbn_number: int
+    checked_out: bool
+    def __init__(self, uuid: _Optional[str] = ..., title: _Optional[str] = ..., author: _Optional[str] = ..., description: _Optional[str] = ..., isbn_number: _Optional[int] = ..., checked_out: _Optional[bool] = ...) -> None: ...
+
+class Patron(_message.Message):
+    __slots__ = ("id", "first_name", "last_name", "email", "phone", "address", "membership_type", "membership_start_date", "membership_end_date", "books_checked_out", "total_books_borrowed", "active", "created_at", "updated_at", "membership_start_time", "membership_end_time", "create_time", "update_time")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
+    LAST_NAME_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    PHONE_FIELD_NUMBER: _ClassVar[int]
+    ADDRESS_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_TYPE_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_START_DATE_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_END_DATE_FIELD_NUMBER: _ClassVar[int]
+    BOOKS_CHECKED_OUT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_BOOKS_BORROWED_FIELD_NUMBER: _ClassVar[int]
+    ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_START_TIME_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_END_TIME_FIELD_NUMBER: _ClassVar[int]
+    CREATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_TIME_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    address: str
+    membership_type: MembershipType
+    membership_start_date: str
+    membership_end_date: str
+    books_checked_out: _containers.RepeatedScalarFieldContainer[str]
+    total_books_borrowed: int
+    active: bool
+    created_at: str
+    updated_at: str
+    membership_start_time: _timestamp_pb2.Timestamp
+    membership_end_time: _timestamp_pb2.Timestamp
+    create_time: _timestamp_pb2.Timestamp
+    update_time: _timestamp_pb2.Timestamp
+    def __init__(self, id: _Optional[str] = ..., first_name: _Optional[str] = ..., last_name: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., address: _Optional[str] = ..., membership_type: _Optional[_Union[MembershipType, str]] = ..., membership_start_date: _Optional[str] = ..., membership_end_date: _Optional[str] = ..., books_checked_out: _Optional[_Iterable[str]] = ..., total_books_borrowed: _Optional[int] = ..., active: _Optional[bool] = ..., created_at: _Optional[str] = ..., updated_at: _Optional[str] = ..., membership_start_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., membership_end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., create_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., update_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class UpsertBookRequest(_message.Message):
+    __slots__ = ("book",)
+    BOOK_FIELD_NUMBER: _ClassVar[int]
+    book: Book
+    def __init__(self, book: _Optional[_Union[Book, _Mapping]] = ...) -> None: ...
+
+class UpsertBookResponse(_message.Message):
+    __slots__ = ("uuid", "err")
+    UUID_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    uuid: str
+    err: Error
+    def __init__(self, uuid: _Optional[str] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class UpsertPatronRequest(_message.Message):
+    __slots__ = ("patron",)
+    PATRON_FIELD_NUMBER: _ClassVar[int]
+    patron: Patron
+    def __init__(self, patron: _Optional[_Union[Patron, _Mapping]] = ...) -> None: ...
+
+class UpsertPatronResponse(_message.Message):
+    __slots__ = ("id", "err")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    err: Error
+    def __init__(self, id: _Optional[str] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class ListBooksRequest(_message.Message):
+    __slots__ = ("limit",)
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    def __init__(self, limit: _Optional[int] = ...) -> None: ...
+
+class ListBooksResponse(_message.Message):
+    __slots__ = ("books", "err")
+    BOOKS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    books: _containers.RepeatedCompositeFieldContainer[Book]
+    err: Error
+    def __init__(self, books: _Optional[_Iterable[_Union[Book, _Mapping]]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class ListPatronsRequest(_message.Message):
+    __slots__ = ("limit", "offset", "active_only")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    ACTIVE_ONLY_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    offset: int
+    active_only: bool
+    def __init__(self, limit: _Optional[int] = ..., offset: _Optional[int] = ..., active_only: _Optional[bool] = ...) -> None: ...
+
+class ListPatronsResponse(_message.Message):
+    __slots__ = ("patrons", "err")
+    PATRONS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    patrons: _containers.RepeatedCompositeFieldContainer[Patron]
+    err: Error
+    def __init__(self, patrons: _Optional[_Iterable[_Union[Patron, _Mapping]]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class GetBookRequest(_message.Message):
+    __slots__ = ("uuid", "isbn_number", "id_type", "patron_id")
+    UUID_FIELD_NUMBER: _ClassVar[int]
+    ISBN_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    ID_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PATRON_ID_FIELD_NUMBER: _ClassVar[int]
+    uuid: str
+    isbn_number: int
+    id_type: IDType
+    patron_id: str
+    def __init__(self, uuid: _Optional[str] = ..., isbn_number: _Optional[int] = ..., id_type: _Optional[_Union[IDType, str]] = ..., patron_id: _Optional[str] = ...) -> None: ...
+
+class BatchBookRequest(_message.Message):
+    __slots__ = ("uuids", "isbn_numbers")
+    UUIDS_FIELD_NUMBER: _ClassVar[int]
+    ISBN_NUMBERS_FIELD_NUMBER: _ClassVar[int]
+    uuids: _containers.RepeatedScalarFieldContainer[str]
+    isbn_numbers: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, uuids: _Optional[_Iterable[str]] = ..., isbn_numbers: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class BatchBookResult(_message.Message):
+    __slots__ = ("uuid", "isbn_number", "err")
+    UUID_FIELD_NUMBER: _ClassVar[int]
+    ISBN_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    uuid: str
+    isbn_number: int
+    err: Error
+    def __init__(self, uuid: _Optional[str] = ..., isbn_number: _Optional[int] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class BatchBookResponse(_message.Message):
+    __slots__ = ("results", "err")
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[BatchBookResult]
+    err: Error
+    def __init__(self, results: _Optional[_Iterable[_Union[BatchBookResult, _Mapping]]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class GetBookResponse(_message.Message):
+    __slots__ = ("book", "err")
+    BOOK_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    book: Book
+    err: Error
+    def __init__(self, book: _Optional[_Union[Book, _Mapping]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class GetPatronRequest(_message.Message):
+    __slots__ = ("id", "email")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    email: str
+    def __init__(self, id: _Optional[str] = ..., email: _Optional[str] = ...) -> None: ...
+
+class GetPatronResponse(_message.Message):
+    __slots__ = ("patron", "err")
+    PATRON_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    patron: Patron
+    err: Error
+    def __init__(self, patron: _Optional[_Union[Patron, _Mapping]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class SearchPatronsRequest(_message.Message):
+    __slots__ = ("name", "limit")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    limit: int
+    def __init__(self, name: _Optional[str] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class SearchPatronsResponse(_message.Message):
+    __slots__ = ("patrons", "err")
+    PATRONS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    patrons: _containers.RepeatedCompositeFieldContainer[Patron]
+    err: Error
+    def __init__(self, patrons: _Optional[_Iterable[_Union[Patron, _Mapping]]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class PatronMembershipRequest(_message.Message):
+    __slots__ = ("patron_id", "membership_type", "end_date", "end_time")
+    PATRON_ID_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIP_TYPE_FIELD_NUMBER: _ClassVar[int]
+    END_DATE_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    patron_id: str
+    membership_type: MembershipType
+    end_date: str
+    end_time: _timestamp_pb2.Timestamp
+    def __init__(self, patron_id: _Optional[str] = ..., membership_type: _Optional[_Union[MembershipType, str]] = ..., end_date: _Optional[str] = ..., end_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class PatronMembershipResponse(_message.Message):
+    __slots__ = ("success", "err")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    err: Error
+    def __init__(self, success: _Optional[bool] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class GetLibraryStatsRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class GetLibraryStatsResponse(_message.Message):
+    __slots__ = ("total_books", "checked_out_books", "total_patrons", "active_patrons", "patrons_by_membership_type", "reconcile_time", "err")
+    class PatronsByMembershipTypeEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    TOTAL_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    CHECKED_OUT_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    ACTIVE_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    PATRONS_BY_MEMBERSHIP_TYPE_FIELD_NUMBER: _ClassVar[int]
+    RECONCILE_TIME_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    total_books: int
+    checked_out_books: int
+    total_patrons: int
+    active_patrons: int
+    patrons_by_membership_type: _containers.ScalarMap[str, int]
+    reconcile_time: _timestamp_pb2.Timestamp
+    err: Error
+    def __init__(self, total_books: _Optional[int] = ..., checked_out_books: _Optional[int] = ..., total_patrons: _Optional[int] = ..., active_patrons: _Optional[int] = ..., patrons_by_membership_type: _Optional[_Mapping[str, int]] = ..., reconcile_time: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class SessionRequest(_message.Message):
+    __slots__ = ("request_id", "create_book", "update_book", "get_book", "delete_book", "checkout_book", "return_book", "checkout_books", "return_books", "delete_books", "list_books", "create_patron", "update_patron", "get_patron", "delete_patron", "list_patrons", "search_patrons", "update_patron_membership", "get_library_stats", "idempotency_key")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    CREATE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    GET_BOOK_FIELD_NUMBER: _ClassVar[int]
+    DELETE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    CHECKOUT_BOOK_FIELD_NUMBER: _ClassVar[int]
+    RETURN_BOOK_FIELD_NUMBER: _ClassVar[int]
+    CHECKOUT_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    RETURN_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    DELETE_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    LIST_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    CREATE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    GET_PATRON_FIELD_NUMBER: _ClassVar[int]
+    DELETE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    LIST_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_PATRON_MEMBERSHIP_FIELD_NUMBER: _ClassVar[int]
+    GET_LIBRARY_STATS_FIELD_NUMBER: _ClassVar[int]
+    IDEMPOTENCY_KEY_FIELD_NUMBER: _ClassVar[int]
+    request_id: int
+    create_book: UpsertBookRequest
+    update_book: UpsertBookRequest
+    get_book: GetBookRequest
+    delete_book: GetBookRequest
+    checkout_book: GetBookRequest
+    return_book: GetBookRequest
+    checkout_books: BatchBookRequest
+    return_books: BatchBookRequest
+    delete_books: BatchBookRequest
+    list_books: ListBooksRequest
+    create_patron: UpsertPatronRequest
+    update_patron: UpsertPatronRequest
+    get_patron: GetPatronRequest
+    delete_patron: GetPatronRequest
+    list_patrons: ListPatronsRequest
+    search_patrons: SearchPatronsRequest
+    update_patron_membership: PatronMembershipRequest
+    get_library_stats: GetLibraryStatsRequest
+    idempotency_key: str
+    def __init__(self, request_id: _Optional[int] = ..., create_book: _Optional[_Union[UpsertBookRequest, _Mapping]] = ..., update_book: _Optional[_Union[UpsertBookRequest, _Mapping]] = ..., get_book: _Optional[_Union[GetBookRequest, _Mapping]] = ..., delete_book: _Optional[_Union[GetBookRequest, _Mapping]] = ..., checkout_book: _Optional[_Union[GetBookRequest, _Mapping]] = ..., return_book: _Optional[_Union[GetBookRequest, _Mapping]] = ..., checkout_books: _Optional[_Union[BatchBookRequest, _Mapping]] = ..., return_books: _Optional[_Union[BatchBookRequest, _Mapping]] = ..., delete_books: _Optional[_Union[BatchBookRequest, _Mapping]] = ..., list_books: _Optional[_Union[ListBooksRequest, _Mapping]] = ..., create_patron: _Optional[_Union[UpsertPatronRequest, _Mapping]] = ..., update_patron: _Optional[_Union[UpsertPatronRequest, _Mapping]] = ..., get_patron: _Optional[_Union[GetPatronRequest, _Mapping]] = ..., delete_patron: _Optional[_Union[GetPatronRequest, _Mapping]] = ..., list_patrons: _Optional[_Union[ListPatronsRequest, _Mapping]] = ..., search_patrons: _Optional[_Union[SearchPatronsRequest, _Mapping]] = ..., update_patron_membership: _Optional[_Union[PatronMembershipRequest, _Mapping]] = ..., get_library_stats: _Optional[_Union[GetLibraryStatsRequest, _Mapping]] = ..., idempotency_key: _Optional[str] = ...) -> None: ...
+
+class SessionResponse(_message.Message):
+    __slots__ = ("request_id", "status", "create_book", "update_book", "get_book", "delete_book", "checkout_book", "return_book", "checkout_books", "return_books", "delete_books", "list_books", "create_patron", "update_patron", "get_patron", "delete_patron", "list_patrons", "search_patrons", "update_patron_membership", "get_library_stats", "err")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    CREATE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    GET_BOOK_FIELD_NUMBER: _ClassVar[int]
+    DELETE_BOOK_FIELD_NUMBER: _ClassVar[int]
+    CHECKOUT_BOOK_FIELD_NUMBER: _ClassVar[int]
+    RETURN_BOOK_FIELD_NUMBER: _ClassVar[int]
+    CHECKOUT_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    RETURN_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    DELETE_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    LIST_BOOKS_FIELD_NUMBER: _ClassVar[int]
+    CREATE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    GET_PATRON_FIELD_NUMBER: _ClassVar[int]
+    DELETE_PATRON_FIELD_NUMBER: _ClassVar[int]
+    LIST_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_PATRONS_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_PATRON_MEMBERSHIP_FIELD_NUMBER: _ClassVar[int]
+    GET_LIBRARY_STATS_FIELD_NUMBER: _ClassVar[int]
+    ERR_FIELD_NUMBER: _ClassVar[int]
+    request_id: int
+    status: int
+    create_book: UpsertBookResponse
+    update_book: UpsertBookResponse
+    get_book: GetBookResponse
+    delete_book: UpsertBookResponse
+    checkout_book: UpsertBookResponse
+    return_book: UpsertBookResponse
+    checkout_books: BatchBookResponse
+    return_books: BatchBookResponse
+    delete_books: BatchBookResponse
+    list_books: ListBooksResponse
+    create_patron: UpsertPatronResponse
+    update_patron: UpsertPatronResponse
+    get_patron: GetPatronResponse
+    delete_patron: UpsertPatronResponse
+    list_patrons: ListPatronsResponse
+    search_patrons: SearchPatronsResponse
+    update_patron_membership: PatronMembershipResponse
+    get_library_stats: GetLibraryStatsResponse
+    err: Error
+    def __init__(self, request_id: _Optional[int] = ..., status: _Optional[int] = ..., create_book: _Optional[_Union[UpsertBookResponse, _Mapping]] = ..., update_book: _Optional[_Union[UpsertBookResponse, _Mapping]] = ..., get_book: _Optional[_Union[GetBookResponse, _Mapping]] = ..., delete_book: _Optional[_Union[UpsertBookResponse, _Mapping]] = ..., checkout_book: _Optional[_Union[UpsertBookResponse, _Mapping]] = ..., return_book: _Optional[_Union[UpsertBookResponse, _Mapping]] = ..., checkout_books: _Optional[_Union[BatchBookResponse, _Mapping]] = ..., return_books: _Optional[_Union[BatchBookResponse, _Mapping]] = ..., delete_books: _Optional[_Union[BatchBookResponse, _Mapping]] = ..., list_books: _Optional[_Union[ListBooksResponse, _Mapping]] = ..., create_patron: _Optional[_Union[UpsertPatronResponse, _Mapping]] = ..., update_patron: _Optional[_Union[UpsertPatronResponse, _Mapping]] = ..., get_patron: _Optional[_Union[GetPatronResponse, _Mapping]] = ..., delete_patron: _Optional[_Union[UpsertPatronResponse, _Mapping]] = ..., list_patrons: _Optional[_Union[ListPatronsResponse, _Mapping]] = ..., search_patrons: _Optional[_Union[SearchPatronsResponse, _Mapping]] = ..., update_patron_membership: _Optional[_Union[PatronMembershipResponse, _Mapping]] = ..., get_library_stats: _Optional[_Union[GetLibraryStatsResponse, _Mapping]] = ..., err: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
@@ -0,0 +1,878 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import library_pb2 as library__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in library_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class LibraryStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateBook = channel.unary_unary(
+                '/Library/CreateBook',
+                request_serializer=library__pb2.UpsertBookRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertBookResponse.FromString,
+                _registered_method=True)
+        self.UpdateBook = channel.unary_unary(
+                '/Library/UpdateBook',
+                request_serializer=library__pb2.UpsertBookRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertBookResponse.FromString,
+                _registered_method=True)
+        self.ListBooks = channel.unary_unary(
+                '/Library/ListBooks',
+                request_serializer=library__pb2.ListBooksRequest.SerializeToString,
+                response_deserializer=library__pb2.ListBooksResponse.FromString,
+                _registered_method=True)
+        self.GetBook = channel.unary_unary(
+                '/Library/GetBook',
+                request_serializer=library__pb2.GetBookRequest.SerializeToString,
+                response_deserializer=library__pb2.GetBookResponse.FromString,
+                _registered_method=True)
+        self.DeleteBook = channel.unary_unary(
+                '/Library/DeleteBook',
+                request_serializer=library__pb2.GetBookRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertBookResponse.FromString,
+                _registered_method=True)
+        self.CheckoutBook = channel.unary_unary(
+                '/Library/CheckoutBook',
+                request_serializer=library__pb2.GetBookRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertBookResponse.FromString,
+                _registered_method=True)
+        self.ReturnBook = channel.unary_unary(
+                '/Library/ReturnBook',
+                request_serializer=library__pb2.GetBookRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertBookResponse.FromString,
+                _registered_method=True)
+        self.CheckoutBooks = channel.unary_unary(
+                '/Library/CheckoutBooks',
+                request_serializer=library__pb2.BatchBookRequest.SerializeToString,
+                response_deserializer=library__pb2.BatchBookResponse.FromString,
+                _registered_method=True)
+        self.ReturnBooks = channel.unary_unary(
+                '/Library/ReturnBooks',
+                request_serializer=library__pb2.BatchBookRequest.SerializeToString,
+                response_deserializer=library__pb2.BatchBookResponse.FromString,
+                _registered_method=True)
+        self.DeleteBooks = channel.unary_unary(
+                '/Library/DeleteBooks',
+                request_serializer=library__pb2.BatchBookRequest.SerializeToString,
+                response_deserializer=library__pb2.BatchBookResponse.FromString,
+                _registered_method=True)
+        self.CreatePatron = channel.unary_unary(
+                '/Library/CreatePatron',
+                request_serializer=library__pb2.UpsertPatronRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertPatronResponse.FromString,
+                _registered_method=True)
+        self.UpdatePatron = channel.unary_unary(
+                '/Library/UpdatePatron',
+                request_serializer=library__pb2.UpsertPatronRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertPatronResponse.FromString,
+                _registered_method=True)
+        self.ListPatrons = channel.unary_unary(
+                '/Library/ListPatrons',
+                request_serializer=library__pb2.ListPatronsRequest.SerializeToString,
+                response_deserializer=library__pb2.ListPatronsResponse.FromString,
+                _registered_method=True)
+        self.GetPatron = channel.unary_unary(
+                '/Library/GetPatron',
+                request_serializer=library__pb2.GetPatronRequest.SerializeToString,
+                response_deserializer=library__pb2.GetPatronResponse.FromString,
+                _registered_method=True)
+        self.DeletePatron = channel.unary_unary(
+                '/Library/DeletePatron',
+                request_serializer=library__pb2.GetPatronRequest.SerializeToString,
+                response_deserializer=library__pb2.UpsertPatronResponse.FromString,
+                _registered_method=True)
+        self.SearchPatrons = channel.unary_unary(
+                '/Library/SearchPatrons',
+                request_serializer=library__pb2.SearchPatronsRequest.SerializeToString,
+                response_deserializer=library__pb2.SearchPatronsResponse.FromString,
+                _registered_method=True)
+        self.UpdatePatronMembership = channel.unary_unary(
+                '/Library/UpdatePatronMembership',
+                request_serializer=library__pb2.PatronMembershipRequest.SerializeToString,
+                response_deserializer=library__pb2.PatronMembershipResponse.FromString,
+                _registered_method=True)
+        self.GetLibraryStats = channel.unary_unary(
+                '/Library/GetLibraryStats',
+                request_serializer=library__pb2.GetLibraryStatsRequest.SerializeToString,
+                response_deserializer=library__pb2.GetLibraryStatsResponse.FromString,
+                _registered_method=True)
+        self.Session = channel.stream_stream(
+                '/Library/Session',
+                request_serializer=library__pb2.SessionRequest.SerializeToString,
+                response_deserializer=library__pb2.SessionResponse.FromString,
+                _registered_method=True)
+
+
+class LibraryServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def CreateBook(self, request, context):
+        """Book operations
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckoutBook(self, request, context):
+        """Only need uuid/isbn and will only return uuid/isbn
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReturnBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CheckoutBooks(self, request, context):
+        """Batch variants, executed as set based statements in chunked transactions
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReturnBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreatePatron(self, request, context):
+        """Patron operations
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdatePatron(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListPatrons(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPatron(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeletePatron(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchPatrons(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdatePatronMembership(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetLibraryStats(self, request, context):
+        """Dashboard counters
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Session(self, request_iterator, context):
+        """Any of the above over one stream. Operations run concurrently and answer as they
+        finish, in any order; at most SESSION_MAX_IN_FLIGHT run at once per stream
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_LibraryServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateBook,
+                    request_deserializer=library__pb2.UpsertBookRequest.FromString,
+                    response_serializer=library__pb2.UpsertBookResponse.SerializeToString,
+            ),
+            'UpdateBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateBook,
+                    request_deserializer=library__pb2.UpsertBookRequest.FromString,
+                    response_serializer=library__pb2.UpsertBookResponse.SerializeToString,
+            ),
+            'ListBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListBooks,
+                    request_deserializer=library__pb2.ListBooksRequest.FromString,
+                    response_serializer=library__pb2.ListBooksResponse.SerializeToString,
+            ),
+            'GetBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBook,
+                    request_deserializer=library__pb2.GetBookRequest.FromString,
+                    response_serializer=library__pb2.GetBookResponse.SerializeToString,
+            ),
+            'DeleteBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteBook,
+                    request_deserializer=library__pb2.GetBookRequest.FromString,
+                    response_serializer=library__pb2.UpsertBookResponse.SerializeToString,
+            ),
+            'CheckoutBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckoutBook,
+                    request_deserializer=library__pb2.GetBookRequest.FromString,
+                    response_serializer=library__pb2.UpsertBookResponse.SerializeToString,
+            ),
+            'ReturnBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReturnBook,
+                    request_deserializer=library__pb2.GetBookRequest.FromString,
+                    response_serializer=library__pb2.UpsertBookResponse.SerializeToString,
+            ),
+            'CheckoutBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.CheckoutBooks,
+                    request_deserializer=library__pb2.BatchBookRequest.FromString,
+                    response_serializer=library__pb2.BatchBookResponse.SerializeToString,
+            ),
+            'ReturnBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReturnBooks,
+                    request_deserializer=library__pb2.BatchBookRequest.FromString,
+                    response_serializer=library__pb2.BatchBookResponse.SerializeToString,
+            ),
+            'DeleteBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteBooks,
+                    request_deserializer=library__pb2.BatchBookRequest.FromString,
+                    response_serializer=library__pb2.BatchBookResponse.SerializeToString,
+            ),
+            'CreatePatron': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreatePatron,
+                    request_deserializer=library__pb2.UpsertPatronRequest.FromString,
+                    response_serializer=library__pb2.UpsertPatronResponse.SerializeToString,
+            ),
+            'UpdatePatron': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdatePatron,
+                    request_deserializer=library__pb2.UpsertPatronRequest.FromString,
+                    response_serializer=library__pb2.UpsertPatronResponse.SerializeToString,
+            ),
+            'ListPatrons': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListPatrons,
+                    request_deserializer=library__pb2.ListPatronsRequest.FromString,
+                    response_serializer=library__pb2.ListPatronsResponse.SerializeToString,
+            ),
+            'GetPatron': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPatron,
+                    request_deserializer=library__pb2.GetPatronRequest.FromString,
+                    response_serializer=library__pb2.GetPatronResponse.SerializeToString,
+            ),
+            'DeletePatron': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeletePatron,
+                    request_deserializer=library__pb2.GetPatronRequest.FromString,
+                    response_serializer=library__pb2.UpsertPatronResponse.SerializeToString,
+            ),
+            'SearchPatrons': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchPatrons,
+                    request_deserializer=library__pb2.SearchPatronsRequest.FromString,
+                    response_serializer=library__pb2.SearchPatronsResponse.SerializeToString,
+            ),
+            'UpdatePatronMembership': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdatePatronMembership,
+                    request_deserializer=library__pb2.PatronMembershipRequest.FromString,
+                    response_serializer=library__pb2.PatronMembershipResponse.SerializeToString,
+            ),
+            'GetLibraryStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetLibraryStats,
+                    request_deserializer=library__pb2.GetLibraryStatsRequest.FromString,
+                    response_serializer=library__pb2.GetLibraryStatsResponse.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=library__pb2.SessionRequest.FromString,
+                    response_serializer=library__pb2.SessionResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'Library', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('Library', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Library:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CreateBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/CreateBook',
+            library__pb2.UpsertBookRequest.SerializeToString,
+            library__pb2.UpsertBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/UpdateBook',
+            library__pb2.UpsertBookRequest.SerializeToString,
+            library__pb2.UpsertBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/ListBooks',
+            library__pb2.ListBooksRequest.SerializeToString,
+            library__pb2.ListBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/GetBook',
+            library__pb2.GetBookRequest.SerializeToString,
+            library__pb2.GetBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/DeleteBook',
+            library__pb2.GetBookRequest.SerializeToString,
+            library__pb2.UpsertBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckoutBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/CheckoutBook',
+            library__pb2.GetBookRequest.SerializeToString,
+            library__pb2.UpsertBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReturnBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/ReturnBook',
+            library__pb2.GetBookRequest.SerializeToString,
+            library__pb2.UpsertBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CheckoutBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/CheckoutBooks',
+            library__pb2.BatchBookRequest.SerializeToString,
+            library__pb2.BatchBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReturnBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/ReturnBooks',
+            library__pb2.BatchBookRequest.SerializeToString,
+            library__pb2.BatchBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/DeleteBooks',
+            library__pb2.BatchBookRequest.SerializeToString,
+            library__pb2.BatchBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreatePatron(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/CreatePatron',
+            library__pb2.UpsertPatronRequest.SerializeToString,
+            library__pb2.UpsertPatronResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdatePatron(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/UpdatePatron',
+            library__pb2.UpsertPatronRequest.SerializeToString,
+            library__pb2.UpsertPatronResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListPatrons(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/ListPatrons',
+            library__pb2.ListPatronsRequest.SerializeToString,
+            library__pb2.ListPatronsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetPatron(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/GetPatron',
+            library__pb2.GetPatronRequest.SerializeToString,
+            library__pb2.GetPatronResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeletePatron(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/DeletePatron',
+            library__pb2.GetPatronRequest.SerializeToString,
+            library__pb2.UpsertPatronResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchPatrons(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/SearchPatrons',
+            library__pb2.SearchPatronsRequest.SerializeToString,
+            library__pb2.SearchPatronsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdatePatronMembership(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/UpdatePatronMembership',
+            library__pb2.PatronMembershipRequest.SerializeToString,
+            library__pb2.PatronMembershipResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetLibraryStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/Library/GetLibraryStats',
+            library__pb2.GetLibraryStatsRequest.SerializeToString,
+            library__pb2.GetLibraryStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/Library/Session',
+            library__pb2.SessionRequest.SerializeToString,
+            library__pb2.SessionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,5 +1,9 @@
-from .book_repository import BookRepository
-from .database import connect_db
-
-__all__ = ['books', 'database']
+from .book_repository import BookRepository, IBookRepository
+from .sharded_book_repository import ShardedBookRepository
+from .replica_router import ReplicaRouter
+from .replicated_book_repository import ReplicatedBookRepository
+from .migrating_book_repository import MigratingBookRepository
+from .database import connect_db, connect_url, connect_shards, connect_per_thread, PerThreadConnection
 
+__all__ = ['books', 'database', 'sharded_book_repository', 'replica_router', 'replicated_book_repository',
+           'migrating_book_repository']
@@ -1,12 +1,54 @@
+import os
 from abc import ABC, abstractmethod
+from uuid import UUID
 
-from models import Book
+from models import Book, BatchOutcome, IDType
 
 
-INSERT_QUERY = 'insert into books (id,title,author,description,isbn_number,checked_out) values (%s,%s,%s,%s,%s,%s)'
-UPDATE_QUERY = 'update books set title=%s,author=%s,description=%s,isbn_number=%s,checked_out=%s where id=%s'
-GET_QUERY = 'select id,title,author,description,isbn_number,checked_out from books where id=%s'
-DELETE_QUERY = 'delete from books where id=%s'
+INSERT_QUERY = 'insert into {table} (id,title,author,description,isbn_number,checked_out) values (%s,%s,%s,%s,%s,%s)'
+UPDATE_QUERY = 'update {table} set title=%s,author=%s,description=%s,isbn_number=%s,checked_out=%s where id=%s'
+GET_QUERY = 'select id,title,author,description,isbn_number,checked_out from {table} where id=%s'
+GET_BY_ISBN_QUERY = 'select id,title,author,description,isbn_number,checked_out from {table} where isbn_number=%s'
+DELETE_QUERY = 'delete from {table} where id=%s'
+DELETE_BY_ISBN_QUERY = 'delete from {table} where isbn_number=%s'
+LIST_QUERY = 'select id,title,author,description,isbn_number,checked_out from {table} order by id limit %s'
+SCAN_QUERY = 'select id,title,author,description,isbn_number,checked_out from {table} where id>%s order by id limit %s'
+COUNT_QUERY = 'select count(*),coalesce(sum(checked_out),0) from {table}'
+SCAN_ISBN_QUERY = 'select isbn_number from {table} where isbn_number>%s order by isbn_number limit %s'
+ISBN_CHECKSUM_QUERY = 'select count(*),coalesce(sum(isbn_number),0) from {table}'
+BATCH_STATE_QUERY = 'select {key},checked_out from {table} where {key} in ({params}) for update'
+BATCH_CHECKOUT_QUERY = 'update {table} set checked_out=%s where {key} in ({params}) and checked_out=%s'
+BATCH_DELETE_QUERY = 'delete from {table} where {key} in ({params})'
+
+# Rows touched per transaction by the batch operations, keeps lock hold times short
+BATCH_CHUNK_SIZE = 200
+BATCH_KEY_COLUMNS = {IDType.UUID: 'id', IDType.ISBN: 'isbn_number'}
+
+# books.id is char(36) until migrations/create_books_v2_table.sql has been cut over,
+# then it is binary(16) and ids are converted here, callers always see strings
+BINARY_IDS = os.getenv('BOOKS_BINARY_IDS', '0') == '1'
+
+
+def encode_book_id(id: str, binary: bool = BINARY_IDS) -> str | bytes | None:
+    """Column value for a book uuid, None for strings that can not be a binary uuid"""
+    if not binary:
+        return id
+    try:
+        return UUID(id).bytes
+    except ValueError:
+        return None
+
+
+def decode_book_id(value: str | bytes) -> str:
+    # decided by type so rows from either column format read the same
+    if isinstance(value, (bytes, bytearray)):
+        return str(UUID(bytes=bytes(value)))
+    return value
+
+
+def _decode_row(row: tuple) -> tuple:
+    return (decode_book_id(row[0]), *row[1:])
+
 
 class IBookRepository(ABC):
     """Book repository interface"""
@@ -20,11 +62,45 @@ class IBookRepository(ABC):
         pass
 
     @abstractmethod
-    def get_book_by_id(self, id: str) -> Book:
+    def get_book_by_id(self, id: str) -> Book | None:
+        pass
+
+    @abstractmethod
+    def get_book_by_isbn(self, isbn: int) -> Book | None:
+        pass
+
+    @abstractmethod
+    def list_books(self, limit: int) -> list[Book]:
+        pass
+
+    @abstractmethod
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        pass
+
+    @abstractmethod
+    def scan_book_rows(self, after_id: str, limit: int) -> list[tuple]:
+        pass
+
+    @abstractmethod
+    def count_books(self) -> tuple[int, int]:
+        pass
+
+    @abstractmethod
+    def scan_isbns(self, after_isbn: int, limit: int) -> list[int]:
+        pass
+
+    @abstractmethod
+    def isbn_checksum(self) -> tuple[int, int]:
         pass
 
     @abstractmethod
-    def get_book_by_isbn(self, isbn: int) -> Book:
+    def set_checked_out_many(
+        self, ids: list[str | int], checked_out: bool, id_type: IDType = IDType.UUID
+    ) -> dict[str | int, BatchOutcome]:
+        pass
+
+    @abstractmethod
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
         pass
 
     @abstractmethod
@@ -37,44 +113,208 @@ class IBookRepository(ABC):
 
 
 class BookRepository(IBookRepository):
-    """Concrete implementation of IBookRepository"""
+    """
+    Concrete implementation of IBookRepository
+
+    Every write commits or rolls back on db, so a db shared by several
+    threads must be a PerThreadConnection, a batch could otherwise be split
+    by another thread's commit or rollback.
+    """
 
-    def __init__(self, db):
+    def __init__(self, db, table: str = 'books', binary_ids: bool | None = None):
         self._db = db
+        self._binary_ids = BINARY_IDS if binary_ids is None else binary_ids
+        # the batch queries keep their {key} and {params} placeholders for later
+        self._insert_query = INSERT_QUERY.replace('{table}', table)
+        self._update_query = UPDATE_QUERY.replace('{table}', table)
+        self._get_query = GET_QUERY.replace('{table}', table)
+        self._get_by_isbn_query = GET_BY_ISBN_QUERY.replace('{table}', table)
+        self._delete_query = DELETE_QUERY.replace('{table}', table)
+        self._delete_by_isbn_query = DELETE_BY_ISBN_QUERY.replace('{table}', table)
+        self._list_query = LIST_QUERY.replace('{table}', table)
+        self._scan_query = SCAN_QUERY.replace('{table}', table)
+        self._count_query = COUNT_QUERY.replace('{table}', table)
+        self._scan_isbn_query = SCAN_ISBN_QUERY.replace('{table}', table)
+        self._isbn_checksum_query = ISBN_CHECKSUM_QUERY.replace('{table}', table)
+        self._batch_state_query = BATCH_STATE_QUERY.replace('{table}', table)
+        self._batch_checkout_query = BATCH_CHECKOUT_QUERY.replace('{table}', table)
+        self._batch_delete_query = BATCH_DELETE_QUERY.replace('{table}', table)
 
     def create_book(self, book: Book) -> str:
         cursor = self._db.cursor()
-        cursor.execute(INSERT_QUERY, book.get_tuple())
+        cursor.execute(self._insert_query, (self._encode_strict(book.id), *book.get_tuple()[1:]))
         self._db.commit()
         return book.id
 
     def update_book(self, book: Book) -> str:
         cursor = self._db.cursor()
-        cursor.execute(UPDATE_QUERY, book.get_tuple_id_last()) # id needs to come last, see models/book.py for method docs
+        # id needs to come last, see models/book.py for method docs
+        cursor.execute(self._update_query, (*book.get_tuple_id_last()[:-1], self._encode_strict(book.id)))
         self._db.commit()
         return book.id
 
-    def get_book_by_id(self, id: str) -> Book:
+    def get_book_by_id(self, id: str) -> Book | None:
         cursor = self._db.cursor()
-        cursor.execute(GET_QUERY, (id,))
+        cursor.execute(self._get_query, (self._encode(id),))
         row = cursor.fetchone()
-        return Book(*row)
+        return Book(*_decode_row(row)) if row else None
 
-    def get_book_by_isbn(self, isbn: int) -> Book:
+    def get_book_by_isbn(self, isbn: int) -> Book | None:
         cursor = self._db.cursor()
-        cursor.execute(GET_QUERY, (isbn,))
+        cursor.execute(self._get_by_isbn_query, (isbn,))
         row = cursor.fetchone()
-        return Book(*row)
+        return Book(*_decode_row(row)) if row else None
+
+    def list_books(self, limit: int) -> list[Book]:
+        return [Book(*row) for row in self.list_book_rows(limit)]
+
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        # raw rows in Book field order, lets list responses skip building a dataclass per row
+        cursor = self._db.cursor()
+        cursor.execute(self._list_query, (limit,))
+        return self._decode_rows(cursor.fetchall())
+
+    def scan_book_rows(self, after_id: str, limit: int) -> list[tuple]:
+        # keyset page in primary key order, start with after_id='' and pass the last id seen.
+        # uuid strings and their 16 byte form sort the same, so the order is the same either way
+        cursor = self._db.cursor()
+        cursor.execute(self._scan_query, (self._encode_strict(after_id) if after_id else after_id, limit))
+        return self._decode_rows(cursor.fetchall())
+
+    def count_books(self) -> tuple[int, int]:
+        """Total and checked out books, a full scan kept off the request path"""
+        cursor = self._db.cursor()
+        cursor.execute(self._count_query)
+        total, checked_out = cursor.fetchone()
+        # ends the read snapshot so the next count sees new commits
+        self._db.commit()
+        return int(total), int(checked_out)
+
+    def scan_isbns(self, after_isbn: int, limit: int) -> list[int]:
+        # keyset page over the unique isbn index, start with after_isbn=-1
+        cursor = self._db.cursor()
+        cursor.execute(self._scan_isbn_query, (after_isbn, limit))
+        isbns = [row[0] for row in cursor.fetchall()]
+        self._db.commit()
+        return isbns
+
+    def isbn_checksum(self) -> tuple[int, int]:
+        """Count and sum of the isbns, read from the index alone; tells whether the set changed"""
+        cursor = self._db.cursor()
+        cursor.execute(self._isbn_checksum_query)
+        count, total = cursor.fetchone()
+        self._db.commit()
+        return int(count), int(total)
+
+    def set_checked_out_many(
+        self, ids: list[str | int], checked_out: bool, id_type: IDType = IDType.UUID
+    ) -> dict[str | int, BatchOutcome]:
+        """Checks out or returns many books with one set based update per chunk"""
+        key = BATCH_KEY_COLUMNS[id_type]
+        outcomes = {}
+        for chunk, values in self._batch_chunks(ids, id_type, outcomes):
+            params = ','.join(['%s'] * len(values))
+            cursor = self._db.cursor()
+            try:
+                # lock the rows first so the outcome of each item is known exactly
+                cursor.execute(self._batch_state_query.format(key=key, params=params), values)
+                states = _key_map(cursor.fetchall())
+                cursor.execute(
+                    self._batch_checkout_query.format(key=key, params=params),
+                    (checked_out, *values, not checked_out)
+                )
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+            for id, value in zip(chunk, values):
+                if value not in states:
+                    outcomes[id] = BatchOutcome.NOT_FOUND
+                elif bool(states[value]) == checked_out:
+                    outcomes[id] = BatchOutcome.CONFLICT
+                else:
+                    outcomes[id] = BatchOutcome.OK
+        return outcomes
+
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        """Deletes many books with one set based delete per chunk"""
+        key = BATCH_KEY_COLUMNS[id_type]
+        outcomes = {}
+        for chunk, values in self._batch_chunks(ids, id_type, outcomes):
+            params = ','.join(['%s'] * len(values))
+            cursor = self._db.cursor()
+            try:
+                cursor.execute(self._batch_state_query.format(key=key, params=params), values)
+                found = _key_map(cursor.fetchall())
+                cursor.execute(self._batch_delete_query.format(key=key, params=params), values)
+                self._db.commit()
+            except Exception:
+                self._db.rollback()
+                raise
+            for id, value in zip(chunk, values):
+                outcomes[id] = BatchOutcome.OK if value in found else BatchOutcome.NOT_FOUND
+        return outcomes
 
     def delete_book_by_id(self, id: str) -> bool:
         cursor = self._db.cursor()
-        cursor.execute(DELETE_QUERY, (id,))
+        cursor.execute(self._delete_query, (self._encode(id),))
         self._db.commit()
-        return True
+        return cursor.rowcount > 0
 
     def delete_book_by_isbn(self, isbn: int) -> bool:
         cursor = self._db.cursor()
-        cursor.execute(DELETE_QUERY, (isbn,))
+        cursor.execute(self._delete_by_isbn_query, (isbn,))
         self._db.commit()
-        return True
+        return cursor.rowcount > 0
+
+    def _encode(self, id: str) -> str | bytes | None:
+        # a malformed id becomes NULL, which matches no row
+        return encode_book_id(id, self._binary_ids)
+
+    def _encode_strict(self, id: str) -> str | bytes:
+        value = encode_book_id(id, self._binary_ids)
+        if value is None:
+            raise ValueError(f'book id {id!r} is not a uuid')
+        return value
+
+    def _decode_rows(self, rows: list[tuple]) -> list[tuple]:
+        if not self._binary_ids and not (rows and isinstance(rows[0][0], (bytes, bytearray))):
+            return rows
+        return [_decode_row(row) for row in rows]
+
+    def _batch_chunks(self, ids: list[str | int], id_type: IDType, outcomes: dict) -> list[tuple[list, tuple]]:
+        """Chunks of ids next to their column values, ids that can not exist are NOT_FOUND up front"""
+        chunks = []
+        for chunk in _chunks(ids):
+            if id_type is IDType.UUID and self._binary_ids:
+                for id in chunk:
+                    if self._encode(id) is None:
+                        outcomes[id] = BatchOutcome.NOT_FOUND
+                chunk = [id for id in chunk if id not in outcomes]
+                if not chunk:
+                    continue
+                values = tuple(self._encode(id) for id in chunk)
+            elif id_type is IDType.UUID:
+                # the column compares case insensitively, the outcomes are matched up in lower case too
+                values = tuple(id.lower() for id in chunk)
+            else:
+                values = tuple(chunk)
+            chunks.append((chunk, values))
+        return chunks
+
+
+def _key_map(rows: list[tuple]) -> dict:
+    # some drivers hand binary columns back as bytearray, which can not be a dict key
+    return {_map_key(key): value for key, value in rows}
+
+
+def _map_key(key):
+    if isinstance(key, bytearray):
+        return bytes(key)
+    return key.lower() if isinstance(key, str) else key
+
 
+def _chunks(ids: list) -> list[list]:
+    # duplicates would only inflate the IN list
+    unique = list(dict.fromkeys(ids))
+    return [unique[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(unique), BATCH_CHUNK_SIZE)]
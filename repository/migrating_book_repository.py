@@ -0,0 +1,155 @@
+from typing import Callable, TypeVar
+
+from models import Book, BatchOutcome, IDType
+from .book_repository import IBookRepository, BookRepository, encode_book_id
+
+
+SHADOW_TABLE = 'books_v2'
+# replace so a row the backfill copied first is overwritten instead of failing the write
+SHADOW_UPSERT_QUERY = (
+    'replace into ' + SHADOW_TABLE + ' (id,title,author,description,isbn_number,checked_out) '
+    'values (%s,%s,%s,%s,%s,%s)'
+)
+
+MIGRATION_PHASES = ('dual-write', 'dual-read')
+
+T = TypeVar('T')
+
+
+class _DeferredCommit:
+    """Connection whose commits are left to the enclosing dual write, so both tables commit as one"""
+
+    def __init__(self, db) -> None:
+        self._db = db
+
+    def cursor(self, *args, **kwargs):
+        return self._db.cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        self._db.rollback()
+
+
+class MigratingBookRepository(IBookRepository):
+    """
+    IBookRepository used while books moves from char(36) to binary(16) ids
+
+    Every write goes to the books table and is mirrored into books_v2, the
+    shadow table scripts/migrate-book-ids.py backfills. In the dual-read phase
+    lookups by id or isbn are served from books_v2 and fall back to books for
+    rows the backfill has not reached yet. Listing and scans stay on books, it
+    is the only complete copy until the cut over.
+
+    A write and its mirror commit in one transaction, a crash between the two
+    can not leave the tables apart. Batch operations hold their row locks
+    until the whole batch is mirrored rather than per chunk. The transaction
+    is the connection's, so with several threads db must be a
+    PerThreadConnection, another thread's rollback would otherwise undo a
+    write whose mirror then commits alone.
+    """
+
+    def __init__(self, db, phase: str = 'dual-write'):
+        if phase not in MIGRATION_PHASES:
+            raise ValueError(f'unknown migration phase {phase!r}, expected one of {MIGRATION_PHASES}')
+        self._db = db
+        self._phase = phase
+        self._primary = BookRepository(db, binary_ids=False)
+        self._shadow = BookRepository(db, table=SHADOW_TABLE, binary_ids=True)
+        # the same tables for writes, committed once both are written
+        deferred = _DeferredCommit(db)
+        self._primary_writer = BookRepository(deferred, binary_ids=False)
+        self._shadow_writer = BookRepository(deferred, table=SHADOW_TABLE, binary_ids=True)
+
+    def create_book(self, book: Book) -> str:
+        return self._dual_write(lambda: self._write_mirrored(self._primary_writer.create_book, book))
+
+    def update_book(self, book: Book) -> str:
+        return self._dual_write(lambda: self._write_mirrored(self._primary_writer.update_book, book))
+
+    def get_book_by_id(self, id: str) -> Book | None:
+        if self._phase == 'dual-read':
+            book = self._shadow.get_book_by_id(id)
+            if book is not None:
+                return book
+        return self._primary.get_book_by_id(id)
+
+    def get_book_by_isbn(self, isbn: int) -> Book | None:
+        if self._phase == 'dual-read':
+            book = self._shadow.get_book_by_isbn(isbn)
+            if book is not None:
+                return book
+        return self._primary.get_book_by_isbn(isbn)
+
+    def list_books(self, limit: int) -> list[Book]:
+        return self._primary.list_books(limit)
+
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        return self._primary.list_book_rows(limit)
+
+    def scan_book_rows(self, after_id: str, limit: int) -> list[tuple]:
+        return self._primary.scan_book_rows(after_id, limit)
+
+    def count_books(self) -> tuple[int, int]:
+        return self._primary.count_books()
+
+    def scan_isbns(self, after_isbn: int, limit: int) -> list[int]:
+        return self._primary.scan_isbns(after_isbn, limit)
+
+    def isbn_checksum(self) -> tuple[int, int]:
+        return self._primary.isbn_checksum()
+
+    def set_checked_out_many(
+        self, ids: list[str | int], checked_out: bool, id_type: IDType = IDType.UUID
+    ) -> dict[str | int, BatchOutcome]:
+        def write() -> dict[str | int, BatchOutcome]:
+            outcomes = self._primary_writer.set_checked_out_many(ids, checked_out, id_type)
+            # books decides the outcome, the shadow only follows
+            self._shadow_writer.set_checked_out_many(
+                [id for id, outcome in outcomes.items() if outcome is BatchOutcome.OK], checked_out, id_type
+            )
+            return outcomes
+        return self._dual_write(write)
+
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        def write() -> dict[str | int, BatchOutcome]:
+            outcomes = self._primary_writer.delete_books(ids, id_type)
+            self._shadow_writer.delete_books(ids, id_type)
+            return outcomes
+        return self._dual_write(write)
+
+    def delete_book_by_id(self, id: str) -> bool:
+        return self._dual_write(lambda: self._delete_mirrored(
+            lambda: self._primary_writer.delete_book_by_id(id), lambda: self._shadow_writer.delete_book_by_id(id)
+        ))
+
+    def delete_book_by_isbn(self, isbn: int) -> bool:
+        return self._dual_write(lambda: self._delete_mirrored(
+            lambda: self._primary_writer.delete_book_by_isbn(isbn),
+            lambda: self._shadow_writer.delete_book_by_isbn(isbn)
+        ))
+
+    def _dual_write(self, write: Callable[[], T]) -> T:
+        try:
+            result = write()
+            self._db.commit()
+            return result
+        except Exception:
+            self._db.rollback()
+            raise
+
+    def _delete_mirrored(self, delete: Callable[[], bool], delete_shadow: Callable[[], bool]) -> bool:
+        # books decides whether the book existed, the backfill may not have copied it yet
+        deleted = delete()
+        delete_shadow()
+        return deleted
+
+    def _write_mirrored(self, write: Callable[[Book], str], book: Book) -> str:
+        write(book)
+        id = encode_book_id(book.id, binary=True)
+        if id is not None:
+            # ids that are not uuids can not move to binary(16), the backfill reports them
+            cursor = self._db.cursor()
+            cursor.execute(SHADOW_UPSERT_QUERY, (id, *book.get_tuple()[1:]))
+        return book.id
@@ -1,48 +1,121 @@
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from typing import Optional
+from pymongo.read_preferences import Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
+from typing import Optional, Union
 import os
 from datetime import datetime
 
+
+# Smallest value MongoDB accepts for maxStalenessSeconds
+MIN_MAX_STALENESS_SECONDS = 90
+
+ServerMode = Union[Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest]
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to default"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+def _env_list(name: str, default: list[str]) -> list[str]:
+    """Read a comma separated setting from the environment"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 class MongoDBConnection:
     """MongoDB connection manager"""
     
-    def __init__(self, connection_string: Optional[str] = None, database_name: str = "library_db"):
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        database_name: str = "library_db",
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        compressors: Optional[list[str]] = None,
+        read_preference: Optional[str] = None,
+        max_staleness_seconds: Optional[int] = None
+    ):
         """
         Initialize MongoDB connection
         
         Args:
             connection_string: MongoDB connection string. If None, uses environment variable or default
             database_name: Name of the database to use
+            max_pool_size: Maximum connections per server (MONGODB_MAX_POOL_SIZE, default 100)
+            min_pool_size: Connections kept open per server (MONGODB_MIN_POOL_SIZE, default 0)
+            compressors: Wire compressors in order of preference, e.g. ["zstd", "snappy", "zlib"]
+                (MONGODB_COMPRESSORS, default none)
+            read_preference: Routing for queries that tolerate bounded staleness
+                (MONGODB_READ_PREFERENCE, default secondaryPreferred)
+            max_staleness_seconds: Staleness bound for reads routed to secondaries
+                (MONGODB_MAX_STALENESS_SECONDS, default 90)
         """
         self.connection_string = connection_string or os.getenv(
             'MONGODB_URI', 
             'mongodb://localhost:27017/'
         )
         self.database_name = database_name
+        self.max_pool_size = max_pool_size if max_pool_size is not None else _env_int('MONGODB_MAX_POOL_SIZE', 100)
+        self.min_pool_size = min_pool_size if min_pool_size is not None else _env_int('MONGODB_MIN_POOL_SIZE', 0)
+        self.compressors = compressors if compressors is not None else _env_list('MONGODB_COMPRESSORS', [])
+        self.read_preference = read_preference or os.getenv('MONGODB_READ_PREFERENCE', 'secondaryPreferred')
+        self.max_staleness_seconds = max(
+            max_staleness_seconds if max_staleness_seconds is not None
+            else _env_int('MONGODB_MAX_STALENESS_SECONDS', MIN_MAX_STALENESS_SECONDS),
+            MIN_MAX_STALENESS_SECONDS
+        )
+        if self.read_preference not in READ_PREFERENCES:
+            raise ValueError(f"Unknown read preference: {self.read_preference}")
         self._client: Optional[MongoClient] = None
         self._database = None
         
-    def connect(self) -> bool:
+    def connect(self, wait: bool = True) -> bool:
         """
         Establish connection to MongoDB
         
+        Args:
+            wait: Ping the server before returning. Without it the client finds
+                the servers in the background and is_available tells when it has
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
+            options = {}
+            if self.compressors:
+                options["compressors"] = ",".join(self.compressors)
+
             self._client = MongoClient(
                 self.connection_string,
                 serverSelectionTimeoutMS=5000,  # 5 second timeout
                 connectTimeoutMS=10000,        # 10 second connection timeout
-                socketTimeoutMS=20000           # 20 second socket timeout
+                socketTimeoutMS=20000,          # 20 second socket timeout
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                **options
             )
             
             # Test the connection
-            self._client.admin.command('ping')
+            if wait:
+                self._client.admin.command('ping')
             self._database = self._client[self.database_name]
             
-            print(f"Successfully connected to MongoDB database: {self.database_name}")
+            if wait:
+                print(f"Successfully connected to MongoDB database: {self.database_name}")
             return True
             
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
@@ -67,25 +140,45 @@ class MongoDBConnection:
         Returns:
             Database instance or None if not connected
         """
-        if not self._database:
+        if self._database is None:
             if not self.connect():
                 return None
         return self._database
     
-    def get_collection(self, collection_name: str):
+    def get_collection(self, collection_name: str, read_preference: Optional[ServerMode] = None):
         """
         Get a collection from the database
         
         Args:
             collection_name: Name of the collection
+            read_preference: Optional read preference overriding the client default
             
         Returns:
             Collection instance or None if not connected
         """
         database = self.get_database()
-        if database:
-            return database[collection_name]
-        return None
+        if database is None:
+            return None
+        collection = database[collection_name]
+        if read_preference is not None:
+            collection = collection.with_options(read_preference=read_preference)
+        return collection
+
+    def primary_read_preference(self) -> ServerMode:
+        """Read preference for writes and reads that must observe them"""
+        return Primary()
+
+    def secondary_read_preference(self) -> ServerMode:
+        """
+        Read preference for queries that tolerate bounded staleness
+
+        The configured read_preference, bounded by max_staleness_seconds. With
+        secondaryPreferred this falls back to the primary when no secondary is
+        within the bound.
+        """
+        if self.read_preference == "primary":
+            return Primary()
+        return READ_PREFERENCES[self.read_preference](max_staleness=self.max_staleness_seconds)
     
     def is_connected(self) -> bool:
         """
@@ -102,24 +195,35 @@ class MongoDBConnection:
             pass
         return False
     
+    def is_available(self) -> bool:
+        """
+        Check if a primary is known, without blocking on server selection
+        
+        Returns:
+            bool: True if writes can be routed right now, False otherwise
+        """
+        return self._client is not None and self._client.topology_description.has_writable_server()
+    
     def create_indexes(self):
         """Create necessary indexes for optimal performance"""
         try:
             # Patrons collection indexes
             patrons_collection = self.get_collection("patrons")
-            if patrons_collection:
+            if patrons_collection is not None:
                 # Unique index on email
                 patrons_collection.create_index("email", unique=True)
                 # Index on membership_type for filtering
                 patrons_collection.create_index("membership_type")
                 # Index on active status
                 patrons_collection.create_index("active")
+                # Expired memberships still marked active, what the expiry job looks for
+                patrons_collection.create_index([("active", 1), ("membership_end_date", 1)])
                 # Compound index for name searches
                 patrons_collection.create_index([("first_name", 1), ("last_name", 1)])
                 
             # Books collection indexes (if using MongoDB for books too)
             books_collection = self.get_collection("books")
-            if books_collection:
+            if books_collection is not None:
                 # Unique index on ISBN
                 books_collection.create_index("isbn_number", unique=True)
                 # Index on checked_out status
@@ -146,15 +250,18 @@ def get_mongodb_connection() -> MongoDBConnection:
         _mongodb_connection = MongoDBConnection()
     return _mongodb_connection
 
-def connect_mongodb() -> bool:
+def connect_mongodb(wait: bool = True) -> bool:
     """
     Connect to MongoDB using the global connection
     
+    Args:
+        wait: Ping the server before returning, see MongoDBConnection.connect
+    
     Returns:
         bool: True if connection successful, False otherwise
     """
     connection = get_mongodb_connection()
-    return connection.connect()
+    return connection.connect(wait)
 
 def disconnect_mongodb():
     """Disconnect from MongoDB"""
@@ -0,0 +1,127 @@
+import threading
+from abc import ABC, abstractmethod
+
+from models import OutboxEvent, OutboxEventType
+from .book_repository import encode_book_id
+
+
+CHECKOUT_QUERY = 'update books set checked_out=%s where id=%s and checked_out=%s'
+SHADOW_CHECKOUT_QUERY = 'update {table} set checked_out=%s where id=%s'
+OUTBOX_INSERT_QUERY = 'insert into patron_outbox (event_type,patron_id,book_id) values (%s,%s,%s)'
+PENDING_QUERY = (
+    'select id,event_type,patron_id,book_id,attempts,created_at from patron_outbox '
+    'where applied_at is null and attempts<%s order by id limit %s'
+)
+OLDEST_PENDING_QUERY = (
+    'select timestampdiff(microsecond, min(created_at), current_timestamp(6)) from patron_outbox '
+    'where applied_at is null and attempts<%s'
+)
+MARK_APPLIED_QUERY = 'update patron_outbox set applied_at=current_timestamp(6) where id in ({})'
+MARK_FAILED_QUERY = 'update patron_outbox set attempts=attempts+1 where id in ({})'
+
+
+class IOutboxRepository(ABC):
+    """Book checkout + patron outbox repository interface"""
+
+    @abstractmethod
+    def checkout_book(self, book_id: str, patron_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def return_book(self, book_id: str, patron_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def fetch_pending(self, limit: int, max_attempts: int) -> list[OutboxEvent]:
+        pass
+
+    @abstractmethod
+    def mark_applied(self, ids: list[int]) -> None:
+        pass
+
+    @abstractmethod
+    def mark_failed(self, ids: list[int]) -> None:
+        pass
+
+    @abstractmethod
+    def oldest_pending_age(self, max_attempts: int) -> float:
+        pass
+
+
+class OutboxRepository(IOutboxRepository):
+    """
+    MySQL implementation of IOutboxRepository
+
+    Checkouts and returns flip the book and enqueue the matching patron update
+    in one transaction, the outbox worker applies the patron side to mongo later.
+    While books is being migrated to binary ids shadow_table names the copy
+    the flip is mirrored into, in the same transaction.
+
+    db must be a connection of its own: the transactions are serialized on
+    it, a commit or rollback from a thread outside the repository would split
+    the book flip from its outbox event.
+    """
+
+    def __init__(self, db, shadow_table: str | None = None):
+        self._db = db
+        self._lock = threading.Lock()
+        self._shadow_query = SHADOW_CHECKOUT_QUERY.format(table=shadow_table) if shadow_table else None
+
+    def checkout_book(self, book_id: str, patron_id: str) -> bool:
+        return self._set_checked_out(book_id, patron_id, True, OutboxEventType.CHECKOUT)
+
+    def return_book(self, book_id: str, patron_id: str) -> bool:
+        return self._set_checked_out(book_id, patron_id, False, OutboxEventType.RETURN)
+
+    def fetch_pending(self, limit: int, max_attempts: int) -> list[OutboxEvent]:
+        with self._lock:
+            cursor = self._db.cursor()
+            cursor.execute(PENDING_QUERY, (max_attempts, limit))
+            rows = cursor.fetchall()
+            # end the read snapshot so the next poll sees newly committed events
+            self._db.commit()
+        return [
+            OutboxEvent(id, OutboxEventType(event_type), patron_id, book_id, attempts, created_at)
+            for id, event_type, patron_id, book_id, attempts, created_at in rows
+        ]
+
+    def mark_applied(self, ids: list[int]) -> None:
+        self._update_ids(MARK_APPLIED_QUERY, ids)
+
+    def mark_failed(self, ids: list[int]) -> None:
+        self._update_ids(MARK_FAILED_QUERY, ids)
+
+    def oldest_pending_age(self, max_attempts: int) -> float:
+        """Seconds the oldest unapplied event has been waiting, 0 when caught up"""
+        with self._lock:
+            cursor = self._db.cursor()
+            cursor.execute(OLDEST_PENDING_QUERY, (max_attempts,))
+            (micros,) = cursor.fetchone()
+            self._db.commit()
+        return (micros or 0) / 1_000_000
+
+    def _set_checked_out(self, book_id: str, patron_id: str, checked_out: bool, event_type: OutboxEventType) -> bool:
+        with self._lock:
+            cursor = self._db.cursor()
+            try:
+                # only flips books in the opposite state, a rowcount of 0 means nothing to do
+                cursor.execute(CHECKOUT_QUERY, (checked_out, encode_book_id(book_id), not checked_out))
+                if cursor.rowcount != 1:
+                    self._db.rollback()
+                    return False
+                if self._shadow_query:
+                    cursor.execute(self._shadow_query, (checked_out, encode_book_id(book_id, binary=True)))
+                cursor.execute(OUTBOX_INSERT_QUERY, (event_type.value, patron_id, book_id))
+                self._db.commit()
+                return True
+            except Exception:
+                self._db.rollback()
+                raise
+
+    def _update_ids(self, query: str, ids: list[int]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            cursor = self._db.cursor()
+            cursor.execute(query.format(','.join(['%s'] * len(ids))), tuple(ids))
+            self._db.commit()
@@ -1,16 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from datetime import datetime
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
+from bson.errors import InvalidId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from models.patron import Patron
+from models.patron import Patron, utc_now
+from models.outbox import OutboxEvent, OutboxEventType
 from repository.mongodb_database import get_mongodb_connection
 
+if TYPE_CHECKING:
+    from stats import LibraryCounters
+
+
+# How many applied outbox event ids each patron remembers for idempotent replays
+APPLIED_OUTBOX_EVENTS_KEPT = 50
+
+# Fields the stats counters need from a patron's previous version
+STATS_PROJECTION = {"membership_type": 1, "active": 1}
+
 
 class IPatronRepository(ABC):
     """Patron repository interface"""
 
+    @abstractmethod
+    def available(self) -> bool:
+        """False while the store can not take writes, checked without blocking"""
+        pass
+
     @abstractmethod
     def create_patron(self, patron: Patron) -> str:
         """Create a new patron"""
@@ -41,6 +59,16 @@ class IPatronRepository(ABC):
         """List patrons with pagination"""
         pass
 
+    @abstractmethod
+    def list_patron_documents(self, limit: int = 100, offset: int = 0, active_only: bool = True) -> List[dict]:
+        """List raw patron documents with pagination"""
+        pass
+
+    @abstractmethod
+    def scan_patron_documents(self, after_id: Optional[str], limit: int) -> List[dict]:
+        """Page of raw patron documents in _id order, after after_id"""
+        pass
+
     @abstractmethod
     def search_patrons_by_name(self, name: str, limit: int = 50) -> List[Patron]:
         """Search patrons by name (first or last)"""
@@ -51,6 +79,21 @@ class IPatronRepository(ABC):
         """Get patrons by membership type"""
         pass
 
+    @abstractmethod
+    def count_patrons(self) -> Dict[str, Tuple[int, int]]:
+        """Total and active patrons per membership type"""
+        pass
+
+    @abstractmethod
+    def update_membership(self, patron_id: str, membership_type: str, membership_end_date: Optional[datetime]) -> bool:
+        """Change a patron's membership type and end date, active follows the end date"""
+        pass
+
+    @abstractmethod
+    def deactivate_expired_patrons(self, now: datetime, batch_size: int = 1000) -> int:
+        """Mark patrons whose membership ended before now inactive, returns how many"""
+        pass
+
     @abstractmethod
     def checkout_book(self, patron_id: str, book_id: str) -> bool:
         """Add book to patron's checked out list"""
@@ -61,6 +104,11 @@ class IPatronRepository(ABC):
         """Remove book from patron's checked out list"""
         pass
 
+    @abstractmethod
+    def apply_outbox_events(self, events: List[OutboxEvent]) -> List[int]:
+        """Apply checkout/return outbox events, returns the ids of events that failed"""
+        pass
+
     @abstractmethod
     def get_patrons_with_overdue_books(self) -> List[Patron]:
         """Get patrons who have overdue books (placeholder for future implementation)"""
@@ -70,16 +118,32 @@ class IPatronRepository(ABC):
 class PatronRepository(IPatronRepository):
     """MongoDB implementation of IPatronRepository"""
 
-    def __init__(self):
+    def __init__(self, counters: "LibraryCounters | None" = None):
         self._connection = get_mongodb_connection()
+        self._counters = counters
         self._collection = None
+        self._secondary_collection = None
 
     def _get_collection(self):
-        """Get the patrons collection"""
-        if not self._collection:
-            self._collection = self._connection.get_collection("patrons")
+        """Get the patrons collection routed to the primary"""
+        if self._collection is None:
+            self._collection = self._connection.get_collection(
+                "patrons", self._connection.primary_read_preference()
+            )
         return self._collection
 
+    def _get_secondary_collection(self):
+        """Get the patrons collection for reads that tolerate bounded staleness"""
+        if self._secondary_collection is None:
+            self._secondary_collection = self._connection.get_collection(
+                "patrons", self._connection.secondary_read_preference()
+            )
+        return self._secondary_collection
+
+    def available(self) -> bool:
+        """False while no primary is known, the client keeps looking in the background"""
+        return self._connection.is_available()
+
     def create_patron(self, patron: Patron) -> str:
         """Create a new patron"""
         try:
@@ -91,6 +155,8 @@ class PatronRepository(IPatronRepository):
                 del patron_dict["_id"]
             
             result = collection.insert_one(patron_dict)
+            if self._counters:
+                self._counters.patron_added(patron.membership_type, patron.active)
             return str(result.inserted_id)
             
         except DuplicateKeyError:
@@ -105,19 +171,26 @@ class PatronRepository(IPatronRepository):
             patron_dict = patron.to_dict()
             
             # Update the updated_at timestamp
-            patron_dict["updated_at"] = datetime.now()
+            patron_dict["updated_at"] = utc_now()
             
             # Remove _id from update data
             patron_id = patron_dict.pop("_id")
             
-            result = collection.update_one(
+            # the previous version comes back in the same round trip, the stats need it
+            before = collection.find_one_and_update(
                 {"_id": ObjectId(patron_id)},
-                {"$set": patron_dict}
+                {"$set": patron_dict},
+                projection=STATS_PROJECTION,
+                return_document=ReturnDocument.BEFORE
             )
             
-            if result.matched_count == 0:
+            if before is None:
                 raise ValueError(f"Patron with ID {patron_id} not found")
             
+            if self._counters:
+                self._counters.patron_changed(
+                    before["membership_type"], before["active"], patron.membership_type, patron.active
+                )
             return patron_id
             
         except Exception as e:
@@ -126,6 +199,7 @@ class PatronRepository(IPatronRepository):
     def get_patron_by_id(self, patron_id: str) -> Optional[Patron]:
         """Get patron by ID"""
         try:
+            # Stays on the primary so a lookup right after a write sees it
             collection = self._get_collection()
             patron_data = collection.find_one({"_id": ObjectId(patron_id)})
             
@@ -153,37 +227,54 @@ class PatronRepository(IPatronRepository):
         """Delete patron by ID"""
         try:
             collection = self._get_collection()
-            result = collection.delete_one({"_id": ObjectId(patron_id)})
+            deleted = collection.find_one_and_delete({"_id": ObjectId(patron_id)}, projection=STATS_PROJECTION)
             
-            return result.deleted_count > 0
+            if deleted is None:
+                return False
+            if self._counters:
+                self._counters.patron_removed(deleted["membership_type"], deleted["active"])
+            return True
             
         except Exception as e:
             raise Exception(f"Failed to delete patron: {str(e)}")
 
     def list_patrons(self, limit: int = 100, offset: int = 0, active_only: bool = True) -> List[Patron]:
         """List patrons with pagination"""
+        return [Patron.from_dict(patron_data) for patron_data in self.list_patron_documents(limit, offset, active_only)]
+
+    def list_patron_documents(self, limit: int = 100, offset: int = 0, active_only: bool = True) -> List[dict]:
+        """List raw patron documents with pagination, for mapping straight to protobuf"""
         try:
-            collection = self._get_collection()
+            collection = self._get_secondary_collection()
             
             query = {}
             if active_only:
                 query["active"] = True
             
             cursor = collection.find(query).skip(offset).limit(limit).sort("created_at", -1)
+            return list(cursor)
             
-            patrons = []
-            for patron_data in cursor:
-                patrons.append(Patron.from_dict(patron_data))
+        except Exception as e:
+            raise Exception(f"Failed to list patrons: {str(e)}")
+
+    def scan_patron_documents(self, after_id: Optional[str], limit: int) -> List[dict]:
+        """Page of raw patron documents in _id order, start with None and pass the last _id seen"""
+        try:
+            # Keyset paging rides the _id index, unlike skip() it costs the same on every page
+            collection = self._get_secondary_collection()
             
-            return patrons
+            query = {"_id": {"$gt": ObjectId(after_id)}} if after_id else {}
+            
+            cursor = collection.find(query).sort("_id", 1).limit(limit)
+            return list(cursor)
             
         except Exception as e:
-            raise Exception(f"Failed to list patrons: {str(e)}")
+            raise Exception(f"Failed to scan patrons: {str(e)}")
 
     def search_patrons_by_name(self, name: str, limit: int = 50) -> List[Patron]:
         """Search patrons by name (first or last)"""
         try:
-            collection = self._get_collection()
+            collection = self._get_secondary_collection()
             
             # Case-insensitive search in first_name or last_name
             query = {
@@ -207,7 +298,7 @@ class PatronRepository(IPatronRepository):
     def get_patrons_by_membership_type(self, membership_type: str) -> List[Patron]:
         """Get patrons by membership type"""
         try:
-            collection = self._get_collection()
+            collection = self._get_secondary_collection()
             
             cursor = collection.find({"membership_type": membership_type}).sort("last_name", 1)
             
@@ -220,6 +311,84 @@ class PatronRepository(IPatronRepository):
         except Exception as e:
             raise Exception(f"Failed to get patrons by membership type: {str(e)}")
 
+    def count_patrons(self) -> Dict[str, Tuple[int, int]]:
+        """Total and active patrons per membership type"""
+        try:
+            # Counted on the primary, these numbers replace the running stats counters
+            collection = self._get_collection()
+
+            pipeline = [
+                {"$group": {
+                    "_id": "$membership_type",
+                    "count": {"$sum": 1},
+                    "active": {"$sum": {"$cond": ["$active", 1, 0]}}
+                }}
+            ]
+
+            return {group["_id"]: (group["count"], group["active"]) for group in collection.aggregate(pipeline)}
+
+        except Exception as e:
+            raise Exception(f"Failed to count patrons: {str(e)}")
+
+    def update_membership(self, patron_id: str, membership_type: str, membership_end_date: Optional[datetime]) -> bool:
+        """Change a patron's membership type and end date in one write, active follows the end date"""
+        try:
+            collection = self._get_collection()
+            now = utc_now()
+            active = membership_end_date is None or membership_end_date > now
+            
+            before = collection.find_one_and_update(
+                {"_id": ObjectId(patron_id)},
+                {"$set": {
+                    "membership_type": membership_type,
+                    "membership_end_date": membership_end_date,
+                    "active": active,
+                    "updated_at": now
+                }},
+                projection=STATS_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
+            
+            if before is None:
+                return False
+            if self._counters:
+                self._counters.patron_changed(before["membership_type"], before["active"], membership_type, active)
+            return True
+            
+        except InvalidId:
+            raise ValueError(f"Invalid patron ID {patron_id}")
+        except Exception as e:
+            raise Exception(f"Failed to update membership: {str(e)}")
+
+    def deactivate_expired_patrons(self, now: datetime, batch_size: int = 1000) -> int:
+        """Mark patrons whose membership ended before now inactive, one update_many per batch_size patrons"""
+        try:
+            collection = self._get_collection()
+            expired = {"active": True, "membership_end_date": {"$lt": now}}
+            deactivated = 0
+            
+            # batches keep each write short and the oplog burst small for the secondaries
+            while True:
+                # answered from the (active, membership_end_date) index, only the ids come back
+                ids = [document["_id"] for document in collection.find(expired, {"_id": 1}).limit(batch_size)]
+                if not ids:
+                    break
+                # the filter is repeated so a membership renewed in the meantime is left alone
+                result = collection.update_many(
+                    {"_id": {"$in": ids}, **expired},
+                    {"$set": {"active": False, "updated_at": now}}
+                )
+                deactivated += result.modified_count
+                if self._counters:
+                    self._counters.patrons_deactivated(result.modified_count)
+                if len(ids) < batch_size:
+                    break
+            
+            return deactivated
+            
+        except Exception as e:
+            raise Exception(f"Failed to deactivate expired patrons: {str(e)}")
+
     def checkout_book(self, patron_id: str, book_id: str) -> bool:
         """Add book to patron's checked out list"""
         try:
@@ -230,7 +399,7 @@ class PatronRepository(IPatronRepository):
                 {
                     "$addToSet": {"books_checked_out": book_id},
                     "$inc": {"total_books_borrowed": 1},
-                    "$set": {"updated_at": datetime.now()}
+                    "$set": {"updated_at": utc_now()}
                 }
             )
             
@@ -248,7 +417,7 @@ class PatronRepository(IPatronRepository):
                 {"_id": ObjectId(patron_id)},
                 {
                     "$pull": {"books_checked_out": book_id},
-                    "$set": {"updated_at": datetime.now()}
+                    "$set": {"updated_at": utc_now()}
                 }
             )
             
@@ -257,6 +426,49 @@ class PatronRepository(IPatronRepository):
         except Exception as e:
             raise Exception(f"Failed to return book: {str(e)}")
 
+    def apply_outbox_events(self, events: List[OutboxEvent]) -> List[int]:
+        """Apply checkout/return outbox events in one ordered bulk write, returns the ids of events that failed"""
+        failed = []
+        operations = []
+        applied_events = []
+        now = utc_now()
+        for event in events:
+            try:
+                patron_id = ObjectId(event.patron_id)
+            except InvalidId:
+                failed.append(event.id)
+                continue
+
+            if event.event_type == OutboxEventType.CHECKOUT:
+                update = {
+                    "$addToSet": {"books_checked_out": event.book_id},
+                    "$inc": {"total_books_borrowed": 1}
+                }
+            else:
+                update = {"$pull": {"books_checked_out": event.book_id}}
+            update["$set"] = {"updated_at": now}
+            # remember the event so a replay after a crash or retry matches nothing
+            update["$push"] = {
+                "applied_outbox_events": {"$each": [event.id], "$slice": -APPLIED_OUTBOX_EVENTS_KEPT}
+            }
+
+            operations.append(UpdateOne({"_id": patron_id, "applied_outbox_events": {"$ne": event.id}}, update))
+            applied_events.append(event)
+
+        if not operations:
+            return failed
+
+        try:
+            # ordered, a patron's checkout and return apply in outbox order
+            self._get_collection().bulk_write(operations, ordered=True)
+        except BulkWriteError as e:
+            # the write stops at the first error, the events from there on are retried on a later poll
+            first = min((error["index"] for error in e.details.get("writeErrors", [])), default=0)
+            failed.extend(event.id for event in applied_events[first:])
+        except Exception:
+            failed.extend(event.id for event in applied_events)
+        return failed
+
     def get_patrons_with_overdue_books(self) -> List[Patron]:
         """Get patrons who have overdue books (placeholder for future implementation)"""
         # This would require integration with a checkout/loan system
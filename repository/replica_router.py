@@ -0,0 +1,168 @@
+import itertools
+import threading
+import time
+
+
+GTID_EXECUTED_QUERY = 'select @@global.gtid_executed'
+WAIT_FOR_GTID_QUERY = 'select wait_for_executed_gtid_set(%s, %s)'
+REPLICA_STATUS_QUERY = 'show replica status'
+
+# Read-your-writes modes
+CONSISTENCY_OFF = 'off'
+CONSISTENCY_WINDOW = 'window'
+CONSISTENCY_GTID = 'gtid'
+
+
+class ReplicaRouter:
+    """
+    Picks the MySQL connection for each book query
+
+    Writes always use the primary. Reads round robin over replicas whose
+    measured replication delay is within max_lag_seconds, a lagging or broken
+    replica is ejected until a later check finds it healthy again.
+
+    Replica connections must be in autocommit mode, a read left in an open
+    transaction would pin its snapshot and serve frozen data from then on.
+    With several request threads they should be PerThreadConnections, the
+    gtid wait then runs on the calling thread's connection, the one its read
+    goes to next.
+    The lag check runs on its own thread, monitors are its connections to the
+    replicas, one per replica in the same order, so it never shares one with
+    the reads; they default to the replicas for single threaded use.
+
+    Read-your-writes per client session:
+      window: a session that wrote in the last window_seconds reads from the primary
+      gtid:   a replica serves the session once it has applied the session's last
+              write, waiting up to gtid_wait_seconds before falling back to the primary
+    """
+
+    def __init__(
+        self,
+        primary,
+        replicas: list,
+        monitors: list | None = None,
+        max_lag_seconds: float = 5.0,
+        consistency: str = CONSISTENCY_WINDOW,
+        window_seconds: float = 2.0,
+        gtid_wait_seconds: float = 0.05,
+        check_interval: float = 1.0
+    ) -> None:
+        if consistency not in (CONSISTENCY_OFF, CONSISTENCY_WINDOW, CONSISTENCY_GTID):
+            raise ValueError(f'unknown read-your-writes mode: {consistency}')
+        self.primary = primary
+        self.replicas = list(replicas)
+        self._monitors = list(monitors) if monitors is not None else self.replicas
+        if len(self._monitors) != len(self.replicas):
+            raise ValueError('every replica needs exactly one monitor connection')
+        self._max_lag_seconds = max_lag_seconds
+        self._consistency = consistency
+        self._window_seconds = window_seconds
+        self._gtid_wait_seconds = gtid_wait_seconds
+        self._check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._healthy = list(self.replicas)
+        self._next_replica = itertools.count()
+        # session -> (monotonic time of last write, gtid set after it)
+        self._session_writes: dict[str, tuple[float, str | None]] = {}
+        self.replica_lag: dict[int, float | None] = {}
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def writer(self):
+        return self.primary
+
+    def reader(self, session: str | None = None):
+        """Connection for a read made by session"""
+        with self._lock:
+            healthy = self._healthy
+            last_write = self._session_writes.get(session) if session else None
+        if not healthy:
+            return self.primary
+
+        replica = healthy[next(self._next_replica) % len(healthy)]
+        if last_write is None or self._consistency == CONSISTENCY_OFF:
+            return replica
+
+        written_at, gtid = last_write
+        if self._consistency == CONSISTENCY_WINDOW:
+            return self.primary if time.monotonic() - written_at < self._window_seconds else replica
+        return replica if gtid is None or self._wait_for_gtid(replica, gtid) else self.primary
+
+    def record_write(self, session: str | None) -> None:
+        """Called after a commit on the primary on behalf of session"""
+        if not session or self._consistency == CONSISTENCY_OFF or not self.replicas:
+            return
+        gtid = self._gtid_executed() if self._consistency == CONSISTENCY_GTID else None
+        with self._lock:
+            self._session_writes[session] = (time.monotonic(), gtid)
+
+    def check_replicas(self) -> None:
+        """Measures replication delay on every replica and updates the healthy set"""
+        healthy = []
+        for replica, monitor in zip(self.replicas, self._monitors):
+            lag = self._measure_lag(monitor)
+            self.replica_lag[id(replica)] = lag
+            if lag is not None and lag <= self._max_lag_seconds:
+                healthy.append(replica)
+
+        # sessions older than any wait we might still honour are forgotten
+        horizon = time.monotonic() - max(self._window_seconds, self._max_lag_seconds)
+        with self._lock:
+            if len(healthy) != len(self._healthy):
+                print(f'replica router: {len(healthy)} of {len(self.replicas)} replicas within lag bound')
+            self._healthy = healthy
+            self._session_writes = {
+                session: write for session, write in self._session_writes.items() if write[0] >= horizon
+            }
+
+    def start(self) -> None:
+        self.check_replicas()
+        self._thread = threading.Thread(target=self._run, name='replica-lag-check', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._check_interval):
+            try:
+                self.check_replicas()
+            except Exception as e:
+                print('replica lag check failed', e)
+
+    def _measure_lag(self, monitor) -> float | None:
+        """Seconds behind the source, None when replication is stopped or the replica is unreachable"""
+        try:
+            cursor = monitor.cursor(dictionary=True)
+            cursor.execute(REPLICA_STATUS_QUERY)
+            status = cursor.fetchone()
+            cursor.fetchall()
+            if not status:
+                return None
+            lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+            return float(lag) if lag is not None else None
+        except Exception:
+            return None
+
+    def _gtid_executed(self) -> str | None:
+        try:
+            cursor = self.primary.cursor()
+            cursor.execute(GTID_EXECUTED_QUERY)
+            (gtid,) = cursor.fetchone()
+            return gtid
+        except Exception:
+            return None
+
+    def _wait_for_gtid(self, replica, gtid: str) -> bool:
+        """True once replica has applied gtid, False if it did not within gtid_wait_seconds"""
+        try:
+            cursor = replica.cursor()
+            cursor.execute(WAIT_FOR_GTID_QUERY, (gtid, self._gtid_wait_seconds))
+            (timed_out,) = cursor.fetchone()
+            return timed_out == 0
+        except Exception:
+            return False
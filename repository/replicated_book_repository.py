@@ -0,0 +1,75 @@
+from typing import Callable
+
+from models import Book, BatchOutcome, IDType
+from .book_repository import IBookRepository, BookRepository
+from .replica_router import ReplicaRouter
+
+
+class ReplicatedBookRepository(IBookRepository):
+    """
+    IBookRepository sending writes to the primary and reads to replicas
+
+    session_provider returns the calling client's session id, it lets the
+    router keep that client's reads consistent with its own writes.
+    """
+
+    def __init__(self, router: ReplicaRouter, session_provider: Callable[[], str | None] = lambda: None):
+        self._router = router
+        self._session_provider = session_provider
+        self._primary = BookRepository(router.primary)
+        self._repositories = {id(router.primary): self._primary}
+        for replica in router.replicas:
+            self._repositories[id(replica)] = BookRepository(replica)
+
+    def create_book(self, book: Book) -> str:
+        return self._write(self._primary.create_book(book))
+
+    def update_book(self, book: Book) -> str:
+        return self._write(self._primary.update_book(book))
+
+    def get_book_by_id(self, id: str) -> Book | None:
+        return self._reader().get_book_by_id(id)
+
+    def get_book_by_isbn(self, isbn: int) -> Book | None:
+        return self._reader().get_book_by_isbn(isbn)
+
+    def list_books(self, limit: int) -> list[Book]:
+        return self._reader().list_books(limit)
+
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        return self._reader().list_book_rows(limit)
+
+    def scan_book_rows(self, after_id: str, limit: int) -> list[tuple]:
+        return self._reader().scan_book_rows(after_id, limit)
+
+    def count_books(self) -> tuple[int, int]:
+        # recounts correct drift, a lagging replica would add some
+        return self._primary.count_books()
+
+    def scan_isbns(self, after_isbn: int, limit: int) -> list[int]:
+        # a lagging replica could miss a new book, the isbn filter must not
+        return self._primary.scan_isbns(after_isbn, limit)
+
+    def isbn_checksum(self) -> tuple[int, int]:
+        return self._primary.isbn_checksum()
+
+    def set_checked_out_many(
+        self, ids: list[str | int], checked_out: bool, id_type: IDType = IDType.UUID
+    ) -> dict[str | int, BatchOutcome]:
+        return self._write(self._primary.set_checked_out_many(ids, checked_out, id_type))
+
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        return self._write(self._primary.delete_books(ids, id_type))
+
+    def delete_book_by_id(self, id: str) -> bool:
+        return self._write(self._primary.delete_book_by_id(id))
+
+    def delete_book_by_isbn(self, isbn: int) -> bool:
+        return self._write(self._primary.delete_book_by_isbn(isbn))
+
+    def _reader(self) -> BookRepository:
+        return self._repositories[id(self._router.reader(self._session_provider()))]
+
+    def _write(self, result):
+        self._router.record_write(self._session_provider())
+        return result
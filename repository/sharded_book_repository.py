@@ -0,0 +1,164 @@
+import hashlib
+import heapq
+from concurrent import futures
+from itertools import islice
+from typing import Callable
+
+from models import Book, BatchOutcome, IDType
+from .book_repository import IBookRepository, BookRepository
+
+
+DIRECTORY_GET_QUERY = 'select shard from isbn_directory where isbn_number=%s'
+DIRECTORY_PUT_QUERY = 'replace into isbn_directory (isbn_number,shard) values (%s,%s)'
+DIRECTORY_DELETE_QUERY = 'delete from isbn_directory where isbn_number=%s'
+
+# Outcome precedence when several shards answer for the same isbn
+OUTCOME_RANK = {BatchOutcome.NOT_FOUND: 0, BatchOutcome.CONFLICT: 1, BatchOutcome.OK: 2}
+
+
+def shard_for_id(id: str, shard_count: int) -> int:
+    """Stable shard index for a book uuid, the same in every process and python version and for either case"""
+    digest = hashlib.blake2b(id.lower().encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shard_count
+
+
+class ShardedBookRepository(IBookRepository):
+    """
+    IBookRepository spread over several MySQL instances by a hash of the book uuid
+
+    ISBN lookups go through the isbn_directory table when a directory connection
+    is given, otherwise every shard is asked in parallel. Listing merges the
+    shards in primary key order.
+    """
+
+    def __init__(self, shards: list, directory=None):
+        if not shards:
+            raise ValueError('at least one shard is required')
+        if None in shards:
+            raise ValueError(f'shard {shards.index(None)} is not connected')
+        self._shards = [BookRepository(db) for db in shards]
+        self._directory = directory
+        self._executor = futures.ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix='book-shard')
+
+    def create_book(self, book: Book) -> str:
+        shard = shard_for_id(book.id, len(self._shards))
+        self._shards[shard].create_book(book)
+        self._put_directory(book.isbn_number, shard)
+        return book.id
+
+    def update_book(self, book: Book) -> str:
+        shard = shard_for_id(book.id, len(self._shards))
+        self._shards[shard].update_book(book)
+        self._put_directory(book.isbn_number, shard)
+        return book.id
+
+    def get_book_by_id(self, id: str) -> Book | None:
+        return self._shard_for(id).get_book_by_id(id)
+
+    def get_book_by_isbn(self, isbn: int) -> Book | None:
+        shard = self._get_directory(isbn)
+        if shard is not None:
+            return self._shards[shard].get_book_by_isbn(isbn)
+        for book in self._scatter(lambda repo: repo.get_book_by_isbn(isbn)):
+            if book:
+                return book
+        return None
+
+    def list_books(self, limit: int) -> list[Book]:
+        return [Book(*row) for row in self.list_book_rows(limit)]
+
+    def list_book_rows(self, limit: int) -> list[tuple]:
+        return self._merge(self._scatter(lambda repo: repo.list_book_rows(limit)), limit)
+
+    def scan_book_rows(self, after_id: str, limit: int) -> list[tuple]:
+        return self._merge(self._scatter(lambda repo: repo.scan_book_rows(after_id, limit)), limit)
+
+    def count_books(self) -> tuple[int, int]:
+        counts = self._scatter(lambda repo: repo.count_books())
+        return sum(total for total, _ in counts), sum(checked_out for _, checked_out in counts)
+
+    def scan_isbns(self, after_isbn: int, limit: int) -> list[int]:
+        # every shard holds a disjoint sorted run, the first limit of their merge is the page
+        return list(islice(heapq.merge(*self._scatter(lambda repo: repo.scan_isbns(after_isbn, limit))), limit))
+
+    def isbn_checksum(self) -> tuple[int, int]:
+        checksums = self._scatter(lambda repo: repo.isbn_checksum())
+        return sum(count for count, _ in checksums), sum(total for _, total in checksums)
+
+    def set_checked_out_many(
+        self, ids: list[str | int], checked_out: bool, id_type: IDType = IDType.UUID
+    ) -> dict[str | int, BatchOutcome]:
+        return self._batch(ids, id_type, lambda repo, shard_ids: repo.set_checked_out_many(shard_ids, checked_out, id_type))
+
+    def delete_books(self, ids: list[str | int], id_type: IDType = IDType.UUID) -> dict[str | int, BatchOutcome]:
+        outcomes = self._batch(ids, id_type, lambda repo, shard_ids: repo.delete_books(shard_ids, id_type))
+        if id_type == IDType.ISBN:
+            for isbn, outcome in outcomes.items():
+                if outcome == BatchOutcome.OK:
+                    self._delete_directory(isbn)
+        return outcomes
+
+    def delete_book_by_id(self, id: str) -> bool:
+        repo = self._shard_for(id)
+        if self._directory is not None:
+            book = repo.get_book_by_id(id)
+            if book:
+                self._delete_directory(book.isbn_number)
+        return repo.delete_book_by_id(id)
+
+    def delete_book_by_isbn(self, isbn: int) -> bool:
+        book = self.get_book_by_isbn(isbn)
+        if not book:
+            return False
+        self._delete_directory(isbn)
+        return self._shard_for(book.id).delete_book_by_id(book.id)
+
+    def _shard_for(self, id: str) -> BookRepository:
+        return self._shards[shard_for_id(id, len(self._shards))]
+
+    def _scatter(self, func: Callable[[BookRepository], object]) -> list:
+        # each shard connection is used by exactly one task per call
+        return list(self._executor.map(func, self._shards))
+
+    def _batch(self, ids: list[str | int], id_type: IDType, func: Callable) -> dict[str | int, BatchOutcome]:
+        """Runs a batch operation per shard, uuids go to their shard and isbns to every shard"""
+        if id_type == IDType.UUID:
+            by_shard: dict[int, list] = {}
+            for id in ids:
+                by_shard.setdefault(shard_for_id(id, len(self._shards)), []).append(id)
+            groups = [by_shard.get(shard, []) for shard in range(len(self._shards))]
+        else:
+            groups = [ids] * len(self._shards)
+
+        outcomes: dict[str | int, BatchOutcome] = {}
+        results = self._executor.map(lambda args: func(*args) if args[1] else {}, zip(self._shards, groups))
+        for shard_outcomes in results:
+            for id, outcome in shard_outcomes.items():
+                if id not in outcomes or OUTCOME_RANK[outcome] > OUTCOME_RANK[outcomes[id]]:
+                    outcomes[id] = outcome
+        return outcomes
+
+    def _merge(self, shard_rows: list[list[tuple]], limit: int) -> list[tuple]:
+        return list(islice(heapq.merge(*shard_rows, key=lambda row: row[0]), limit))
+
+    def _get_directory(self, isbn: int) -> int | None:
+        if self._directory is None:
+            return None
+        cursor = self._directory.cursor()
+        cursor.execute(DIRECTORY_GET_QUERY, (isbn,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _put_directory(self, isbn: int, shard: int) -> None:
+        if self._directory is None:
+            return
+        cursor = self._directory.cursor()
+        cursor.execute(DIRECTORY_PUT_QUERY, (isbn, shard))
+        self._directory.commit()
+
+    def _delete_directory(self, isbn: int) -> None:
+        if self._directory is None:
+            return
+        cursor = self._directory.cursor()
+        cursor.execute(DIRECTORY_DELETE_QUERY, (isbn,))
+        self._directory.commit()
@@ -0,0 +1,92 @@
+import sqlite3
+
+
+# Same tables as migrations/, in the subset of SQL both engines understand
+SCHEMA = '''
+create table if not exists books (
+    id char(36),
+    title varchar(255),
+    author varchar(255),
+    description varchar(4095),
+    checked_out bool,
+    isbn_number bigint,
+    primary key (id),
+    unique (isbn_number)
+);
+create table if not exists books_v2 (
+    id binary(16),
+    title varchar(255),
+    author varchar(255),
+    description varchar(4095),
+    checked_out bool,
+    isbn_number bigint,
+    primary key (id),
+    unique (isbn_number)
+);
+create table if not exists isbn_directory (
+    isbn_number bigint,
+    shard int,
+    primary key (isbn_number)
+);
+'''
+
+
+def _translate(query: str) -> str:
+    # %s placeholders become ?, row locks are implied by sqlite's database level write lock
+    return query.replace('%s', '?').replace(' for update', '')
+
+
+class SQLiteCursor:
+    """Cursor accepting the %s placeholders and locking reads the MySQL queries use"""
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._cursor.execute(_translate(query), params)
+
+    def executemany(self, query: str, params: list[tuple]) -> None:
+        self._cursor.executemany(_translate(query), params)
+
+    def fetchone(self) -> tuple | None:
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> list[tuple]:
+        return self._cursor.fetchall()
+
+
+class SQLiteConnection:
+    """
+    Local stand-in for a mysql.connector connection
+
+    Lets the repositories, the shard router and the resharding tool run
+    against a few SQLite files instead of several MySQL instances.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(self._db.cursor())
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def rollback(self) -> None:
+        self._db.rollback()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def connect_sqlite(path: str) -> SQLiteConnection:
+    return SQLiteConnection(path)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Online migration of books.id from char(36) to binary(16)
+
+The server keeps running through every step but the cut over:
+
+    1. create the shadow table: migrations/create_books_v2_table.sql
+    2. restart the service with BOOKS_ID_MIGRATION=dual-write, every write now
+       lands in books and books_v2
+    3. copy the existing rows, in primary key order and small batches:
+           python scripts/migrate-book-ids.py backfill --url mysql://root:pw@db/books
+    4. compare every column of both tables, repeat the backfill until nothing is missing:
+           python scripts/migrate-book-ids.py verify --url mysql://root:pw@db/books
+    5. restart with BOOKS_ID_MIGRATION=dual-read, lookups are served from
+       books_v2 and fall back to books
+    6. stop the service, swap the tables and start it again with
+       BOOKS_ID_MIGRATION=off BOOKS_BINARY_IDS=1:
+           python scripts/migrate-book-ids.py cutover --url mysql://root:pw@db/books
+
+The old table is kept as books_char until it is dropped by hand. Every batch
+is a single insert ... select, so it takes the same row locks a dual-written
+update does and can not copy a stale version over a newer one. MySQL only.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repository import connect_db, connect_url
+from repository.migrating_book_repository import SHADOW_TABLE
+
+
+PAGE_QUERY = 'select id from books where id>%s order by id limit %s'
+# insert ignore keeps rows the dual write already put there, they are at least as new
+COPY_QUERY = (
+    'insert ignore into ' + SHADOW_TABLE + ' (id,title,author,description,isbn_number,checked_out) '
+    "select unhex(replace(id,'-','')),title,author,description,isbn_number,checked_out from books "
+    'where id>%s and id<=%s'
+)
+MALFORMED_QUERY = "select id from books where id not regexp '^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$'"
+COUNT_QUERY = 'select count(*) from {table}'
+# every column is compared, null safe, a row that differs anywhere counts as out of date
+MISSING_QUERY = (
+    'select count(*) from books b left join ' + SHADOW_TABLE + " s on s.id=unhex(replace(b.id,'-','')) "
+    'where s.id is null or not (s.title<=>b.title) or not (s.author<=>b.author) '
+    'or not (s.description<=>b.description) or not (s.isbn_number<=>b.isbn_number) '
+    'or not (s.checked_out<=>b.checked_out)'
+)
+# rows left in the shadow table after their book was deleted
+EXTRA_QUERY = (
+    'select count(*) from ' + SHADOW_TABLE + ' s left join books b on b.id=bin_to_uuid(s.id) where b.id is null'
+)
+CUTOVER_QUERY = 'rename table books to books_char, ' + SHADOW_TABLE + ' to books'
+
+
+def backfill(db, batch: int, pause: float) -> None:
+    cursor = db.cursor()
+    after_id = ''
+    copied = 0
+    while True:
+        cursor.execute(PAGE_QUERY, (after_id, batch))
+        ids = [row[0] for row in cursor.fetchall()]
+        db.commit()
+        if not ids:
+            break
+        cursor.execute(COPY_QUERY, (after_id, ids[-1]))
+        copied += cursor.rowcount
+        db.commit()
+        after_id = ids[-1]
+        # leave room for replication and foreground traffic between batches
+        time.sleep(pause)
+    print(f'backfill done, {copied} rows copied')
+
+
+def verify(db) -> bool:
+    cursor = db.cursor()
+    cursor.execute(MALFORMED_QUERY)
+    malformed = [row[0] for row in cursor.fetchall()]
+    counts = []
+    for table in ('books', SHADOW_TABLE):
+        cursor.execute(COUNT_QUERY.format(table=table))
+        counts.append(cursor.fetchone()[0])
+    cursor.execute(MISSING_QUERY)
+    (missing,) = cursor.fetchone()
+    cursor.execute(EXTRA_QUERY)
+    (extra,) = cursor.fetchone()
+    db.commit()
+
+    print(
+        f'books: {counts[0]} rows, {SHADOW_TABLE}: {counts[1]} rows, {missing} missing or out of date, '
+        f'{extra} only in {SHADOW_TABLE}'
+    )
+    if malformed:
+        print(f'{len(malformed)} ids are not uuids and can not be converted: {", ".join(malformed[:10])}')
+    return missing == 0 and extra == 0 and not malformed and counts[0] == counts[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('step', choices=['backfill', 'verify', 'cutover'])
+    parser.add_argument('--url', help='mysql url of the books database, defaults to the MYSQL_* variables')
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--pause', type=float, default=0.05, help='seconds to sleep between backfill batches')
+    parser.add_argument('--force', action='store_true', help='cut over even if verify finds differences')
+    args = parser.parse_args()
+
+    db = connect_url(args.url) if args.url else connect_db()
+    if db is None:
+        raise SystemExit('could not connect to the books database')
+
+    if args.step == 'backfill':
+        backfill(db, args.batch, args.pause)
+    elif args.step == 'verify':
+        if not verify(db):
+            sys.exit(1)
+    else:
+        if not verify(db) and not args.force:
+            raise SystemExit('tables differ, run the backfill again or pass --force')
+        cursor = db.cursor()
+        # one atomic rename, there is no moment without a books table
+        cursor.execute(CUTOVER_QUERY)
+        print('cut over done, start the service with BOOKS_ID_MIGRATION=off BOOKS_BINARY_IDS=1')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Offline resharding of the books table
+
+Streams every source shard in primary key order and writes each book to the
+shard its uuid hashes to in the target layout. Books whose target is the same
+database they already live in are left alone. Stop the service first.
+
+    python scripts/reshard-books.py \
+        --source mysql://root:pw@db0/books --source mysql://root:pw@db1/books \
+        --target mysql://root:pw@db0/books --target mysql://root:pw@db1/books --target mysql://root:pw@db2/books \
+        --directory mysql://root:pw@db0/books --prune
+
+Works the same against the SQLite stand-in (sqlite:///shard0.db).
+"""
+
+import argparse
+import os
+import sys
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repository import BookRepository, connect_url
+from repository.book_repository import encode_book_id
+from repository.sharded_book_repository import shard_for_id, DIRECTORY_PUT_QUERY
+
+
+REPLACE_QUERY = 'replace into books (id,title,author,description,isbn_number,checked_out) values (%s,%s,%s,%s,%s,%s)'
+DELETE_QUERY = 'delete from books where id in ({})'
+
+
+def executemany(db, query: str, params: list[tuple]) -> None:
+    if not params:
+        return
+    cursor = db.cursor()
+    cursor.executemany(query, params)
+    db.commit()
+
+
+def delete_ids(db, ids: list[str]) -> None:
+    if not ids:
+        return
+    cursor = db.cursor()
+    cursor.execute(DELETE_QUERY.format(','.join(['%s'] * len(ids))), tuple(encode_book_id(id) for id in ids))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', action='append', required=True, help='current shard urls, in shard order')
+    parser.add_argument('--target', action='append', required=True, help='new shard urls, in shard order')
+    parser.add_argument('--directory', help='isbn directory url to rebuild')
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--prune', action='store_true', help='delete moved books from their old shard')
+    args = parser.parse_args()
+
+    # a url present in both layouts is opened once so moves within it are skipped
+    connections = {url: connect_url(url) for url in dict.fromkeys(args.source + args.target)}
+    missing = [url for url, db in connections.items() if db is None]
+    if missing:
+        raise SystemExit(f'could not connect to {", ".join(missing)}')
+    directory = connect_url(args.directory) if args.directory else None
+
+    targets = [connections[url] for url in args.target]
+    moved = 0
+    for source_url in args.source:
+        source = connections[source_url]
+        repo = BookRepository(source)
+        after_id = ''
+        while True:
+            rows = repo.scan_book_rows(after_id, args.batch)
+            if not rows:
+                break
+            after_id = rows[-1][0]
+
+            writes: dict[int, list[tuple]] = {}
+            moved_ids = []
+            entries = []
+            for row in rows:
+                shard = shard_for_id(row[0], len(targets))
+                entries.append((row[4], shard))
+                if targets[shard] is source:
+                    continue
+                # rows come back with string ids, BOOKS_BINARY_IDS decides the column format
+                writes.setdefault(shard, []).append((encode_book_id(row[0]), *row[1:]))
+                moved_ids.append(row[0])
+
+            # copy before deleting so an interrupted run never loses a book
+            for shard, shard_rows in writes.items():
+                executemany(targets[shard], REPLACE_QUERY, shard_rows)
+            if directory is not None:
+                executemany(directory, DIRECTORY_PUT_QUERY, entries)
+            if args.prune:
+                delete_ids(source, moved_ids)
+            moved += len(moved_ids)
+
+        print(f'{source_url}: done')
+
+    print(f'resharded onto {len(targets)} shards, {moved} books moved')
+
+
+if __name__ == '__main__':
+    main()
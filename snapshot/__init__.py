@@ -0,0 +1,4 @@
+from .exporter import SnapshotExporter, BOOK_SCHEMA, PATRON_SCHEMA
+from .reader import open_table
+
+__all__ = ['exporter', 'reader']
@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+import pyarrow as pa
+
+from repository import IBookRepository
+from repository.patron_repository import IPatronRepository
+
+
+MANIFEST_NAME = 'manifest.json'
+
+BOOK_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('title', pa.string()),
+    ('author', pa.string()),
+    ('description', pa.string()),
+    ('isbn_number', pa.int64()),
+    ('checked_out', pa.bool_()),
+])
+
+PATRON_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('first_name', pa.string()),
+    ('last_name', pa.string()),
+    ('email', pa.string()),
+    ('phone', pa.string()),
+    ('address', pa.string()),
+    ('membership_type', pa.string()),
+    ('membership_start_date', pa.timestamp('us')),
+    ('membership_end_date', pa.timestamp('us')),
+    ('books_checked_out', pa.list_(pa.string())),
+    ('total_books_borrowed', pa.int64()),
+    ('active', pa.bool_()),
+    ('created_at', pa.timestamp('us')),
+    ('updated_at', pa.timestamp('us')),
+])
+
+
+def partition_for(id: str, partitions: int) -> int:
+    # a hash keeps the layout stable for random and time ordered ids alike
+    return int.from_bytes(hashlib.blake2b(id.encode(), digest_size=8).digest(), 'big') % partitions
+
+
+def _book_rows(repo: IBookRepository, chunk_size: int) -> Iterator[tuple]:
+    after_id = ''
+    while True:
+        rows = repo.scan_book_rows(after_id, chunk_size)
+        if not rows:
+            return
+        for row in rows:
+            # checked_out comes back as 0/1 from both drivers
+            yield (*row[:5], bool(row[5]))
+        after_id = rows[-1][0]
+
+
+def _patron_rows(repo: IPatronRepository, chunk_size: int) -> Iterator[tuple]:
+    after_id = None
+    while True:
+        documents = repo.scan_patron_documents(after_id, chunk_size)
+        if not documents:
+            return
+        for document in documents:
+            yield (
+                str(document['_id']),
+                *(document.get(name) for name in PATRON_SCHEMA.names[1:])
+            )
+        after_id = str(documents[-1]['_id'])
+
+
+class _PartitionWriter:
+    """Buffers rows of one partition and streams them as record batches to a temporary file"""
+
+    def __init__(self, path: str, schema: pa.Schema, batch_rows: int) -> None:
+        self.path = path
+        self.rows = 0
+        self._schema = schema
+        self._batch_rows = batch_rows
+        self._columns: list[list] = [[] for _ in schema]
+        self._writer = pa.ipc.new_file(path + '.tmp', schema)
+
+    def append(self, row: tuple) -> None:
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self.rows += 1
+        if len(self._columns[0]) >= self._batch_rows:
+            self._flush()
+
+    def close(self) -> str:
+        """Finishes the file and returns the digest of its contents"""
+        self._flush()
+        self._writer.close()
+        with open(self.path + '.tmp', 'rb') as f:
+            return hashlib.file_digest(f, 'blake2b').hexdigest()
+
+    def _flush(self) -> None:
+        if self._columns[0]:
+            self._writer.write_batch(pa.record_batch(self._columns, schema=self._schema))
+            self._columns = [[] for _ in self._schema]
+
+
+class SnapshotExporter:
+    """
+    Writes the books table and patrons collection as partitioned Arrow IPC files
+
+    Both stores are read with keyset scans, chunk_size rows at a time, and every
+    row is routed to a partition by a hash of its id. Each partition is written
+    in full to a temporary file; it only replaces the previous snapshot's file
+    when its digest changed, so unchanged partitions keep their files (and any
+    reader's memory map) untouched. Files are uncompressed Arrow IPC so readers
+    can memory map them and use the columns without copying.
+
+        <directory>/manifest.json
+        <directory>/books/part-0007.arrow
+        <directory>/patrons/part-0012.arrow
+    """
+
+    def __init__(self, directory: str, partitions: int = 64, chunk_size: int = 5000, batch_rows: int = 16384) -> None:
+        self._directory = directory
+        self._partitions = partitions
+        self._chunk_size = chunk_size
+        self._batch_rows = batch_rows
+
+    def export_books(self, repo: IBookRepository) -> dict:
+        return self._export('books', BOOK_SCHEMA, _book_rows(repo, self._chunk_size))
+
+    def export_patrons(self, repo: IPatronRepository) -> dict:
+        return self._export('patrons', PATRON_SCHEMA, _patron_rows(repo, self._chunk_size))
+
+    def _export(self, table: str, schema: pa.Schema, rows: Iterable[tuple]) -> dict:
+        """Writes one table, returns its manifest entry with written and unchanged partition counts"""
+        table_dir = os.path.join(self._directory, table)
+        os.makedirs(table_dir, exist_ok=True)
+        manifest = self._read_manifest()
+        previous = manifest.get(table, {})
+        if previous.get('partitions') != self._partitions or previous.get('schema') != schema.to_string():
+            # a different layout shares nothing with the old files
+            previous = {}
+        previous_parts = previous.get('parts', {})
+
+        writers = [
+            _PartitionWriter(os.path.join(table_dir, f'part-{partition:04d}.arrow'), schema, self._batch_rows)
+            for partition in range(self._partitions)
+        ]
+        try:
+            for row in rows:
+                writers[partition_for(row[0], self._partitions)].append(row)
+        except BaseException:
+            for writer in writers:
+                writer.close()
+                os.remove(writer.path + '.tmp')
+            raise
+
+        parts = {}
+        written = 0
+        for partition, writer in enumerate(writers):
+            digest = writer.close()
+            name = os.path.basename(writer.path)
+            old = previous_parts.get(name)
+            if old and old['digest'] == digest and os.path.exists(writer.path):
+                os.remove(writer.path + '.tmp')
+            else:
+                # atomic, a reader that mapped the old file keeps reading it
+                os.replace(writer.path + '.tmp', writer.path)
+                written += 1
+            parts[name] = {'rows': writer.rows, 'digest': digest}
+
+        entry = {
+            'partitions': self._partitions,
+            'schema': schema.to_string(),
+            'rows': sum(part['rows'] for part in parts.values()),
+            'exported_at': datetime.now(timezone.utc).isoformat(),
+            'parts': parts,
+        }
+        manifest[table] = entry
+        self._write_manifest(manifest)
+        return {'table': table, 'rows': entry['rows'], 'written': written, 'unchanged': self._partitions - written}
+
+    def _read_manifest(self) -> dict:
+        path = os.path.join(self._directory, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        path = os.path.join(self._directory, MANIFEST_NAME)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,22 @@
+import json
+import os
+
+import pyarrow as pa
+
+from .exporter import MANIFEST_NAME
+
+
+def open_table(directory: str, table: str) -> pa.Table:
+    """
+    Memory maps every partition of a snapshot table into one pyarrow Table
+
+    The columns point straight into the mapped files, nothing is read until a
+    column is touched. Partition order is not id order; sort if it matters.
+    """
+    with open(os.path.join(directory, MANIFEST_NAME)) as f:
+        parts = json.load(f)[table]['parts']
+    tables = []
+    for name in sorted(parts):
+        source = pa.memory_map(os.path.join(directory, table, name), 'r')
+        tables.append(pa.ipc.open_file(source).read_all())
+    return pa.concat_tables(tables)
@@ -0,0 +1,3 @@
+from .counters import LibraryCounters
+
+__all__ = ['counters']
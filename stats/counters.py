@@ -0,0 +1,97 @@
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+from models import LibraryStats
+
+
+class LibraryCounters:
+    """
+    Running totals behind GetLibraryStats
+
+    Library and PatronRepository report every mutation here, so reading the
+    stats never touches a store. Changes made by other processes or straight
+    in the databases are only picked up by reconcile(), which StatsReconciler
+    calls periodically with freshly counted values.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._books = 0
+        self._checked_out = 0
+        self._patrons: Counter[str] = Counter()
+        self._active_patrons = 0
+        self._reconciled_at: datetime | None = None
+        self.last_drift: dict[str, int] = {}
+
+    def books_added(self, count: int = 1, checked_out: int = 0) -> None:
+        with self._lock:
+            self._books += count
+            self._checked_out += checked_out
+
+    def books_removed(self, count: int = 1, checked_out: int = 0) -> None:
+        with self._lock:
+            self._books -= count
+            self._checked_out -= checked_out
+
+    def books_checked_out(self, delta: int) -> None:
+        """delta books flipped to checked out, negative for returns"""
+        with self._lock:
+            self._checked_out += delta
+
+    def patron_added(self, membership_type: str, active: bool) -> None:
+        with self._lock:
+            self._patrons[membership_type] += 1
+            self._active_patrons += active
+
+    def patron_removed(self, membership_type: str, active: bool) -> None:
+        with self._lock:
+            self._patrons[membership_type] -= 1
+            self._active_patrons -= active
+
+    def patrons_deactivated(self, count: int) -> None:
+        """count active patrons turned inactive, their membership types unchanged"""
+        with self._lock:
+            self._active_patrons -= count
+
+    def patron_changed(self, before_type: str, before_active: bool, after_type: str, after_active: bool) -> None:
+        with self._lock:
+            self._patrons[before_type] -= 1
+            self._patrons[after_type] += 1
+            self._active_patrons += after_active - before_active
+
+    def reconcile(
+        self,
+        total_books: int | None,
+        checked_out_books: int | None,
+        patrons_by_membership_type: dict[str, int] | None,
+        active_patrons: int | None
+    ) -> dict[str, int]:
+        """Replaces the totals with counted ones, None leaves a total alone. Returns how far each was off"""
+        with self._lock:
+            drift = {}
+            if total_books is not None:
+                drift['total_books'] = self._books - total_books
+                drift['checked_out_books'] = self._checked_out - checked_out_books
+                self._books = total_books
+                self._checked_out = checked_out_books
+            if patrons_by_membership_type is not None:
+                drift['total_patrons'] = sum(self._patrons.values()) - sum(patrons_by_membership_type.values())
+                drift['active_patrons'] = self._active_patrons - active_patrons
+                self._patrons = Counter(patrons_by_membership_type)
+                self._active_patrons = active_patrons
+            self._reconciled_at = datetime.now(timezone.utc)
+            self.last_drift = drift
+            return drift
+
+    def snapshot(self) -> LibraryStats:
+        with self._lock:
+            by_type = {name: count for name, count in self._patrons.items() if count}
+            return LibraryStats(
+                total_books=self._books,
+                checked_out_books=self._checked_out,
+                total_patrons=sum(by_type.values()),
+                active_patrons=self._active_patrons,
+                patrons_by_membership_type=by_type,
+                reconciled_at=self._reconciled_at
+            )
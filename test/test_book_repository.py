@@ -0,0 +1,49 @@
+"""
+Tests for the batch operations of repository.book_repository.BookRepository against the SQLite stand-in
+"""
+
+import uuid
+
+from models import Book, BatchOutcome, IDType
+from repository import BookRepository
+from repository.sqlite_database import connect_sqlite
+
+
+def books_repository(count: int) -> tuple[BookRepository, list[str]]:
+    repo = BookRepository(connect_sqlite(':memory:'), binary_ids=False)
+    ids = [str(uuid.UUID(int=i + 1)) for i in range(count)]
+    for i, id in enumerate(ids):
+        repo.create_book(Book(id, 'title', 'author', 'description', 9780000000000 + i, False))
+    return repo, ids
+
+
+def test_batch_checkout_reports_each_book():
+    repo, ids = books_repository(3)
+    repo.set_checked_out_many(ids[:1], True)
+
+    outcomes = repo.set_checked_out_many([*ids, 'missing'], True)
+
+    assert outcomes == {
+        ids[0]: BatchOutcome.CONFLICT, ids[1]: BatchOutcome.OK, ids[2]: BatchOutcome.OK,
+        'missing': BatchOutcome.NOT_FOUND
+    }
+    assert repo.count_books() == (3, 3)
+
+
+def test_upper_case_uuids_find_their_books():
+    repo, ids = books_repository(2)
+    upper = ids[0].upper()
+
+    assert repo.set_checked_out_many([upper], True) == {upper: BatchOutcome.OK}
+    assert repo.get_book_by_id(ids[0]).checked_out
+    assert repo.delete_books([ids[1].upper()]) == {ids[1].upper(): BatchOutcome.OK}
+    assert repo.get_book_by_id(ids[1]) is None
+
+
+def test_batch_delete_by_isbn():
+    repo, _ = books_repository(2)
+
+    outcomes = repo.delete_books([9780000000000, 9790000000000], IDType.ISBN)
+
+    assert outcomes == {9780000000000: BatchOutcome.OK, 9790000000000: BatchOutcome.NOT_FOUND}
+    assert repo.count_books() == (1, 0)
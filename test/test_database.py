@@ -0,0 +1,59 @@
+"""
+Tests for repository.database.PerThreadConnection against the SQLite stand-in
+"""
+
+import threading
+from functools import partial
+
+from models import Book
+from repository import BookRepository, connect_per_thread
+from repository.sqlite_database import connect_sqlite
+
+
+def test_every_thread_gets_its_own_connection(tmp_path):
+    opened = []
+
+    def connect():
+        opened.append(connect_sqlite(str(tmp_path / 'books.db')))
+        return opened[-1]
+
+    db = connect_per_thread(connect)
+    threads = [threading.Thread(target=lambda: db.cursor().execute('select 1')) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    # the first thread takes the connection opened up front, a thread reusing it opens none
+    db.cursor().execute('select 1')
+    db.cursor().execute('select 1')
+
+    assert len(opened) == 5
+    db.close()
+
+
+def test_a_rollback_leaves_other_threads_transactions_alone(tmp_path):
+    db = connect_per_thread(partial(connect_sqlite, str(tmp_path / 'books.db')))
+    written, rolled_back = threading.Event(), threading.Event()
+
+    def write():
+        cursor = db.cursor()
+        cursor.execute(
+            'insert into books (id,title,author,description,checked_out,isbn_number) values (%s,%s,%s,%s,%s,%s)',
+            ('book', 'title', 'author', 'description', False, 9780000000001)
+        )
+        written.set()
+        rolled_back.wait(5)
+        db.commit()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    written.wait(5)
+    db.rollback()
+    rolled_back.set()
+    writer.join(5)
+
+    assert BookRepository(db).get_book_by_id('book') == Book(
+        'book', 'title', 'author', 'description', 9780000000001, False
+    )
+    db.close()
+
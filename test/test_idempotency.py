@@ -0,0 +1,93 @@
+"""
+Tests for cache.idempotency.IdempotencyStore
+"""
+
+import threading
+import time
+
+from cache import IdempotencyStore, Claim
+
+
+def test_claim_then_replay():
+    store = IdempotencyStore()
+    claim, entry = store.claim('key', b'request')
+    assert claim is Claim.EXECUTE
+    store.complete('key', entry, 'response')
+
+    claim, replayed = store.claim('key', b'request')
+    assert claim is Claim.REPLAY
+    assert replayed.response == 'response'
+    assert store.stats() == {'entries': 1, 'executed': 1, 'replayed': 1, 'conflicts': 0}
+
+
+def test_same_key_other_request_conflicts():
+    store = IdempotencyStore()
+    _, entry = store.claim('key', b'request')
+    store.complete('key', entry, 'response')
+
+    assert store.claim('key', b'other request') == (Claim.CONFLICT, None)
+    assert store.stats()['conflicts'] == 1
+
+
+def test_abandoned_call_runs_again():
+    store = IdempotencyStore()
+    _, entry = store.claim('key', b'request')
+    store.abandon('key', entry)
+
+    claim, retry = store.claim('key', b'request')
+    assert claim is Claim.EXECUTE
+    assert retry is not entry
+
+
+def test_second_call_waits_for_the_first():
+    store = IdempotencyStore(wait_seconds=5)
+    _, entry = store.claim('key', b'request')
+    claims = []
+    waiter = threading.Thread(target=lambda: claims.append(store.claim('key', b'request')))
+    waiter.start()
+    time.sleep(0.05)
+    store.complete('key', entry, 'response')
+    waiter.join(5)
+
+    (claim, replayed), = claims
+    assert claim is Claim.REPLAY
+    assert replayed.response == 'response'
+
+
+def test_waiter_runs_the_call_after_an_abandon():
+    store = IdempotencyStore(wait_seconds=5)
+    _, entry = store.claim('key', b'request')
+    claims = []
+    waiter = threading.Thread(target=lambda: claims.append(store.claim('key', b'request')))
+    waiter.start()
+    time.sleep(0.05)
+    store.abandon('key', entry)
+    waiter.join(5)
+
+    assert claims[0][0] is Claim.EXECUTE
+
+
+def test_call_still_running_after_the_wait():
+    store = IdempotencyStore(wait_seconds=0.05)
+    store.claim('key', b'request')
+    assert store.claim('key', b'request') == (Claim.IN_PROGRESS, None)
+
+
+def test_oldest_entries_are_evicted_above_max_entries():
+    store = IdempotencyStore(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        _, entry = store.claim(key, b'request')
+        store.complete(key, entry, key)
+
+    assert store.stats()['entries'] == 2
+    assert store.claim('a', b'request')[0] is Claim.EXECUTE
+    assert store.claim('c', b'request')[0] is Claim.REPLAY
+
+
+def test_entries_expire():
+    store = IdempotencyStore(ttl_seconds=0.05)
+    _, entry = store.claim('key', b'request')
+    store.complete('key', entry, 'response')
+    time.sleep(0.1)
+
+    assert store.claim('key', b'request')[0] is Claim.EXECUTE
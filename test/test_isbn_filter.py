@@ -0,0 +1,72 @@
+"""
+Tests for cache.isbn_filter, BloomFilter and IsbnFilter against the SQLite stand-in
+"""
+
+import random
+
+from cache import BloomFilter, IsbnFilter
+from models import Book
+from repository import BookRepository
+from repository.sqlite_database import connect_sqlite
+
+
+def books_repository(isbns) -> BookRepository:
+    repo = BookRepository(connect_sqlite(':memory:'))
+    for isbn in isbns:
+        repo.create_book(Book(f'book-{isbn}', 'title', 'author', 'description', isbn, False))
+    return repo
+
+
+def test_bloom_filter_has_no_false_negatives():
+    keys = random.Random(1).sample(range(9_780_000_000_000, 9_790_000_000_000), 20_000)
+    bloom = BloomFilter(len(keys), error_rate=0.01)
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    # well within the sized rate, a miss stays exact whatever the rate
+    others = range(1, 20_001)
+    assert sum(key in bloom for key in others) < len(others) * 0.03
+
+
+def test_filter_survives_a_save_and_load(tmp_path):
+    isbns = list(range(9780000000001, 9780000000501))
+    repo = books_repository(isbns)
+    path = str(tmp_path / 'isbn_filter.bin')
+
+    IsbnFilter.build(repo).save(path)
+    loaded = IsbnFilter.load(path, repo)
+
+    assert loaded is not None
+    assert all(loaded.might_contain(isbn) for isbn in isbns)
+    assert loaded.checksum() == repo.isbn_checksum()
+
+
+def test_filter_tracks_its_own_writes(tmp_path):
+    repo = books_repository([9780000000001, 9780000000002])
+    isbn_filter = IsbnFilter.build(repo)
+    path = str(tmp_path / 'isbn_filter.bin')
+
+    isbn_filter.add(9780000000003)
+    repo.create_book(Book('book-3', 'title', 'author', 'description', 9780000000003, False))
+    # re-adding a known isbn, as updates do, leaves the checksum alone
+    isbn_filter.add(9780000000001)
+    repo.delete_book_by_isbn(9780000000002)
+    isbn_filter.remove(9780000000002)
+    isbn_filter.save(path)
+
+    assert isbn_filter.checksum() == repo.isbn_checksum()
+    assert IsbnFilter.load(path, repo) is not None
+
+
+def test_books_added_elsewhere_force_a_rebuild(tmp_path):
+    repo = books_repository([9780000000001])
+    isbn_filter = IsbnFilter.build(repo)
+    path = str(tmp_path / 'isbn_filter.bin')
+
+    # another instance, a script or plain sql, the filter never saw it
+    repo.create_book(Book('elsewhere', 'title', 'author', 'description', 9780000000099, False))
+    isbn_filter.save(path)
+
+    assert IsbnFilter.load(path, repo) is None
+    assert IsbnFilter.load_or_build(path, repo).might_contain(9780000000099)
@@ -0,0 +1,73 @@
+"""
+Tests for repository.migrating_book_repository.MigratingBookRepository against the SQLite stand-in
+"""
+
+import threading
+import uuid
+from functools import partial
+
+from models import Book, BatchOutcome
+from repository import BookRepository, MigratingBookRepository, connect_per_thread
+from repository.migrating_book_repository import SHADOW_TABLE
+from repository.sqlite_database import connect_sqlite
+
+
+# the mirror of a book titled fail aborts, after its books row was written
+FAIL_MIRROR_TRIGGER = '''
+create trigger fail_mirror before insert on books_v2 when new.title = 'fail'
+begin select raise(abort, 'mirror failed'); end
+'''
+
+
+def migrating_repository(tmp_path) -> tuple[MigratingBookRepository, BookRepository, BookRepository]:
+    db = connect_per_thread(partial(connect_sqlite, str(tmp_path / 'books.db')))
+    cursor = db.cursor()
+    cursor.execute(FAIL_MIRROR_TRIGGER)
+    db.commit()
+    return (
+        MigratingBookRepository(db),
+        BookRepository(db, binary_ids=False),
+        BookRepository(db, table=SHADOW_TABLE, binary_ids=True)
+    )
+
+
+def book(i: int, title: str = 'title') -> Book:
+    return Book(str(uuid.UUID(int=i + 1)), title, 'author', 'description', 9780000000000 + i, False)
+
+
+def test_writes_are_mirrored(tmp_path):
+    repo, books, shadow = migrating_repository(tmp_path)
+    for i in range(3):
+        repo.create_book(book(i))
+    repo.update_book(book(0, title='new title'))
+    assert repo.set_checked_out_many([book(1).id], True) == {book(1).id: BatchOutcome.OK}
+    repo.delete_book_by_id(book(2).id)
+
+    assert books.list_books(10) == shadow.list_books(10)
+    assert shadow.get_book_by_id(book(0).id).title == 'new title'
+    assert shadow.get_book_by_id(book(1).id).checked_out
+
+
+def test_concurrent_writes_and_rollbacks_keep_the_tables_in_step(tmp_path):
+    repo, books, shadow = migrating_repository(tmp_path)
+    created = []
+
+    def write(start: int) -> None:
+        for i in range(start, start + 20):
+            # every third mirror fails and its transaction rolls back, while the other threads write
+            try:
+                repo.create_book(book(i, title='fail' if i % 3 == 0 else 'title'))
+                created.append(book(i).id)
+            except Exception:
+                pass
+
+    threads = [threading.Thread(target=write, args=(start,)) for start in range(0, 160, 20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    ids = sorted(created)
+    assert len(ids) == len([i for i in range(160) if i % 3])
+    assert [b.id for b in books.list_books(200)] == ids
+    assert books.list_books(200) == shadow.list_books(200)
@@ -0,0 +1,65 @@
+"""
+Tests for mapper.patron and the patron side of controller.library.Library
+"""
+
+from datetime import datetime, timedelta
+
+from controller import Library
+from mapper import patronProtoToModel
+from models.patron import utc_now
+from protogen import Patron, MembershipType
+
+
+class PatronRepository:
+    """Keeps created patrons in memory"""
+
+    def __init__(self) -> None:
+        self.created = []
+
+    def available(self) -> bool:
+        return True
+
+    def create_patron(self, patron) -> str:
+        self.created.append(patron)
+        return str(len(self.created))
+
+
+def create(patron: Patron):
+    patrons = PatronRepository()
+    Library(None, patrons).create_patron(patronProtoToModel(patron))
+    return patrons.created[0]
+
+
+def patron(**fields) -> Patron:
+    return Patron(
+        first_name='first', last_name='last', email='patron@library.local',
+        membership_type=MembershipType.MEMBERSHIP_TYPE_STUDENT, **fields
+    )
+
+
+def test_created_patron_without_active_is_active():
+    assert create(patron()).active is True
+
+
+def test_created_patron_follows_membership_dates():
+    ended = patron()
+    ended.membership_end_time.FromDatetime(utc_now() - timedelta(days=1))
+    running = patron()
+    running.membership_end_time.FromDatetime(utc_now() + timedelta(days=1))
+
+    assert create(ended).active is False
+    assert create(running).active is True
+
+
+def test_legacy_date_strings_with_an_offset_read_as_naive_utc():
+    mapped = patronProtoToModel(patron(
+        membership_start_date='2026-01-01T10:00:00Z',
+        membership_end_date='2026-01-01T12:00:00+02:00',
+        created_at='2026-01-01T10:00:00'
+    ))
+
+    assert mapped.membership_start_date == datetime(2026, 1, 1, 10)
+    assert mapped.membership_end_date == datetime(2026, 1, 1, 10)
+    assert mapped.created_at == datetime(2026, 1, 1, 10)
+    # an aware end date would make this comparison raise
+    assert create(patron(membership_end_date='2000-01-01T00:00:00+00:00')).active is False
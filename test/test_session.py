@@ -0,0 +1,183 @@
+"""
+Tests for handler.session.SessionDispatcher, with stand-ins for the handler and the grpc context
+"""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from cache import IdempotencyStore
+from controller import Library
+from handler import LibraryGRPCHandler
+from handler.session import SessionDispatcher, OperationAborted
+from interceptor import IdempotencyInterceptor, RateLimitInterceptor, RateLimiter, RateLimit
+from protogen import SessionRequest, GetBookRequest, GetBookResponse, UpsertBookRequest, UpsertBookResponse, Book
+from repository import BookRepository
+from repository.sqlite_database import connect_sqlite
+
+
+class Context:
+    def __init__(self) -> None:
+        self.callbacks = []
+
+    def is_active(self) -> bool:
+        return True
+
+    def add_callback(self, callback) -> bool:
+        self.callbacks.append(callback)
+        return True
+
+    def end(self) -> None:
+        for callback in self.callbacks:
+            callback()
+
+    def invocation_metadata(self):
+        return ()
+
+    def peer(self) -> str:
+        return 'ipv4:127.0.0.1:50000'
+
+    def abort(self, code, details):
+        raise OperationAborted(code, details)
+
+
+class Handler:
+    """GetBook answers once the book's event is set, CreateBook counts its calls"""
+
+    def __init__(self) -> None:
+        self.released: dict[str, threading.Event] = {}
+        self.created = 0
+
+    def GetBook(self, request, context):
+        self.released.setdefault(request.uuid, threading.Event()).wait(5)
+        return GetBookResponse(book=Book(uuid=request.uuid))
+
+    def CreateBook(self, request, context):
+        self.created += 1
+        return UpsertBookResponse(uuid=f'created-{self.created}')
+
+    def release(self, uuid: str) -> None:
+        self.released.setdefault(uuid, threading.Event()).set()
+
+
+def get_book(request_id: int, uuid: str) -> SessionRequest:
+    return SessionRequest(request_id=request_id, get_book=GetBookRequest(uuid=uuid))
+
+
+def consume(responses) -> queue.Queue:
+    """Iterates the response stream on a thread of its own, as grpc would"""
+    received: queue.Queue = queue.Queue()
+
+    def run():
+        try:
+            for response in responses:
+                received.put(response)
+        except OperationAborted as e:
+            received.put(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return received
+
+
+def test_responses_come_back_as_operations_finish():
+    handler = Handler()
+    received = consume(SessionDispatcher(handler).run(iter([get_book(1, 'slow'), get_book(2, 'fast')]), Context()))
+
+    handler.release('fast')
+    assert received.get(timeout=5).request_id == 2
+    handler.release('slow')
+    assert received.get(timeout=5).request_id == 1
+
+
+def test_reader_stops_pulling_at_max_in_flight():
+    handler = Handler()
+    pulled = []
+
+    def requests():
+        for i in range(10):
+            pulled.append(i)
+            yield get_book(i, 'held')
+
+    received = consume(SessionDispatcher(handler, max_in_flight=3).run(requests(), Context()))
+    time.sleep(0.2)
+    # three running, the fourth pulled and waiting for a slot
+    assert len(pulled) == 4
+
+    handler.release('held')
+    assert sorted(received.get(timeout=5).request_id for _ in range(10)) == list(range(10))
+
+
+def test_operations_are_deduplicated_by_idempotency_key():
+    handler = Handler()
+    dispatcher = SessionDispatcher(handler)
+    dispatcher.configure(idempotency=IdempotencyInterceptor(IdempotencyStore()))
+    create = UpsertBookRequest(book=Book(title='title'))
+    requests = [
+        SessionRequest(request_id=1, create_book=create, idempotency_key='key'),
+        SessionRequest(request_id=2, create_book=create, idempotency_key='key'),
+        SessionRequest(request_id=3, create_book=create),
+    ]
+
+    responses = {response.request_id: response for response in dispatcher.run(iter(requests), Context())}
+
+    assert handler.created == 2
+    assert responses[1].create_book.uuid == responses[2].create_book.uuid
+    assert responses[3].create_book.uuid != responses[1].create_book.uuid
+
+
+def test_operations_are_charged_to_their_own_method():
+    handler = Handler()
+    handler.release('book')
+    dispatcher = SessionDispatcher(handler)
+    limiter = RateLimiter(RateLimit(1000, 1000), {'GetBook': RateLimit(rate=20, burst=1)})
+    dispatcher.configure(rate_limit=RateLimitInterceptor(limiter))
+
+    start = time.perf_counter()
+    responses = list(dispatcher.run(iter([get_book(i, 'book') for i in range(3)]), Context()))
+
+    # one from the burst, two more at 20 per second
+    assert len(responses) == 3
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_sessions_beyond_max_sessions_are_refused():
+    handler = Handler()
+    dispatcher = SessionDispatcher(handler, max_sessions=1)
+    first = Context()
+    consume(dispatcher.run(iter([get_book(1, 'held')]), first))
+    time.sleep(0.05)
+
+    with pytest.raises(OperationAborted):
+        next(dispatcher.run(iter([]), Context()))
+
+    # the slot comes back when the first call ends, however it ended
+    handler.release('held')
+    first.end()
+    assert list(dispatcher.run(iter([get_book(2, 'held')]), Context()))[0].request_id == 2
+
+
+def run_session(handler: LibraryGRPCHandler, *requests: SessionRequest) -> list:
+    context = Context()
+    responses = list(handler.Session(iter(requests), context))
+    context.end()
+    return responses
+
+
+def test_book_updates_and_deletes_run_on_the_library_handler():
+    handler = LibraryGRPCHandler(Library(BookRepository(connect_sqlite(':memory:'), binary_ids=False)))
+    book = Book(title='title', author='author', description='description', isbn_number=9780000000001)
+    created, = run_session(handler, SessionRequest(request_id=1, create_book=UpsertBookRequest(book=book)))
+    book.uuid = created.create_book.uuid
+    book.title = 'new title'
+
+    updated, = run_session(handler, SessionRequest(request_id=2, update_book=UpsertBookRequest(book=book)))
+    assert updated.status == 0 and updated.update_book.uuid == book.uuid
+    read, = run_session(handler, get_book(3, book.uuid))
+    assert read.get_book.book.title == 'new title'
+
+    deleted, = run_session(handler, SessionRequest(request_id=4, delete_book=GetBookRequest(uuid=book.uuid)))
+    assert deleted.status == 0 and deleted.delete_book.uuid == book.uuid
+    missing, = run_session(handler, SessionRequest(request_id=5, delete_book=GetBookRequest(uuid=book.uuid)))
+    assert missing.delete_book.err.message == 'Book not found'
@@ -0,0 +1,81 @@
+"""
+Tests for repository.sharded_book_repository against the SQLite stand-in, one in-memory database per shard
+"""
+
+import uuid
+
+from models import Book
+from repository import BookRepository, ShardedBookRepository
+from repository.sharded_book_repository import shard_for_id
+from repository.sqlite_database import connect_sqlite
+
+
+def sharded_repository(shard_count: int, directory: bool = True):
+    shards = [connect_sqlite(':memory:') for _ in range(shard_count)]
+    directory = connect_sqlite(':memory:') if directory else None
+    return ShardedBookRepository(shards, directory), shards, directory
+
+
+def directory_shard(directory, isbn: int) -> int | None:
+    cursor = directory.cursor()
+    cursor.execute('select shard from isbn_directory where isbn_number=%s', (isbn,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def book(i: int) -> Book:
+    return Book(str(uuid.UUID(int=i * 7919)), f'title {i}', 'author', 'description', 9780000000000 + i, False)
+
+
+def test_shard_for_id_is_stable():
+    # pinned values, a new hash or a different byte order would move every stored book
+    ids = [f'0190a8a0-0000-7000-8000-00000000000{i}' for i in range(6)]
+    assert [shard_for_id(id, 4) for id in ids] == [1, 3, 1, 3, 3, 3]
+    assert all(shard_for_id(id, 1) == 0 for id in ids)
+
+
+def test_books_are_stored_on_their_shard():
+    repo, shards, _ = sharded_repository(3)
+    books = [book(i) for i in range(30)]
+    for b in books:
+        repo.create_book(b)
+
+    for index, db in enumerate(shards):
+        stored = {b.id for b in BookRepository(db).list_books(100)}
+        assert stored == {b.id for b in books if shard_for_id(b.id, 3) == index}
+    assert all(repo.get_book_by_id(b.id).title == b.title for b in books)
+
+
+def test_isbn_lookups_follow_the_directory():
+    repo, _, directory = sharded_repository(3)
+    b = book(1)
+    repo.create_book(b)
+
+    assert directory_shard(directory, b.isbn_number) == shard_for_id(b.id, 3)
+    assert repo.get_book_by_isbn(b.isbn_number).id == b.id
+
+    assert repo.delete_book_by_isbn(b.isbn_number)
+    assert directory_shard(directory, b.isbn_number) is None
+    assert repo.get_book_by_isbn(b.isbn_number) is None
+
+
+def test_isbn_lookups_without_a_directory_ask_every_shard():
+    repo, _, _ = sharded_repository(3, directory=False)
+    books = [book(i) for i in range(10)]
+    for b in books:
+        repo.create_book(b)
+
+    assert all(repo.get_book_by_isbn(b.isbn_number).id == b.id for b in books)
+    assert repo.get_book_by_isbn(9790000000000) is None
+
+
+def test_listing_merges_the_shards_in_id_order():
+    repo, _, _ = sharded_repository(4)
+    books = [book(i) for i in range(40)]
+    for b in books:
+        repo.create_book(b)
+    ids = sorted(b.id for b in books)
+
+    assert [b.id for b in repo.list_books(15)] == ids[:15]
+    assert [row[0] for row in repo.scan_book_rows(ids[14], 10)] == ids[15:25]
+    assert repo.count_books() == (40, 0)
@@ -0,0 +1,107 @@
+"""
+Tests for cache.singleflight.SingleFlight
+"""
+
+import threading
+import time
+
+import pytest
+
+from cache import SingleFlight
+
+
+def start_leader(flight: SingleFlight, key, result):
+    """Starts a call for key that blocks until the returned event is set"""
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def fn():
+        started.set()
+        release.wait(5)
+        return result
+
+    thread = threading.Thread(target=lambda: results.append(flight.do(key, fn)))
+    thread.start()
+    assert started.wait(5)
+    return thread, release, results
+
+
+def test_concurrent_calls_share_one_backend_call():
+    flight = SingleFlight(timeout=5)
+    leader, release, results = start_leader(flight, 'book', 'first')
+    calls = []
+
+    def follower():
+        results.append(flight.do('book', lambda: calls.append(1) or 'second'))
+
+    followers = [threading.Thread(target=follower) for _ in range(8)]
+    for thread in followers:
+        thread.start()
+    # followers register as waiters before the leader is let go
+    while flight.stats()['collapsed'] < len(followers):
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == []
+    assert results == ['first'] * 9
+    assert flight.stats() == {'calls': 9, 'executed': 1, 'collapsed': 8, 'timeouts': 0}
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise LookupError('backend down')
+
+    def call():
+        try:
+            flight.do('book', failing)
+        except LookupError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    assert started.wait(5)
+    threads.append(threading.Thread(target=call))
+    threads[1].start()
+    while flight.stats()['collapsed'] < 1:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ['backend down', 'backend down']
+
+
+def test_forget_starts_a_new_flight():
+    flight = SingleFlight(timeout=5)
+    leader, release, results = start_leader(flight, 'book', 'before write')
+    flight.forget('book')
+
+    # a read after the write must not join the flight that started before it
+    assert flight.do('book', lambda: 'after write') == 'after write'
+    release.set()
+    leader.join(5)
+    assert results == ['before write']
+    assert flight.stats()['executed'] == 2
+
+    # the old leader finishing does not remove the newer flight's entry
+    assert flight.do('book', lambda: 'next') == 'next'
+
+
+def test_waiters_time_out():
+    flight = SingleFlight(timeout=0.05)
+    leader, release, results = start_leader(flight, 'book', 'slow')
+    with pytest.raises(TimeoutError):
+        flight.do('book', lambda: 'unused')
+    release.set()
+    leader.join(5)
+
+    assert results == ['slow']
+    assert flight.stats()['timeouts'] == 1
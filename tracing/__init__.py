@@ -0,0 +1,28 @@
+import os
+
+from .tracer import Tracer, Span, TRACEPARENT_METADATA_KEY, get_tracer, set_tracer, traced, current_span, activate, deactivate
+from .exporter import BatchSpanExporter, DEFAULT_TRACE_EXPORT, sink_from_url
+from .db import TracedConnection
+
+__all__ = ['tracer', 'exporter', 'db', 'mongo']
+
+
+def configure_from_env() -> BatchSpanExporter | None:
+    """
+    Installs the global tracer when TRACE_SAMPLE_RATIO is above 0
+
+    Spans go to TRACE_EXPORT, a file path or udp://host:port, defaulting to
+    logs/traces.jsonl. Returns the exporter to start and stop, None when off.
+    """
+    sample_ratio = float(os.getenv('TRACE_SAMPLE_RATIO', '0'))
+    if sample_ratio <= 0:
+        return None
+
+    exporter = BatchSpanExporter(sink_from_url(os.getenv('TRACE_EXPORT', DEFAULT_TRACE_EXPORT)))
+    set_tracer(Tracer(exporter, sample_ratio))
+
+    # pymongo only picks up listeners registered before a client is created
+    from pymongo import monitoring
+    from .mongo import MongoTracingListener
+    monitoring.register(MongoTracingListener())
+    return exporter
@@ -0,0 +1,80 @@
+from .tracer import get_tracer
+
+
+class TracedCursor:
+    """
+    DB-API cursor wrapper recording a span per statement
+
+    Statements returning rows keep their span open until the rows are
+    fetched, so db.rows and the duration include the fetch.
+    """
+
+    def __init__(self, cursor, system: str) -> None:
+        self._cursor = cursor
+        self._system = system
+        self._span = None
+        self._rows = 0
+
+    def execute(self, query: str, params=(), *args, **kwargs):
+        return self._traced(self._cursor.execute, query, params, *args, **kwargs)
+
+    def executemany(self, query: str, params, *args, **kwargs):
+        return self._traced(self._cursor.executemany, query, params, *args, **kwargs)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if self._span is not None:
+            if row is None:
+                self._finish()
+            else:
+                self._rows += 1
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if self._span is not None:
+            self._rows += len(rows)
+            self._finish()
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _traced(self, func, query: str, *args, **kwargs):
+        self._finish()
+        span = get_tracer().start_span(f'{self._system}.query', {'db.system': self._system, 'db.statement': query})
+        if span is None:
+            return func(query, *args, **kwargs)
+        try:
+            result = func(query, *args, **kwargs)
+        except Exception as e:
+            span.set_error(str(e))
+            span.end()
+            raise
+        if getattr(self._cursor, 'description', None):
+            self._span = span
+            self._rows = 0
+        else:
+            span.set_attribute('db.rows', self._cursor.rowcount)
+            span.end()
+        return result
+
+    def _finish(self) -> None:
+        if self._span is not None:
+            self._span.set_attribute('db.rows', self._rows)
+            self._span.end()
+            self._span = None
+
+
+class TracedConnection:
+    """Connection wrapper handing out TracedCursors, everything else is passed through"""
+
+    def __init__(self, db, system: str = 'mysql') -> None:
+        self._db = db
+        self._system = system
+
+    def cursor(self, *args, **kwargs) -> TracedCursor:
+        return TracedCursor(self._db.cursor(*args, **kwargs), self._system)
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
@@ -0,0 +1,117 @@
+import json
+import os
+import queue
+import socket
+import threading
+from urllib.parse import urlparse
+
+
+DEFAULT_TRACE_EXPORT = 'logs/traces.jsonl'
+
+
+class FileSpanSink:
+    """Appends spans as json lines to a local file"""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a')
+
+    def write(self, spans: list[dict]) -> None:
+        self._file.write(''.join(json.dumps(span) + '\n' for span in spans))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class UdpSpanSink:
+    """Sends spans as json line datagrams to a collector, e.g. udp://localhost:4319"""
+
+    MAX_DATAGRAM = 60000
+
+    def __init__(self, host: str, port: int) -> None:
+        self._address = (host, port)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def write(self, spans: list[dict]) -> None:
+        payload = b''
+        for span in spans:
+            line = json.dumps(span).encode() + b'\n'
+            if payload and len(payload) + len(line) > self.MAX_DATAGRAM:
+                self._socket.sendto(payload, self._address)
+                payload = b''
+            payload += line
+        if payload:
+            self._socket.sendto(payload, self._address)
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+def sink_from_url(target: str):
+    """udp://host:port for a collector, anything else is a file path"""
+    parsed = urlparse(target)
+    if parsed.scheme == 'udp':
+        return UdpSpanSink(parsed.hostname, parsed.port)
+    return FileSpanSink(target)
+
+
+class BatchSpanExporter:
+    """
+    Buffers finished spans and writes them in batches from a background thread
+
+    Request threads only enqueue. When the queue is full spans are dropped
+    and counted rather than blocking the call.
+    """
+
+    def __init__(self, sink, max_queue: int = 10000, batch_size: int = 512, flush_interval: float = 1.0) -> None:
+        self._sink = sink
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.exported = 0
+        self.dropped = 0
+
+    def export(self, span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='span-exporter', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Flushes what is queued and closes the sink"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        while not self._queue.empty():
+            self._flush()
+        self._sink.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._flush(self._flush_interval)
+
+    def _flush(self, wait: float = 0.0) -> None:
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=wait) if wait else self._queue.get_nowait())
+            while len(batch) < self._batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return
+        try:
+            self._sink.write([span.to_dict() for span in batch])
+            self.exported += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            print('span export failed', e)
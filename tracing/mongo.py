@@ -0,0 +1,57 @@
+import threading
+
+from pymongo import monitoring
+
+from .tracer import get_tracer
+
+
+MAX_STATEMENT_LENGTH = 1000
+# Command fields describing what was asked for, documents being written are left out
+STATEMENT_FIELDS = ('filter', 'sort', 'limit', 'skip', 'q', 'pipeline')
+
+
+class MongoTracingListener(monitoring.CommandListener):
+    """
+    Turns pymongo command events into spans
+
+    pymongo publishes command events on the thread running the operation, so
+    the span parents under whatever span is current for the repository call.
+    """
+
+    def __init__(self) -> None:
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command = event.command
+        statement = {field: command[field] for field in STATEMENT_FIELDS if field in command}
+        span = get_tracer().start_span(f'mongodb.{event.command_name}', {
+            'db.system': 'mongodb',
+            'db.collection': command.get(event.command_name),
+            'db.statement': str(statement)[:MAX_STATEMENT_LENGTH],
+        })
+        if span is not None:
+            with self._lock:
+                self._spans[(event.connection_id, event.request_id)] = span
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        span = self._pop(event)
+        if span is None:
+            return
+        reply = event.reply
+        if 'cursor' in reply:
+            batch = reply['cursor'].get('firstBatch', reply['cursor'].get('nextBatch', []))
+            span.set_attribute('db.rows', len(batch))
+        elif 'n' in reply:
+            span.set_attribute('db.rows', reply['n'])
+        span.end()
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        span = self._pop(event)
+        if span is not None:
+            span.set_error(str(event.failure))
+            span.end()
+
+    def _pop(self, event):
+        with self._lock:
+            return self._spans.pop((event.connection_id, event.request_id), None)
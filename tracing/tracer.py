@@ -0,0 +1,170 @@
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+
+TRACEPARENT_METADATA_KEY = 'traceparent'
+# version-trace_id-parent_id-flags in lowercase hex, later versions may append fields
+TRACEPARENT_PATTERN = re.compile(r'([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?')
+
+_current_span: ContextVar['Span | None'] = ContextVar('current_span', default=None)
+
+
+class Span:
+    """One timed operation of a trace, ended spans are handed to the tracer's exporter"""
+
+    __slots__ = ('_tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'start', 'end_time', 'attributes', 'status', 'thread')
+
+    def __init__(self, tracer: 'Tracer', name: str, trace_id: str, parent_id: str | None, attributes: dict | None = None):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f'{random.getrandbits(64):016x}'
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.end_time: float | None = None
+        self.attributes = attributes or {}
+        self.status = 'ok'
+        self.thread = threading.current_thread().name
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = 'error'
+        self.attributes['error'] = message
+
+    def end(self) -> None:
+        if self.end_time is None:
+            self.end_time = time.time()
+            self._tracer.export(self)
+
+    def traceparent(self) -> str:
+        """W3C trace context header value for propagating this span to a downstream call"""
+        return f'00-{self.trace_id}-{self.span_id}-01'
+
+    def to_dict(self) -> dict:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': self.start,
+            'duration_ms': ((self.end_time or time.time()) - self.start) * 1000,
+            'status': self.status,
+            'thread': self.thread,
+            'attributes': self.attributes,
+        }
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter
+
+    The sampling decision is made once per trace at the root: an incoming
+    traceparent's sampled flag is honoured, otherwise sample_ratio applies.
+    Inside an unsampled call there is no current span and every
+    instrumentation point returns after a single context variable lookup.
+    """
+
+    def __init__(self, exporter=None, sample_ratio: float = 0.0) -> None:
+        self._exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    def start_root_span(self, name: str, traceparent: str | None = None, attributes: dict | None = None) -> Span | None:
+        if not self.enabled:
+            return None
+        parent = _parse_traceparent(traceparent)
+        if parent:
+            trace_id, parent_id, sampled = parent
+            if not sampled:
+                return None
+            return Span(self, name, trace_id, parent_id, attributes)
+        if random.random() >= self.sample_ratio:
+            return None
+        return Span(self, name, f'{random.getrandbits(128):032x}', None, attributes)
+
+    def start_span(self, name: str, attributes: dict | None = None) -> Span | None:
+        """Child of the current span, None outside a sampled trace. Does not become current"""
+        parent = _current_span.get()
+        if parent is None:
+            return None
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span | None]:
+        """Child span made current for the block"""
+        span = self.start_span(name, attributes)
+        if span is None:
+            yield None
+            return
+        token = activate(span)
+        try:
+            yield span
+        except Exception as e:
+            span.set_error(str(e))
+            raise
+        finally:
+            deactivate(token)
+            span.end()
+
+    def export(self, span: Span) -> None:
+        if self._exporter is not None:
+            self._exporter.export(span)
+
+
+def _parse_traceparent(value: str | None) -> tuple[str, str, bool] | None:
+    # a malformed header is ignored and the call starts a new trace, as W3C trace context asks
+    match = TRACEPARENT_PATTERN.fullmatch(value.strip()) if value else None
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags, rest = match.groups()
+    if version == 'ff' or (version == '00' and rest) or trace_id == '0' * 32 or parent_id == '0' * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def activate(span: Span) -> Token:
+    return _current_span.set(span)
+
+
+def deactivate(token: Token) -> None:
+    _current_span.reset(token)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def traced(name: str) -> Callable:
+    """Decorator running the function in a child span when called inside a sampled trace"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with _tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,6 @@
+from .outbox_worker import OutboxWorker
+from .stats_reconciler import StatsReconciler
+from .isbn_filter_saver import IsbnFilterSaver
+from .membership_expiry import MembershipExpiryWorker
+
+__all__ = ['outbox_worker', 'stats_reconciler', 'isbn_filter_saver', 'membership_expiry']
@@ -0,0 +1,46 @@
+import threading
+
+from cache.isbn_filter import IsbnFilter
+
+
+class IsbnFilterSaver:
+    """
+    Background thread writing the isbn filter to disk for the next startup
+
+    Saves every interval seconds and once more on stop, a restart against an
+    unchanged books table then loads the file instead of scanning the table.
+    The filter is saved with its own checksum, saving never queries MySQL.
+    """
+
+    def __init__(self, isbn_filter: IsbnFilter, path: str, interval: float = 600.0):
+        self._isbn_filter = isbn_filter
+        self._path = path
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.saves = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='isbn-filter-saver', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.save()
+
+    def stats(self) -> dict:
+        return {'saves': self.saves, **self._isbn_filter.stats()}
+
+    def save(self) -> None:
+        try:
+            self._isbn_filter.save(self._path)
+            self.saves += 1
+        except Exception as e:
+            print('isbn filter saver failed to save', e)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.save()
@@ -0,0 +1,51 @@
+import threading
+
+from models.patron import utc_now
+
+
+class MembershipExpiryWorker:
+    """
+    Background thread deactivating patrons whose membership has ended
+
+    Active-only listings filter on the stored active flag, this keeps it
+    true to membership_end_date. Each pass is a few batched update_many
+    calls on the primary, never a per patron check in Python.
+    """
+
+    def __init__(self, patron_repository, interval: float = 3600.0, batch_size: int = 1000) -> None:
+        self._patron_repository = patron_repository
+        self._interval = interval
+        self._batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.runs = 0
+        self.deactivated = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='membership-expiry', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {'runs': self.runs, 'deactivated': self.deactivated}
+
+    def run_once(self) -> int:
+        """Deactivates every membership that ended by now, returns how many patrons changed"""
+        try:
+            deactivated = self._patron_repository.deactivate_expired_patrons(utc_now(), self._batch_size)
+        except Exception as e:
+            print('membership expiry failed', e)
+            deactivated = 0
+        self.deactivated += deactivated
+        self.runs += 1
+        return deactivated
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self._interval)
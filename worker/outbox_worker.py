@@ -0,0 +1,74 @@
+import threading
+
+from repository.outbox_repository import IOutboxRepository
+from repository.patron_repository import IPatronRepository
+
+
+class OutboxWorker:
+    """
+    Background thread applying patron outbox events to mongo in batches
+
+    Events that fail are retried on later polls until max_attempts, after that
+    they stay in the outbox for manual inspection. lag_seconds is the age of the
+    oldest event still waiting to be applied.
+    """
+
+    def __init__(
+        self,
+        outbox_repository: IOutboxRepository,
+        patron_repository: IPatronRepository,
+        batch_size: int = 200,
+        poll_interval: float = 0.5,
+        max_attempts: int = 10
+    ) -> None:
+        self._outbox_repository = outbox_repository
+        self._patron_repository = patron_repository
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.applied = 0
+        self.failed = 0
+        self.lag_seconds = 0.0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='outbox-worker', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops polling, the batch in flight is finished first"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {'applied': self.applied, 'failed': self.failed, 'lag_seconds': self.lag_seconds}
+
+    def run_once(self) -> int:
+        """Applies one batch, returns how many events were applied"""
+        # events stay pending, without spending attempts, until mongo is reachable
+        available = self._patron_repository.available()
+        events = self._outbox_repository.fetch_pending(self._batch_size, self._max_attempts) if available else []
+        if events:
+            failed = set(self._patron_repository.apply_outbox_events(events))
+            applied = [event.id for event in events if event.id not in failed]
+            self._outbox_repository.mark_applied(applied)
+            self._outbox_repository.mark_failed(list(failed))
+            self.applied += len(applied)
+            self.failed += len(failed)
+        else:
+            applied = []
+        self.lag_seconds = self._outbox_repository.oldest_pending_age(self._max_attempts)
+        return len(applied)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                # keep draining while full batches apply cleanly
+                if self.run_once() >= self._batch_size:
+                    continue
+            except Exception as e:
+                print('outbox worker failed to apply batch', e)
+            self._stop.wait(self._poll_interval)
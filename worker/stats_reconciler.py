@@ -0,0 +1,70 @@
+import threading
+
+from repository import IBookRepository
+from stats import LibraryCounters
+
+
+class StatsReconciler:
+    """
+    Background thread recounting books and patrons into LibraryCounters
+
+    The first pass runs as soon as the thread starts, the counters only hold
+    the changes seen since startup before that. A store that fails to count
+    is skipped for that pass and its totals keep running incrementally, as
+    are the books when there is no book repository to count them.
+
+    The repositories must not share their connections with the request
+    threads, the counts commit to end their read snapshots.
+    """
+
+    def __init__(
+        self,
+        counters: LibraryCounters,
+        book_repository: IBookRepository | None,
+        patron_repository=None,
+        interval: float = 300.0
+    ) -> None:
+        self._counters = counters
+        self._book_repository = book_repository
+        self._patron_repository = patron_repository
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.runs = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stats-reconciler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {'runs': self.runs, 'last_drift': self._counters.last_drift}
+
+    def run_once(self) -> dict[str, int]:
+        """Counts both stores and resets the counters, returns the drift that was corrected"""
+        total_books = checked_out_books = by_type = active_patrons = None
+        if self._book_repository is not None:
+            try:
+                total_books, checked_out_books = self._book_repository.count_books()
+            except Exception as e:
+                print('stats reconciler failed to count books', e)
+        if self._patron_repository is not None:
+            try:
+                counts = self._patron_repository.count_patrons()
+                by_type = {name: count for name, (count, _) in counts.items()}
+                active_patrons = sum(active for _, active in counts.values())
+            except Exception as e:
+                print('stats reconciler failed to count patrons', e)
+        drift = self._counters.reconcile(total_books, checked_out_books, by_type, active_patrons)
+        self.runs += 1
+        return drift
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self._interval)